@@ -1,12 +1,34 @@
 import json
+import multiprocessing
 import os
 
 from flask import Flask, request
 
-from vk_bot.config import CONFIRMATION_TOKEN
-from vk_bot.main_handler import MainHandler
+from vk_bot.config import CONFIRMATION_TOKEN, SOLVER_WORKERS, DEDUP_TTL, DEDUP_PERSISTENT
+from vk_bot.database import BotDatabase
+from vk_bot.deduplication import EventDeduplicator
+from vk_bot.jobs import JobQueue
+from vk_bot.vk import VK
 
 app = Flask(__name__)
+job_queue = JobQueue(SOLVER_WORKERS)
+deduplicator = EventDeduplicator(DEDUP_TTL, BotDatabase() if DEDUP_PERSISTENT else None)
+
+
+def startup():
+    """
+    Инициализация ресурсов, общих для всех запросов процесса: пула соединений с базой данных, клиента VK
+    и процессов-обработчиков сообщений.
+    """
+
+    BotDatabase()
+    VK.instance()
+    job_queue.start()
+
+
+if multiprocessing.parent_process() is None:
+    # Процессы-обработчики импортируют этот модуль заново и не должны запускать своих обработчиков
+    startup()
 
 
 @app.route('/', methods=['POST'])
@@ -17,7 +39,8 @@ def processing():
     if data['type'] == 'confirmation':
         return CONFIRMATION_TOKEN
     elif data['type'] == 'message_new':
-        MainHandler(data).process()
+        if not deduplicator.is_duplicate(data):
+            job_queue.submit(data)
     return 'ok'
 
 
@@ -0,0 +1,160 @@
+"""
+Сравнение методов оптимизации на стандартных тестовых функциях. Для каждой задачи и метода считается количество
+вычислений функции, итераций, время решения и ошибка по значению функции относительно известного минимума.
+Для методов одной переменной отдельно строится таблица, в которой метод Брента сравнивается с золотым сечением
+и методом парабол на каждой задаче.
+
+Запуск: python -m solver_core.one_dim_opt.benchmark
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import sympy as sp
+
+from .golden_ratio import GoldenRatio
+from .parabola import Parabola
+from .brandt import Brandt
+from .bfgs import BFGS
+
+x, y = sp.symbols('x y')
+
+# Название, функция, отрезок, значение в глобальном минимуме на отрезке.
+# Задачи p02 - p13 из набора тестовых функций одной переменной (Hansen, Jaumard, Lu)
+PROBLEMS_1D = [
+    ('p02: sin(x) + sin(10x/3)', sp.sin(x) + sp.sin(10 * x / 3), (2.7, 7.5), -1.899599349152113),
+    ('p04: -(16x^2 - 24x + 5)e^-x', -(16 * x ** 2 - 24 * x + 5) * sp.exp(-x), (1.9, 3.9), -3.850450708800220),
+    ('p05: -(1.4 - 3x)sin(18x)', -(sp.Rational(14, 10) - 3 * x) * sp.sin(18 * x), (0, 1.2), -1.489072538689604),
+    ('p06: -(x + sin(x))e^(-x^2)', -(x + sp.sin(x)) * sp.exp(-x ** 2), (-10, 10), -0.824239398475865),
+    ('p07: p02 + ln(x) - 0.84x + 3', sp.sin(x) + sp.sin(10 * x / 3) + sp.log(x) - sp.Rational(84, 100) * x + 3,
+     (2.7, 7.5), -1.601307546494396),
+    ('p13: -x^(2/3) - (1 - x^2)^(1/3)', -x ** sp.Rational(2, 3) - (1 - x ** 2) ** sp.Rational(1, 3),
+     (0.001, 0.99), -1.587401051968199),
+    ('x ln(x)', x * sp.log(x), (0.1, 2), -float(sp.exp(-1))),
+    ('|x - 1|', sp.Abs(x - 1), (0, 3), 0.0),
+    ('(x - 2)^2 + sin(5x)', (x - 2) ** 2 + sp.sin(5 * x), (0, 4), -0.963291302311803),
+    ('x^4 - 3x^2 + x', x ** 4 - 3 * x ** 2 + x, (0, 3), -1.070230181776154),
+    ('e^x - 2x', sp.exp(x) - 2 * x, (-1, 3), 2 - 2 * float(sp.log(2))),
+    ('cos(x)', sp.cos(x), (0, 6), -1.0),
+    ('x^6', x ** 6, (-1, 2), 0.0),
+]
+
+METHODS_1D = {'golden': GoldenRatio, 'parabola': Parabola, 'brent': Brandt}
+
+
+def extended_rosenbrock(v: np.ndarray) -> float:
+    a, b = v[0::2], v[1::2]
+    return float(np.sum(100 * (b - a ** 2) ** 2 + (1 - a) ** 2))
+
+
+def extended_rosenbrock_gradient(v: np.ndarray) -> np.ndarray:
+    a, b = v[0::2], v[1::2]
+    gradient = np.empty_like(v)
+    gradient[0::2] = -400 * a * (b - a ** 2) - 2 * (1 - a)
+    gradient[1::2] = 200 * (b - a ** 2)
+    return gradient
+
+
+def rosenbrock_start(n: int) -> np.ndarray:
+    x0 = np.full(n, -1.2)
+    x0[1::2] = 1
+    return x0
+
+
+# Название, параметры BFGS без method, значение в минимуме
+PROBLEMS_ND = [
+    ('Rosenbrock', {'func': (1 - x) ** 2 + 100 * (y - x ** 2) ** 2, 'x0': (-1.2, 1)}, 0.0),
+    ('Himmelblau', {'func': (x ** 2 + y - 11) ** 2 + (x + y ** 2 - 7) ** 2, 'x0': (0, 0)}, 0.0),
+    ('extended Rosenbrock, n = 1000', {'func': extended_rosenbrock, 'grad': extended_rosenbrock_gradient,
+                                       'x0': rosenbrock_start(1000)}, 0.0),
+]
+
+METHODS_ND = ('bfgs', 'lbfgs')
+
+
+def measure(make_solver, f_min: float, repeat: int) -> dict:
+    """
+    Функция решает задачу repeat раз и возвращает показатели лучшего по времени запуска.
+
+    Parameters
+    ----------
+    make_solver: Callable
+        Функция без аргументов, которая создает решатель.
+    f_min: float
+        Значение в минимуме.
+    repeat: int
+        Количество запусков.
+
+    Returns
+    -------
+    dict
+        Словарь с nfev, nit, time, error и converged.
+    """
+
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = make_solver().solve()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best[0]:
+            best = elapsed, result
+    elapsed, result = best
+    return {'nfev': result.nfev, 'nit': result.nit, 'time': elapsed,
+            'error': abs(float(result.f) - f_min), 'converged': bool(result.converged)}
+
+
+def run_benchmark(tol_1d: float = 1e-8, tol_nd: float = 1e-6, repeat: int = 5) -> pd.DataFrame:
+    """
+    Функция запускает все методы на всех тестовых задачах.
+
+    Parameters
+    ----------
+    tol_1d: float
+        Точность для методов одной переменной.
+    tol_nd: float
+        Точность по градиенту для BFGS.
+    repeat: int
+        Количество запусков каждой задачи, в таблицу попадает самый быстрый.
+
+    Returns
+    -------
+    pd.DataFrame
+        Столбцы problem, method, nfev, nit, time (секунды), error (|f - f_min|) и converged.
+    """
+
+    rows = []
+    for name, func, interval, f_min in PROBLEMS_1D:
+        for method, solver in METHODS_1D.items():
+            row = measure(lambda: solver(func, interval, tol=tol_1d), f_min, repeat)
+            rows.append({'problem': name, 'method': method, **row})
+    for name, params, f_min in PROBLEMS_ND:
+        for method in METHODS_ND:
+            row = measure(lambda: BFGS(**params, method=method, tol=tol_nd), f_min, repeat)
+            rows.append({'problem': name, 'method': method, **row})
+    return pd.DataFrame(rows, columns=['problem', 'method', 'nfev', 'nit', 'time', 'error', 'converged'])
+
+
+def compare_1d(benchmark: pd.DataFrame) -> pd.DataFrame:
+    """
+    Функция строит из таблицы run_benchmark сравнение методов одной переменной: по строке на задачу, количество
+    вычислений функции и ошибка для каждого метода из METHODS_1D.
+
+    Returns
+    -------
+    pd.DataFrame
+        Столбцы nfev и error с вложенными столбцами golden, parabola и brent.
+    """
+
+    problems = [name for name, *_ in PROBLEMS_1D]
+    one_dim = benchmark[benchmark['method'].isin(list(METHODS_1D))]
+    return pd.concat({column: one_dim.pivot(index='problem', columns='method', values=column)
+                     .reindex(index=problems, columns=list(METHODS_1D)) for column in ('nfev', 'error')}, axis=1)
+
+
+if __name__ == '__main__':
+    pd.set_option('display.width', 200)
+    results = run_benchmark()
+    print(compare_1d(results).to_string())
+    print()
+    print(results.to_string(index=False))
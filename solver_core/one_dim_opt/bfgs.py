@@ -1,3 +1,322 @@
-class BFGS:
-    def __init__(self):
-        pass
+from typing import Callable, Optional
+
+import numpy as np
+import sympy as sp
+
+from ..search_for_extremes.compiled_functions import compile_function, compile_gradient
+from .optimizer import Optimizer
+
+DENSE_LIMIT = 200
+FD_STEP = 1e-7
+
+
+class BFGS(Optimizer):
+    """
+    Поиск локального минимума функции многих переменных квазиньютоновским методом BFGS.
+
+    Вместо матрицы вторых производных метод накапливает приближение к обратной к ней матрице по разностям точек
+    s = x_{k+1} - x_k и градиентов y = g_{k+1} - g_k. Шаг вдоль направления -H g выбирается линейным поиском,
+    который проверяет сильные условия Вольфе, поэтому s^T y > 0 и приближение остается положительно определенным.
+
+    Есть два варианта метода:
+    'bfgs' хранит плотную матрицу n × n;
+    'lbfgs' хранит только последние memory пар (s, y) в кольцевом буфере и умножает на приближение
+    двухцикловой рекурсией, поэтому память и время итерации O(memory · n).
+
+    Parameters
+    ----------
+    func: sympy выражение или Callable
+        Функция. Для выражения градиент находится символьно и компилируется через общий кэш скомпилированных
+        функций. Функция Python должна принимать массив numpy длины n.
+    x0: array-like
+        Начальная точка.
+    vars: Optional[list]
+        Переменные из sympy.symbols в порядке координат x0. По умолчанию переменные выражения по алфавиту.
+    grad: Optional[Callable]
+        Градиент для функции Python: принимает массив и возвращает массив длины n. Если не передан,
+        то градиент считается центральными разностями.
+    method: 'auto', 'bfgs' or 'lbfgs'
+        Вариант метода. 'auto' - 'bfgs' для не более DENSE_LIMIT переменных, иначе 'lbfgs'.
+    memory: int
+        Количество пар (s, y) для 'lbfgs'.
+    tol: float
+        Точность: метод останавливается, когда наибольшая по модулю компонента градиента не больше tol.
+    max_iter: int
+        Максимальное количество итераций.
+    callback: Optional[Callable]
+        Функция callback(nit, x, f), которая вызывается после каждой итерации (см. Optimizer).
+    """
+
+    def __init__(self, func, x0, vars=None, grad=None, method='auto', memory=10, tol=1e-6, max_iter=1000,
+                 callback=None):
+        super().__init__(callback)
+        self.x0 = np.array(x0, dtype=np.float64).ravel()
+        if isinstance(func, sp.Expr):
+            if vars is None:
+                vars = sorted(func.free_symbols, key=str)
+            if len(vars) != len(self.x0):
+                raise ValueError('Количество координат начальной точки не равно количеству переменных')
+            self.func, self.grad = prepare_sympy(func, tuple(vars))
+        else:
+            self.func = func
+            self.grad = grad if grad is not None else lambda x: finite_difference(self.counted_func, x)
+        if method == 'auto':
+            method = 'bfgs' if len(self.x0) <= DENSE_LIMIT else 'lbfgs'
+        self.method = method
+        self.memory = memory
+        self.tol = tol
+        self.max_iter = max_iter
+
+    def run(self) -> tuple:
+        """
+        Метод находит локальный минимум.
+
+        Returns
+        -------
+        tuple
+            Точка минимума и значение функции в ней. В self.nfev учитываются и вычисления функции для разностного
+            градиента. Количество вычислений градиента сохраняется в self.ngev,
+            а причина остановки - в self.status: 'tol', 'max_iter', 'line_search' (не удалось найти шаг)
+            или 'callback'.
+        """
+
+        self.nfev = self.ngev = 0
+        x = self.x0.copy()
+        fx, gx = self.evaluate(x)
+        if self.method == 'bfgs':
+            direction_finder = DenseInverseHessian(len(x))
+        else:
+            direction_finder = RingBufferInverseHessian(len(x), self.memory)
+
+        self.status = 'max_iter'
+        self.nit = 0
+        while self.nit < self.max_iter:
+            if np.max(np.abs(gx)) <= self.tol:
+                self.status = 'tol'
+                break
+            direction = direction_finder.direction(gx)
+            if not gx @ direction < 0:
+                # Приближение потеряло положительную определенность: начинаем заново с антиградиента
+                direction_finder.reset()
+                direction = -gx
+            step = wolfe_line_search(lambda alpha: self.evaluate_along(x, direction, alpha), fx, gx @ direction)
+            if step is None and direction_finder.updated:
+                direction_finder.reset()
+                direction = -gx
+                step = wolfe_line_search(lambda alpha: self.evaluate_along(x, direction, alpha), fx, gx @ direction)
+            if step is None:
+                self.status = 'line_search'
+                break
+
+            alpha, f_new, g_new = step
+            s = alpha * direction
+            direction_finder.update(s, g_new - gx)
+            x = x + s
+            fx, gx = f_new, g_new
+            self.nit += 1
+            if self.notify(x, fx):
+                self.status = 'callback'
+                break
+
+        self.converged = self.status == 'tol'
+        return x, fx
+
+    def evaluate(self, x: np.ndarray) -> tuple:
+        """
+        Метод вычисляет значение функции и градиент в точке x.
+        """
+
+        self.nfev += 1
+        self.ngev += 1
+        with np.errstate(all='ignore'):
+            return float(self.func(x)), np.asarray(self.grad(x), dtype=np.float64)
+
+    def counted_func(self, x: np.ndarray) -> float:
+        """
+        Функция для разностного градиента: каждое ее вычисление учитывается в self.nfev.
+        """
+
+        self.nfev += 1
+        return self.func(x)
+
+    def evaluate_along(self, x: np.ndarray, direction: np.ndarray, alpha: float) -> tuple:
+        """
+        Метод вычисляет функцию, производную по направлению и градиент в точке x + alpha · direction.
+        """
+
+        f, g = self.evaluate(x + alpha * direction)
+        return f, g @ direction, g
+
+
+class DenseInverseHessian:
+    """
+    Плотное приближение к обратной матрице вторых производных для BFGS.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.reset()
+
+    def reset(self):
+        self.matrix = np.eye(self.n)
+        self.updated = False
+
+    def direction(self, gradient: np.ndarray) -> np.ndarray:
+        return -self.matrix @ gradient
+
+    def update(self, s: np.ndarray, y: np.ndarray):
+        """
+        Обновление H = (I - ρ s y^T) H (I - ρ y s^T) + ρ s s^T, где ρ = 1 / (s^T y), без умножения матриц.
+        Пары с s^T y, численно равным нулю, пропускаются.
+        """
+
+        sy = s @ y
+        if sy <= 1e-10 * np.linalg.norm(s) * np.linalg.norm(y):
+            return
+        if not self.updated:
+            # Перед первым обновлением единичная матрица масштабируется под кривизну функции
+            self.matrix *= sy / (y @ y)
+            self.updated = True
+        rho = 1 / sy
+        hy = self.matrix @ y
+        self.matrix += (rho ** 2 * (y @ hy) + rho) * np.outer(s, s) - rho * (np.outer(hy, s) + np.outer(s, hy))
+
+
+class RingBufferInverseHessian:
+    """
+    Приближение к обратной матрице вторых производных для L-BFGS: последние memory пар (s, y) в кольцевом буфере.
+    """
+
+    def __init__(self, n: int, memory: int):
+        self.s = np.zeros((memory, n))
+        self.y = np.zeros((memory, n))
+        self.rho = np.zeros(memory)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.updated = False
+
+    def direction(self, gradient: np.ndarray) -> np.ndarray:
+        """
+        Двухцикловая рекурсия: q = g, проход от новых пар к старым, масштабирование, проход обратно.
+        """
+
+        memory = len(self.rho)
+        order = [(self.count - 1 - i) % memory for i in range(min(self.count, memory))]
+        q = gradient.copy()
+        alphas = {}
+        for i in order:
+            alphas[i] = self.rho[i] * (self.s[i] @ q)
+            q -= alphas[i] * self.y[i]
+        if order:
+            newest = order[0]
+            q *= (self.s[newest] @ self.y[newest]) / (self.y[newest] @ self.y[newest])
+        for i in reversed(order):
+            beta = self.rho[i] * (self.y[i] @ q)
+            q += (alphas[i] - beta) * self.s[i]
+        return -q
+
+    def update(self, s: np.ndarray, y: np.ndarray):
+        sy = s @ y
+        if sy <= 1e-10 * np.linalg.norm(s) * np.linalg.norm(y):
+            return
+        i = self.count % len(self.rho)
+        self.s[i], self.y[i], self.rho[i] = s, y, 1 / sy
+        self.count += 1
+        self.updated = True
+
+
+def wolfe_line_search(phi: Callable, f0: float, d0: float, c1: float = 1e-4, c2: float = 0.9,
+                      max_steps: int = 30) -> Optional[tuple]:
+    """
+    Функция находит шаг alpha, удовлетворяющий сильным условиям Вольфе:
+    phi(alpha) <= phi(0) + c1 · alpha · phi'(0) и |phi'(alpha)| <= c2 · |phi'(0)|.
+
+    Шаг сначала удваивается, начиная с 1, пока не найдется отрезок, содержащий подходящий шаг, затем
+    отрезок сужается квадратичной интерполяцией (алгоритмы 3.5 и 3.6 из Nocedal, Wright, "Numerical Optimization").
+
+    Parameters
+    ----------
+    phi: Callable
+        Функция от шага, которая возвращает значение, производную по шагу и градиент.
+    f0: float
+        Значение при нулевом шаге.
+    d0: float
+        Производная по шагу при нулевом шаге, должна быть отрицательной.
+    c1: float
+        Параметр условия достаточного убывания.
+    c2: float
+        Параметр условия на кривизну.
+    max_steps: int
+        Максимальное количество вычислений на каждом из двух этапов.
+
+    Returns
+    -------
+    Optional[tuple]
+        Шаг, значение и градиент в новой точке или None, если шаг не найден.
+    """
+
+    def zoom(lo, hi, f_lo, d_lo, g_lo, f_hi):
+        for _ in range(max_steps):
+            width = hi - lo
+            denominator = 2 * (f_hi - f_lo - d_lo * width)
+            alpha = lo - d_lo * width ** 2 / denominator if denominator > 0 else lo + width / 2
+            # Новый шаг не должен быть слишком близко к концам отрезка
+            low, high = sorted((lo + 0.1 * width, hi - 0.1 * width))
+            if not low <= alpha <= high:
+                alpha = lo + width / 2
+            f, d, g = phi(alpha)
+            if not np.isfinite(f) or f > f0 + c1 * alpha * d0 or f >= f_lo:
+                hi, f_hi = alpha, f
+            else:
+                if abs(d) <= -c2 * d0:
+                    return alpha, f, g
+                if d * (hi - lo) >= 0:
+                    hi, f_hi = lo, f_lo
+                lo, f_lo, d_lo, g_lo = alpha, f, d, g
+        # Условие на кривизну не выполнено, но шаг lo дает достаточное убывание
+        return (lo, f_lo, g_lo) if lo > 0 else None
+
+    prev_alpha, prev_f, prev_d, prev_g = 0.0, f0, d0, None
+    alpha = 1.0
+    for i in range(max_steps):
+        f, d, g = phi(alpha)
+        if not np.isfinite(f) or f > f0 + c1 * alpha * d0 or (i > 0 and f >= prev_f):
+            return zoom(prev_alpha, alpha, prev_f, prev_d, prev_g, f)
+        if abs(d) <= -c2 * d0:
+            return alpha, f, g
+        if d >= 0:
+            return zoom(alpha, prev_alpha, f, d, g, prev_f)
+        prev_alpha, prev_f, prev_d, prev_g = alpha, f, d, g
+        alpha *= 2
+    return None
+
+
+def prepare_sympy(func, variables: tuple) -> tuple:
+    """
+    Функция компилирует выражение и его градиент в функции от массива numpy длины n.
+
+    Returns
+    -------
+    tuple
+        Функция и градиент.
+    """
+
+    f = compile_function(func, variables)
+    gradient = compile_gradient(func, variables)
+    return lambda x: f(*x), lambda x: gradient(*x)
+
+
+def finite_difference(func: Callable, x: np.ndarray) -> np.ndarray:
+    """
+    Функция считает градиент центральными разностями.
+    """
+
+    step = FD_STEP * np.maximum(1, np.abs(x))
+    gradient = np.empty_like(x)
+    for i in range(len(x)):
+        shift = np.zeros_like(x)
+        shift[i] = step[i]
+        gradient[i] = (func(x + shift) - func(x - shift)) / (2 * step[i])
+    return gradient
@@ -1,3 +1,138 @@
-class Brandt:
-    def __init__(self):
-        pass
\ No newline at end of file
+import math
+import time
+
+import numpy as np
+
+from .golden_ratio import PHI
+from .handlers.preprocessing import prepare_func, prepare_interval
+from .optimizer import Optimizer
+
+SQRT_EPS = math.sqrt(np.finfo(float).eps)
+TRACE_COLUMNS = ('x', 'f', 'a', 'b', 'step')
+INIT_STEP, GOLDEN_STEP, PARABOLIC_STEP = 0, 1, 2
+
+
+class Brandt(Optimizer):
+    """
+    Поиск минимума функции одной переменной на отрезке методом Брента.
+
+    Метод хранит три лучшие точки x, w, v и пытается сделать шаг в вершину параболы через них. Шаг принимается,
+    только если вершина лежит внутри текущего отрезка и шаг меньше половины позапрошлого, иначе делается шаг
+    золотого сечения. Поэтому метод сходится не медленнее золотого сечения, а для гладких функций около минимума
+    сходится сверхлинейно, как метод парабол.
+
+    Parameters
+    ----------
+    func: sympy выражение или Callable
+        Функция одной переменной.
+    interval_x: array-like
+        Отрезок [a, b].
+    tol: float
+        Абсолютная точность по x.
+    max_fev: int
+        Максимальное количество вычислений функции.
+    time_budget: Optional[float]
+        Ограничение по времени в секундах. None - без ограничения.
+    callback: Optional[Callable]
+        Функция callback(nit, x, f), которая вызывается после каждой итерации (см. Optimizer).
+    """
+
+    def __init__(self, func, interval_x, tol=1e-5, max_fev=500, time_budget=None, callback=None):
+        super().__init__(callback)
+        self.func = prepare_func(func)
+        self.interval_x = prepare_interval(interval_x)
+        if self.interval_x.ndim != 1:
+            raise ValueError('Метод Брента решает задачу для одного отрезка')
+        self.tol = tol
+        self.max_fev = max_fev
+        self.time_budget = time_budget
+
+    def run(self) -> tuple:
+        """
+        Метод находит минимум.
+
+        Returns
+        -------
+        tuple
+            Точка минимума и значение функции в ней. Причина остановки сохраняется в self.status: 'tol'
+            (достигнута точность), 'max_fev', 'time_budget' или 'callback'. История вычислений - в self.trace:
+            массив nfev × 5 со столбцами TRACE_COLUMNS: точка, значение, текущий отрезок [a, b] и вид шага
+            (INIT_STEP, GOLDEN_STEP или PARABOLIC_STEP).
+        """
+
+        started = time.perf_counter()
+        f = self.func
+        a, b = float(self.interval_x[0]), float(self.interval_x[1])
+        trace = np.empty((self.max_fev, len(TRACE_COLUMNS)))
+
+        x = w = v = a + (1 - PHI) * (b - a)
+        fx = fw = fv = float(f(x))
+        trace[0] = x, fx, a, b, INIT_STEP
+        nfev = 1
+        self.nit = 0
+        d = e = 0.0
+
+        while True:
+            middle = (a + b) / 2
+            tol1 = SQRT_EPS * abs(x) + self.tol / 3
+            tol2 = 2 * tol1
+            if abs(x - middle) <= tol2 - (b - a) / 2:
+                self.status = 'tol'
+                break
+            if nfev >= self.max_fev:
+                self.status = 'max_fev'
+                break
+            if self.time_budget is not None and time.perf_counter() - started > self.time_budget:
+                self.status = 'time_budget'
+                break
+
+            step = GOLDEN_STEP
+            if abs(e) > tol1:
+                # Вершина параболы через x, w, v: u = x + p / q
+                r = (x - w) * (fx - fv)
+                q = (x - v) * (fx - fw)
+                p = (x - v) * q - (x - w) * r
+                q = 2 * (q - r)
+                if q > 0:
+                    p = -p
+                q = abs(q)
+                previous_e, e = e, d
+                if abs(p) < abs(q * previous_e / 2) and q * (a - x) < p < q * (b - x):
+                    d = p / q
+                    step = PARABOLIC_STEP
+                    # Функция не вычисляется слишком близко к концам отрезка
+                    if x + d - a < tol2 or b - x - d < tol2:
+                        d = tol1 if x < middle else -tol1
+            if step == GOLDEN_STEP:
+                e = (b - x) if x < middle else (a - x)
+                d = (1 - PHI) * e
+
+            u = x + d if abs(d) >= tol1 else x + math.copysign(tol1, d)
+            fu = float(f(u))
+            nfev += 1
+            self.nit += 1
+
+            if fu <= fx:
+                if u < x:
+                    b = x
+                else:
+                    a = x
+                v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+            else:
+                if u < x:
+                    a = u
+                else:
+                    b = u
+                if fu <= fw or w == x:
+                    v, fv, w, fw = w, fw, u, fu
+                elif fu <= fv or v == x or v == w:
+                    v, fv = u, fu
+            trace[nfev - 1] = u, fu, a, b, step
+            if self.callback is not None and self.notify(x, fx):
+                self.status = 'callback'
+                break
+
+        self.nfev = nfev
+        self.converged = self.status == 'tol'
+        self.trace = trace[:nfev]
+        return x, fx
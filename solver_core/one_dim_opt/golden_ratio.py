@@ -1,3 +1,147 @@
-class GoldenRatio:
-    def __init__(self):
-        pass
+import math
+
+import numpy as np
+
+from .handlers.preprocessing import prepare_func, prepare_interval
+from .optimizer import Optimizer
+
+PHI = (math.sqrt(5) - 1) / 2
+
+
+class GoldenRatio(Optimizer):
+    """
+    Поиск минимума функции одной переменной на отрезке методом золотого сечения.
+
+    На каждой итерации отрезок сокращается в 1 / PHI раз, а одна из двух внутренних точек переходит в следующую
+    итерацию вместе со значением функции, поэтому функция вычисляется один раз за итерацию.
+
+    Если передан один отрезок, то вычисления ведутся обычными числами. Если передан массив отрезков, то все задачи
+    решаются одновременно массивами numpy: на каждой итерации функция вызывается один раз от массива точек тех
+    задач, которые еще не сошлись. В этом случае функция должна принимать массивы.
+
+    Parameters
+    ----------
+    func: sympy выражение или Callable
+        Функция одной переменной.
+    interval_x: array-like
+        Отрезок [a, b] или массив k × 2 с отрезками для k задач.
+    tol: float
+        Точность: задача считается решенной, когда длина отрезка не больше tol.
+    max_iter: int
+        Максимальное количество итераций.
+    callback: Optional[Callable]
+        Функция callback(nit, x, f), которая вызывается после каждой итерации (см. Optimizer).
+    """
+
+    def __init__(self, func, interval_x, tol=1e-5, max_iter=500, callback=None):
+        super().__init__(callback)
+        self.func = prepare_func(func)
+        self.interval_x = prepare_interval(interval_x)
+        self.tol = tol
+        self.max_iter = max_iter
+
+    def run(self) -> tuple:
+        """
+        Метод находит минимум.
+
+        Returns
+        -------
+        tuple
+            Точка минимума и значение функции в ней: числа для одного отрезка или массивы для нескольких.
+            Для нескольких отрезков nit, nfev и converged в результате тоже массивы.
+        """
+
+        if self.interval_x.ndim == 1:
+            return self.solve_scalar()
+        return self.solve_batch()
+
+    def solve_scalar(self) -> tuple:
+        """
+        Метод решает задачу для одного отрезка обычными числами.
+
+        Returns
+        -------
+        tuple
+            Точка минимума и значение функции в ней.
+        """
+
+        f = self.func
+        a, b = float(self.interval_x[0]), float(self.interval_x[1])
+        c = b - PHI * (b - a)
+        d = a + PHI * (b - a)
+        fc = float(f(c))
+        fd = float(f(d))
+
+        self.nit = 0
+        while b - a > self.tol and self.nit < self.max_iter:
+            if fc < fd:
+                b, d, fd = d, c, fc
+                c = b - PHI * (b - a)
+                fc = float(f(c))
+            else:
+                a, c, fc = c, d, fd
+                d = a + PHI * (b - a)
+                fd = float(f(d))
+            self.nit += 1
+            if self.callback is not None and self.notify(*((c, fc) if fc < fd else (d, fd))):
+                break
+
+        self.nfev = self.nit + 2
+        self.converged = b - a <= self.tol
+        return (c, fc) if fc < fd else (d, fd)
+
+    def solve_batch(self) -> tuple:
+        """
+        Метод решает задачи для всех отрезков одновременно. Задачи, которые уже сошлись, исключаются
+        из вычислений с помощью маски.
+
+        Returns
+        -------
+        tuple
+            Массивы точек минимума и значений функции в них.
+        """
+
+        a = self.interval_x[:, 0].copy()
+        b = self.interval_x[:, 1].copy()
+        c = b - PHI * (b - a)
+        d = a + PHI * (b - a)
+        fc = self.evaluate(c)
+        fd = self.evaluate(d)
+
+        self.nit = np.zeros(len(a), dtype=int)
+        active = b - a > self.tol
+        for _ in range(self.max_iter):
+            if not active.any():
+                break
+            left = active & (fc < fd)
+            right = active & ~(fc < fd)
+
+            # Минимум левее d: отрезок [a, d], старая точка c становится правой внутренней точкой
+            b[left], d[left], fd[left] = d[left], c[left], fc[left]
+            c[left] = b[left] - PHI * (b[left] - a[left])
+            # Минимум правее c: отрезок [c, b], старая точка d становится левой внутренней точкой
+            a[right], c[right], fc[right] = c[right], d[right], fd[right]
+            d[right] = a[right] + PHI * (b[right] - a[right])
+
+            new_x = np.where(left, c, d)[active]
+            new_f = self.evaluate(new_x)
+            fc[left] = new_f[left[active]]
+            fd[right] = new_f[right[active]]
+
+            self.nit[active] += 1
+            active &= b - a > self.tol
+            if self.callback is not None and self.notify(np.where(fc < fd, c, d), np.minimum(fc, fd)):
+                break
+
+        self.nfev = self.nit + 2
+        self.converged = b - a <= self.tol
+        best = fc < fd
+        return np.where(best, c, d), np.where(best, fc, fd)
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """
+        Метод вычисляет функцию от массива точек. Постоянные значения растягиваются до формы x.
+        """
+
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(np.asarray(self.func(x), dtype=np.float64), x.shape).copy()
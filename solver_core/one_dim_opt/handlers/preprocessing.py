@@ -0,0 +1,58 @@
+from typing import Callable
+
+import numpy as np
+import sympy as sp
+
+from ...search_for_extremes.compiled_functions import compile_function
+
+
+def prepare_func(func) -> Callable:
+    """
+    Функция приводит функцию одной переменной к виду, который можно вызывать от чисел и массивов numpy.
+
+    Parameters
+    ----------
+    func: sympy выражение или Callable
+        Функция одной переменной. Выражение sympy компилируется через общий кэш скомпилированных функций,
+        функция Python возвращается без изменений.
+
+    Returns
+    -------
+    Callable
+        Функция от одной переменной.
+    """
+
+    if not isinstance(func, sp.Expr):
+        return func
+
+    variables = tuple(sorted(func.free_symbols, key=str))
+    if len(variables) > 1:
+        raise ValueError('Функция должна зависеть от одной переменной')
+    if not variables:
+        # Постоянная функция: lambdify вернет число, а не массив нужной формы
+        value = float(func)
+        return lambda x: value + np.zeros_like(x, dtype=np.float64) if isinstance(x, np.ndarray) else value
+    return compile_function(func, variables)
+
+
+def prepare_interval(interval) -> np.ndarray:
+    """
+    Функция проверяет интервал или набор интервалов и упорядочивает их концы.
+
+    Parameters
+    ----------
+    interval: array-like
+        Интервал [a, b] или массив k × 2 с интервалами.
+
+    Returns
+    -------
+    np.ndarray
+        Массив той же формы, в котором левый конец каждого интервала не больше правого.
+    """
+
+    interval = np.asarray(interval, dtype=np.float64)
+    if interval.shape[-1:] != (2,) or interval.ndim > 2:
+        raise ValueError('Интервал должен состоять из двух чисел')
+    if not np.isfinite(interval).all():
+        raise ValueError('Границы интервала должны быть конечными')
+    return np.sort(interval, axis=-1)
@@ -0,0 +1,98 @@
+"""
+Общий интерфейс методов оптимизации: каждый метод наследуется от Optimizer, реализует run и возвращает из solve
+OptimizerResult. На каждой итерации метод вызывает notify, который передает текущую лучшую точку в callback.
+"""
+
+import time
+from typing import Callable, Optional
+
+
+class OptimizerResult:
+    """
+    Результат оптимизации.
+
+    Parameters
+    ----------
+    x: float or np.ndarray
+        Найденная точка минимума (для GoldenRatio с несколькими отрезками - массив точек).
+    f: float or np.ndarray
+        Значение функции в ней.
+    nit: int or np.ndarray
+        Количество итераций.
+    nfev: int or np.ndarray
+        Количество вычислений функции.
+    converged: bool or np.ndarray
+        Достигнута ли заданная точность.
+    timing: float
+        Время решения в секундах.
+    """
+
+    __slots__ = ('x', 'f', 'nit', 'nfev', 'converged', 'timing')
+
+    def __init__(self, x, f, nit, nfev, converged, timing):
+        self.x = x
+        self.f = f
+        self.nit = nit
+        self.nfev = nfev
+        self.converged = converged
+        self.timing = timing
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'OptimizerResult({fields})'
+
+
+class Optimizer:
+    """
+    Базовый класс методов оптимизации.
+
+    Parameters
+    ----------
+    callback: Optional[Callable]
+        Функция callback(nit, x, f), которая вызывается после каждой итерации с номером итерации и текущей
+        лучшей точкой. Если она возвращает True, то метод останавливается (converged будет False).
+    """
+
+    def __init__(self, callback: Optional[Callable] = None):
+        self.callback = callback
+
+    def solve(self) -> OptimizerResult:
+        """
+        Метод находит минимум.
+
+        Returns
+        -------
+        OptimizerResult
+            Результат оптимизации.
+        """
+
+        started = time.perf_counter()
+        self.stopped = False
+        x, f = self.run()
+        converged = self.converged
+        if self.stopped:
+            # & работает и для признака, и для массива признаков GoldenRatio
+            converged = converged & False
+        return OptimizerResult(x, f, self.nit, self.nfev, converged, time.perf_counter() - started)
+
+    def run(self) -> tuple:
+        """
+        Метод, который реализует сам алгоритм. Должен вернуть точку минимума и значение функции в ней
+        и сохранить self.nit, self.nfev и self.converged.
+        """
+
+        raise NotImplementedError
+
+    def notify(self, x, f) -> bool:
+        """
+        Метод передает текущую лучшую точку в callback.
+
+        Returns
+        -------
+        bool
+            True, если callback попросил остановиться.
+        """
+
+        if self.callback is not None and self.callback(self.nit, x, f):
+            self.stopped = True
+        return self.stopped
@@ -1,3 +1,135 @@
-class Parabola:
-    def __init__(self):
-        pass
+import time
+
+from .golden_ratio import PHI
+from .handlers.preprocessing import prepare_func, prepare_interval
+from .optimizer import Optimizer
+
+
+class Parabola(Optimizer):
+    """
+    Поиск минимума функции одной переменной на отрезке методом последовательной параболической интерполяции.
+
+    Метод хранит три точки x1 < x2 < x3, где x2 - лучшая из найденных точек. На каждой итерации через них
+    проводится парабола, и ее вершина становится новой точкой, после чего одна из крайних точек отбрасывается.
+    Для гладких функций около минимума метод сходится сверхлинейно. Если вершина не попадает внутрь отрезка
+    (три точки лежат на одной прямой или парабола направлена ветвями вниз), то делается шаг золотого сечения
+    в большую из двух частей отрезка.
+    Если вершина почти совпала с лучшей точкой, то вместо нее проверяется точка на расстоянии tol, чтобы метод
+    не застревал, приближаясь к минимуму с одной стороны.
+
+    Значения функции запоминаются по точкам, поэтому повторное обращение к уже посчитанной точке (в том числе
+    при повторном вызове solve) не вычисляет функцию заново.
+
+    Parameters
+    ----------
+    func: sympy выражение или Callable
+        Функция одной переменной.
+    interval_x: array-like
+        Отрезок [a, b].
+    tol: float
+        Точность: метод останавливается, когда вершина параболы отличается от лучшей точки меньше чем на tol,
+        а точка на расстоянии tol от лучшей не лучше нее, или когда длина отрезка становится меньше tol.
+    max_iter: int
+        Максимальное количество итераций.
+    callback: Optional[Callable]
+        Функция callback(nit, x, f), которая вызывается после каждой итерации (см. Optimizer).
+    """
+
+    def __init__(self, func, interval_x, tol=1e-5, max_iter=500, callback=None):
+        super().__init__(callback)
+        self.func = prepare_func(func)
+        self.interval_x = prepare_interval(interval_x)
+        if self.interval_x.ndim != 1:
+            raise ValueError('Метод парабол решает задачу для одного отрезка')
+        self.tol = tol
+        self.max_iter = max_iter
+        self.cache = {}
+        self.nfev = 0
+        self.ncalls = 0
+
+    def run(self) -> tuple:
+        """
+        Метод находит минимум.
+
+        Returns
+        -------
+        tuple
+            Точка минимума и значение функции в ней. Время каждой итерации в секундах сохраняется
+            в self.iter_times. Количество вычислений функции (nfev) и обращений к ней (self.ncalls) считается
+            за все вызовы solve.
+        """
+
+        x1, x3 = float(self.interval_x[0]), float(self.interval_x[1])
+        x2 = x3 - PHI * (x3 - x1)
+        f1, f2, f3 = self.evaluate(x1), self.evaluate(x2), self.evaluate(x3)
+        self.iter_times = []
+        self.nit = 0
+        self.converged = False
+
+        while self.nit < self.max_iter:
+            started = time.perf_counter()
+            u = self.vertex(x1, x2, x3, f1, f2, f3)
+            if u is None:
+                # Шаг золотого сечения в большую часть отрезка
+                u = x2 + (1 - PHI) * (x3 - x2) if x3 - x2 > x2 - x1 else x2 - (1 - PHI) * (x2 - x1)
+            nudge = abs(u - x2) < self.tol
+            if nudge:
+                # Вершина почти совпала с лучшей точкой. Вершины могут долго подходить к минимуму с одной стороны,
+                # поэтому проверяется точка на расстоянии tol в сторону большей части отрезка
+                u = x2 + self.tol if x3 - x2 > x2 - x1 else x2 - self.tol
+            fu = self.evaluate(u)
+
+            if fu <= f2:
+                if u < x2:
+                    x3, f3 = x2, f2
+                else:
+                    x1, f1 = x2, f2
+                x2, f2 = u, fu
+            elif u < x2:
+                x1, f1 = u, fu
+            else:
+                x3, f3 = u, fu
+
+            self.nit += 1
+            self.iter_times.append(time.perf_counter() - started)
+            if nudge and fu > f2 or x3 - x1 < self.tol:
+                self.converged = True
+                break
+            if self.callback is not None and self.notify(x2, f2):
+                break
+
+        # Минимум может оказаться на границе отрезка
+        return min((x1, f1), (x2, f2), (x3, f3), key=lambda point: point[1])
+
+    @staticmethod
+    def vertex(x1, x2, x3, f1, f2, f3):
+        """
+        Метод находит вершину параболы, проходящей через три точки.
+
+        Returns
+        -------
+        Optional[float]
+            Абсцисса вершины или None, если парабола вырождена, направлена ветвями вниз или вершина
+            не лежит строго внутри (x1, x3).
+        """
+
+        p = (x2 - x1) ** 2 * (f2 - f3) - (x2 - x3) ** 2 * (f2 - f1)
+        q = (x2 - x1) * (f2 - f3) - (x2 - x3) * (f2 - f1)
+        # q < 0 соответствует параболе с ветвями вверх при x1 < x2 < x3
+        if q >= 0:
+            return None
+        u = x2 - p / (2 * q)
+        if not x1 < u < x3:
+            return None
+        return u
+
+    def evaluate(self, x: float) -> float:
+        """
+        Метод вычисляет функцию в точке x или берет уже посчитанное значение.
+        """
+
+        self.ncalls += 1
+        if x not in self.cache:
+            self.cache[x] = float(self.func(x))
+            self.nfev += 1
+        return self.cache[x]
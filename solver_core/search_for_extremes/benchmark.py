@@ -0,0 +1,189 @@
+"""
+Замеры времени решателей экстремумов функции двух переменных.
+
+Сбор точек: старый способ, при котором каждая точка добавлялась в DataFrame отдельным DataFrame.append, сравнивается
+с буферами, из которых в конце строится один DataFrame, как теперь делает LocalExtr. Отдельно замеряются
+critical_points и border_points LocalExtr на задачах с большим количеством критических точек.
+
+Задачи с ограничением: время ответа на запрос так, как его решает бот - разбор строк, решение
+LocalExtrWithRestrictions без IPython, построение графика и текст ответа. Первый запуск делается с пустым кэшем
+скомпилированных функций.
+
+Запуск: python -m solver_core.search_for_extremes.benchmark
+"""
+
+import os
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import sympy as sp
+
+from .compiled_functions import compile_function, compile_gradient, compile_hessian
+from .drawing_func import eval_on_points
+from .handlers.preprocessing import prepare_data
+from .local_extr import LocalExtr
+from .local_extr_with_restr import LocalExtrWithRestrictions
+
+x, y = sp.symbols('x y')
+
+# Название, функция, отрезки по x и y, параметры LocalExtr
+PROBLEMS_POINTS = [
+    ('sin(x)sin(y), [-40, 40]^2', sp.sin(x) * sp.sin(y), (-40, 40), (-40, 40),
+     {'method': 'numeric', 'time_budget': 30}),
+    ('sin(x)cos(y) + x^2/50, [-20, 20]^2', sp.sin(x) * sp.cos(y) + x ** 2 / 50, (-20, 20), (-20, 20),
+     {'method': 'numeric', 'time_budget': 30}),
+    ('x^3 - 3x + y^3 - 3y, [-2, 2]^2', x ** 3 - 3 * x + y ** 3 - 3 * y, (-2, 2), (-2, 2), {}),
+]
+
+# Функция и ограничивающая функция в том виде, в котором их присылает пользователь
+PROBLEMS_RESTR = [
+    ('x**2 + y**2 - 25', 'x + y - 1'),
+    ('x**2 - y**3 + 5', '(x - 1)**2 + y**3 + 1'),
+    ('x**2 - y**2 + 5', '(x - 1)**2 + y**2 - 1'),
+    ('x*y', 'x**2 + y**2 - 1'),
+    ('x**3 + y', 'x**2 + y**2 - 4'),
+]
+
+
+def collect_by_append(points: np.ndarray, f) -> pd.DataFrame:
+    """
+    Старый способ: каждая точка добавляется в DataFrame отдельно, поэтому на каждом шаге копируется вся таблица.
+    В pandas 2 DataFrame.append нет, тогда строка добавляется через pd.concat с тем же копированием.
+    """
+
+    frame = pd.DataFrame(columns=['x', 'y', 'z'])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        for point in points:
+            row = {'x': point[0], 'y': point[1], 'z': f(point[0], point[1])}
+            if hasattr(frame, 'append'):
+                frame = frame.append(row, ignore_index=True)
+            else:
+                frame = pd.concat([frame, pd.DataFrame([row])], ignore_index=True)
+    return frame
+
+
+def collect_by_buffers(points: np.ndarray, f) -> pd.DataFrame:
+    """
+    Новый способ: значения считаются сразу по массивам координат и таблица строится один раз.
+    """
+
+    return pd.DataFrame({'x': points[:, 0], 'y': points[:, 1], 'z': eval_on_points(f, points[:, 0], points[:, 1])})
+
+
+def best_time(run, repeat: int) -> float:
+    """
+    Функция запускает run repeat раз и возвращает наименьшее время в секундах.
+    """
+
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def run_collection_benchmark(sizes: tuple = (200, 1000, 5000), repeat: int = 3) -> pd.DataFrame:
+    """
+    Функция сравнивает время сбора n точек в DataFrame двумя способами.
+
+    Parameters
+    ----------
+    sizes: tuple
+        Количества точек.
+    repeat: int
+        Количество запусков, в таблицу попадает самый быстрый.
+
+    Returns
+    -------
+    pd.DataFrame
+        Столбцы n, append и buffers (секунды).
+    """
+
+    f = compile_function(sp.sin(x) * sp.sin(y), (x, y))
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in sizes:
+        points = rng.uniform(-40, 40, (n, 2))
+        rows.append({'n': n,
+                     'append': best_time(lambda: collect_by_append(points, f), repeat),
+                     'buffers': best_time(lambda: collect_by_buffers(points, f), repeat)})
+    return pd.DataFrame(rows, columns=['n', 'append', 'buffers'])
+
+
+def run_points_benchmark(repeat: int = 3) -> pd.DataFrame:
+    """
+    Функция замеряет critical_points и border_points LocalExtr на задачах из PROBLEMS_POINTS.
+
+    Returns
+    -------
+    pd.DataFrame
+        Столбцы problem, critical (количество критических точек), critical_time, border (количество точек
+        на границе) и border_time (секунды).
+    """
+
+    rows = []
+    for name, func, interval_x, interval_y, params in PROBLEMS_POINTS:
+        solver = LocalExtr([x, y], func, restr=True, interval_x=interval_x, interval_y=interval_y, **params)
+        critical_time = best_time(solver.critical_points, repeat)
+        solver.points = solver.critical_points()
+        border_time = best_time(solver.border_points, repeat)
+        rows.append({'problem': name, 'critical': len(solver.points), 'critical_time': critical_time,
+                     'border': len(solver.border_points()), 'border_time': border_time})
+    return pd.DataFrame(rows, columns=['problem', 'critical', 'critical_time', 'border', 'border_time'])
+
+
+def solve_restr(func: str, g_func: str) -> str:
+    """
+    Функция решает задачу с ограничением так же, как обработчик бота, и возвращает текст ответа.
+    """
+
+    param = prepare_data(vars='x y', func=func, g_func=g_func)
+    solver = LocalExtrWithRestrictions(**param, headless=True)
+    points, _ = solver.solve()
+    return solver.answer(points)
+
+
+def run_constrained_benchmark(repeat: int = 3) -> pd.DataFrame:
+    """
+    Функция замеряет время ответа на задачи из PROBLEMS_RESTR. График сохраняется во временную папку.
+
+    Parameters
+    ----------
+    repeat: int
+        Количество повторных запусков после первого.
+
+    Returns
+    -------
+    pd.DataFrame
+        Столбцы problem, cold (первый запуск с пустым кэшем скомпилированных функций) и warm (самый быстрый
+        из повторных запусков) в секундах.
+    """
+
+    rows = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for func, g_func in PROBLEMS_RESTR:
+                for compiled in (compile_function, compile_gradient, compile_hessian):
+                    compiled.cache_clear()
+                cold = best_time(lambda: solve_restr(func, g_func), 1)
+                warm = best_time(lambda: solve_restr(func, g_func), repeat)
+                rows.append({'problem': f'{func}, {g_func} = 0', 'cold': cold, 'warm': warm})
+        finally:
+            os.chdir(cwd)
+    return pd.DataFrame(rows, columns=['problem', 'cold', 'warm'])
+
+
+if __name__ == '__main__':
+    pd.set_option('display.width', 200)
+    print(run_collection_benchmark().to_string(index=False))
+    print()
+    print(run_points_benchmark().to_string(index=False))
+    print()
+    print(run_constrained_benchmark().to_string(index=False))
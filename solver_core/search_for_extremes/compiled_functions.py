@@ -0,0 +1,93 @@
+"""
+Общий кэш скомпилированных (лямбдифицированных) функций. Одно и то же выражение используется при поиске
+критических точек, их классификации, обходе границ и построении графика, поэтому lambdify для него
+вызывается один раз на процесс, а дальше функция берется из кэша.
+
+Ключ кэша - выражение и кортеж переменных, поэтому переменные нужно передавать кортежем.
+"""
+
+from functools import lru_cache
+from typing import Callable
+
+import sympy as sp
+
+CACHE_SIZE = 256
+MODULES = ['numpy', 'sympy']
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_function(func, variables: tuple) -> Callable:
+    """
+    Функция компилирует выражение в функцию от массивов numpy.
+
+    Parameters
+    ----------
+    func: sympy выражение или кортеж выражений
+        Выражение. Для кортежа функция возвращает список значений.
+    variables: tuple
+        Переменные функции из sympy.symbols.
+
+    Returns
+    -------
+    Callable
+        Функция от переменных.
+    """
+
+    return sp.lambdify(variables, list(func) if isinstance(func, tuple) else func, MODULES)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_gradient(func, variables: tuple) -> Callable:
+    """
+    Функция компилирует градиент выражения.
+
+    Parameters
+    ----------
+    func: sympy выражение
+        Функция.
+    variables: tuple
+        Переменные функции из sympy.symbols.
+
+    Returns
+    -------
+    Callable
+        Функция, которая возвращает список частных производных.
+    """
+
+    return sp.lambdify(variables, [func.diff(var) for var in variables], MODULES)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_hessian(func, variables: tuple) -> Callable:
+    """
+    Функция компилирует матрицу вторых производных выражения.
+
+    Parameters
+    ----------
+    func: sympy выражение
+        Функция.
+    variables: tuple
+        Переменные функции из sympy.symbols.
+
+    Returns
+    -------
+    Callable
+        Функция, которая возвращает матрицу вторых производных вложенными списками.
+    """
+
+    return sp.lambdify(variables, sp.hessian(func, variables).tolist(), MODULES)
+
+
+def cache_info() -> dict:
+    """
+    Функция возвращает статистику кэша для каждого вида функций.
+
+    Returns
+    -------
+    dict
+        Словарь вида {'function': CacheInfo(...), 'gradient': ..., 'hessian': ...}.
+    """
+
+    return {'function': compile_function.cache_info(),
+            'gradient': compile_gradient.cache_info(),
+            'hessian': compile_hessian.cache_info()}
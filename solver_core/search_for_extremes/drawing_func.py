@@ -5,9 +5,12 @@ import plotly.graph_objects as go
 import numpy as np
 import sympy as sp
 
+from .compiled_functions import compile_function
+
 np.seterr('ignore')
 
 GRID_WIDTH = 1
+SURFACE_POINTS_BUDGET = 49 ** 2
 
 
 def draw_3d(points_of_function: pd.DataFrame,
@@ -71,8 +74,9 @@ def draw_3d(points_of_function: pd.DataFrame,
     if not isinstance(points_of_function, pd.DataFrame):
         raise TypeError('Массив dots не является pd.DataFrame')
 
-    min_value = min(filter(np.isfinite, points_of_function.values.flatten()))
-    max_value = max(filter(np.isfinite, points_of_function.values.flatten()))
+    values = points_of_function.to_numpy(dtype=np.float64)
+    min_value = np.nanmin(values)
+    max_value = np.nanmax(values)
 
     fig = plotly.subplots.make_subplots(rows=1, cols=2,
                                         specs=[[{'is_3d': True}, {'is_3d': False}]],
@@ -80,7 +84,7 @@ def draw_3d(points_of_function: pd.DataFrame,
 
     fig.add_trace(go.Surface(x=points_of_function.index,
                              y=points_of_function.columns,
-                             z=points_of_function.values.T,
+                             z=values.T,
                              opacity=0.5,
                              showscale=False,
                              colorscale='ice',
@@ -99,7 +103,7 @@ def draw_3d(points_of_function: pd.DataFrame,
 
     fig.add_trace(go.Contour(x=points_of_function.index,
                              y=points_of_function.columns,
-                             z=points_of_function.values.T,
+                             z=values.T,
                              opacity=0.75,
                              contours={
                                  'start': min_value,
@@ -192,26 +196,150 @@ def make_df_for_drawing(func,
         data = make_df_for_drawing(func, [x, y], (-2, 2), (-2, 2), 39)
     """
 
-    func = sp.lambdify(variables, func)
+    if isinstance(func, sp.Expr):
+        func = compile_function(func, tuple(variables))
 
     x_axis = np.linspace(x_constraints[0], x_constraints[1], cnt_points)
     y_axis = np.linspace(y_constraints[0], y_constraints[1], cnt_points)
 
-    points = pd.DataFrame(index=x_axis,
-                          columns=y_axis)
+    return pd.DataFrame(eval_on_grid(func, x_axis, y_axis),
+                        index=x_axis,
+                        columns=y_axis)
+
 
-    x_axis = list(x_axis)
-    y_axis = list(y_axis)
+def make_adaptive_df_for_drawing(func,
+                                 variables,
+                                 x_constraints: tuple,
+                                 y_constraints: tuple,
+                                 max_points: int = SURFACE_POINTS_BUDGET,
+                                 start_points: int = 25,
+                                 tolerance: float = 1e-3) -> pd.DataFrame:
+    """
+    Создает данные для отрисовки основной функции на неравномерной сетке. Начинает с грубой равномерной сетки
+    и добавляет узлы посередине тех интервалов по x и y, где линейная интерполяция между соседними узлами сильнее
+    всего расходится со значением функции (то есть там, где велика кривизна). Плоские участки остаются грубыми,
+    общее количество точек не превышает max_points.
 
-    for x_i in x_axis:
-        for y_i in y_axis:
-            f = func(x_i, y_i)
-            if np.isfinite(f):
-                points.loc[x_i, y_i] = f
+    :param func: Функция, которую нужно отрисовать
+    :param variables: список и кортеж переменных в функции func
+    :param x_constraints: ограничения по оси x
+    :param y_constraints: ограничения по оси y
+    :param max_points: максимальное количество точек сетки
+    :param start_points: количество точек на каждой оси у начальной сетки
+    :param tolerance: допустимая ошибка интерполяции относительно размаха значений функции
+    :return: Датафрейм с точками для отрисовки в draw_3d. Индексы и столбцы идут по возрастанию, но с разным шагом.
+
+    Code examples::
+
+        import sympy as sp
+
+        x, y = sp.symbols('x y')
+        func = y * sp.cos(2 * sp.pi * x)
+
+        data = make_adaptive_df_for_drawing(func, [x, y], (-3, 3), (-3, 3))
+    """
+
+    if isinstance(func, sp.Expr):
+        func = compile_function(func, tuple(variables))
+
+    start_points = max(2, min(start_points, int(np.sqrt(max_points))))
+    x_axis = np.linspace(x_constraints[0], x_constraints[1], start_points)
+    y_axis = np.linspace(y_constraints[0], y_constraints[1], start_points)
+    values = eval_on_grid(func, x_axis, y_axis)
+
+    refined = True
+    while refined:
+        refined = False
+        for axis in (0, 1):
+            if axis == 0:
+                axis_points, other_points = x_axis, y_axis
+            else:
+                axis_points, other_points = y_axis, x_axis
+
+            budget = (max_points - values.size) // len(other_points)
+            if budget <= 0:
+                continue
+
+            middles = (axis_points[:-1] + axis_points[1:]) / 2
+            if axis == 0:
+                middle_values = eval_on_grid(func, middles, y_axis)
+                interpolated = (values[:-1] + values[1:]) / 2
+            else:
+                middle_values = eval_on_grid(func, x_axis, middles).T
+                interpolated = ((values[:, :-1] + values[:, 1:]) / 2).T
+
+            scale = np.nanmax(values) - np.nanmin(values) if np.isfinite(values).any() else 0
+            if not scale > 0:
+                continue
+            errors = np.abs(middle_values - interpolated) / scale
+            errors = np.nan_to_num(errors, nan=0).max(axis=1)
+
+            candidates = np.argsort(errors)[::-1][:min(budget, len(middles))]
+            candidates = np.sort(candidates[errors[candidates] > tolerance])
+            if len(candidates) == 0:
+                continue
+
+            positions = candidates + 1
+            axis_points = np.insert(axis_points, positions, middles[candidates])
+            if axis == 0:
+                x_axis = axis_points
+                values = np.insert(values, positions, middle_values[candidates], axis=0)
             else:
-                points.loc[x_i, y_i] = np.nan
+                y_axis = axis_points
+                values = np.insert(values, positions, middle_values[candidates].T, axis=1)
+            refined = True
+
+    return pd.DataFrame(values,
+                        index=x_axis,
+                        columns=y_axis)
+
+
+def eval_on_grid(func, x_axis: np.ndarray, y_axis: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет функцию сразу на всей сетке x_axis × y_axis. Значения, которые не являются конечными
+    вещественными числами, заменяются на np.nan.
+
+    :param func: Функция двух аргументов, работающая с массивами numpy
+    :param x_axis: Значения по оси x
+    :param y_axis: Значения по оси y
+    :return: Матрица float64 размера len(x_axis) × len(y_axis), строки соответствуют x, столбцы - y
+    """
+
+    x_grid, y_grid = np.meshgrid(x_axis, y_axis, indexing='ij')
+    return eval_on_points(func, x_grid, y_grid)
 
-    return points
+
+def eval_on_points(func, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет функцию в наборе точек с координатами из массивов x и y одинаковой формы. Значения, которые
+    не являются конечными вещественными числами, заменяются на np.nan.
+
+    :param func: Функция двух аргументов, работающая с массивами numpy
+    :param x: Значения первой координаты
+    :param y: Значения второй координаты
+    :return: Массив float64 той же формы, что и x
+    """
+
+    def scalar_func(x, y):
+        try:
+            return complex(func(x, y))
+        except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+            return np.nan
+
+    try:
+        values = np.asarray(func(x, y))
+        if values.dtype == object:
+            raise TypeError('Функция вернула не числовой массив')
+    except (TypeError, ValueError, NameError, ZeroDivisionError, OverflowError):
+        # Функция не умеет работать с массивами (обычная функция Python или выражение без аналога в numpy)
+        values = np.vectorize(scalar_func, otypes=[complex])(x, y)
+
+    values = np.broadcast_to(values, np.shape(x))
+    if np.iscomplexobj(values):
+        values = np.where(values.imag == 0, values.real, np.nan)
+    values = values.astype(np.float64)
+    values[~np.isfinite(values)] = np.nan
+    return values
 
 
 def save_fig_to_pic(fig: go.Figure, path: str, extensions: list) -> None:
@@ -243,7 +371,7 @@ def rest_func_points(func,
                      variables,
                      x_const: tuple,
                      y_const: tuple,
-                     cnt_points: int = 40) -> pd.DataFrame:
+                     cnt_points: int = 100) -> pd.DataFrame:
     """
     Создает данные для отрисовки ограничивающей функции
     ФУНКЦИИ ДОЛЖНЫ БЫТЬ sympy выражениями
@@ -261,93 +389,155 @@ def rest_func_points(func,
     :param variables: Список с переменными
     :param x_const: Ограничения по оси x
     :param y_const: Ограничения по оси y
-    :param cnt_points: Количество точек на каждой оси. АККУРАТНО, долго будет работать код на больших значениях
+    :param cnt_points: Количество точек на каждой оси у сетки, на которой ищется кривая g(x, y) = 0
     :return: pd.DataFrame с точками для отрисовки. Столбцы x, y, z
 
-
     """
 
-    real_variables = sp.symbols('x y', real=True)
-    func = func.subs(dict(zip(variables, real_variables)))
-    restr_func = restr_func.subs(dict(zip(variables, real_variables)))
-    epsilon_x = (x_const[1] - x_const[0]) / cnt_points
-    epsilon_y = (y_const[1] - y_const[0]) / cnt_points
+    func = compile_function(func, tuple(variables))
+    restr_func = compile_function(restr_func, tuple(variables))
 
-    x, y = real_variables
+    x_axis = np.linspace(x_const[0], x_const[1], cnt_points)
+    y_axis = np.linspace(y_const[0], y_const[1], cnt_points)
+    epsilon_x = x_axis[1] - x_axis[0]
+    epsilon_y = y_axis[1] - y_axis[0]
 
-    out_df = pd.DataFrame(columns=['x', 'y', 'z'])
+    points = zero_level_points(restr_func, x_axis, y_axis)
+    z = eval_on_points(func, points[:, 0], points[:, 1])
+    finite = np.isfinite(z)
 
-    i = 0
-    for y_i in np.linspace(y_const[0], y_const[1], cnt_points):
-        try:
-            x_solve = sp.solve(restr_func.subs({y: y_i}), [x])
-        except NotImplementedError:
-            try:
-                x_solve = [sp.nsolve(restr_func.subs({y: y_i}), x, x_const[0])]
-            except ValueError:
-                x_solve = []
-
-        for x_i in x_solve:
-            x_i = float(x_i)
-            if x_const[0] <= x_i <= x_const[1]:
-                try:
-                    f = float(func.subs({x: x_i, y: y_i}))
-                    out_df.loc[i] = [x_i, y_i, f]
-                    i += 1
-                except TypeError:
-                    pass
-
-    for x_i in np.linspace(x_const[0], x_const[1], cnt_points):
-        try:
-            y_solve = sp.solve(restr_func.subs({x: x_i}), [y])
-        except NotImplementedError:
-            try:
-                y_solve = [sp.nsolve(restr_func.subs({x: x_i}), [y], y_const[0])]
-            except ValueError:
-                y_solve = []
-
-        for y_i in y_solve:
-            y_i = float(y_i)
-            if y_const[0] <= y_i <= y_const[1]:
-                try:
-                    f = float(func.subs({x: x_i, y: y_i}))
-                    out_df.loc[i] = [x_i, y_i, f]
-                    i += 1
-                except TypeError:
-                    pass
+    out_df = pd.DataFrame({'x': points[finite, 0],
+                           'y': points[finite, 1],
+                           'z': z[finite]})
 
     if out_df.shape[0] > 0:
-        out_df = out_df.sort_values('x').reset_index(drop=True)
-
-        len_ways = pd.DataFrame(index=out_df.index,
-                                columns=out_df.index)
-
-        for i, dot1 in enumerate(out_df[['x', 'y']].apply(tuple, axis=1)):
-            for j, dot2 in enumerate(out_df[['x', 'y']].apply(tuple, axis=1)):
-                if i == j:
-                    len_ways.iloc[i, j] = np.inf
-                else:
-                    len_ways.iloc[i, j] = (dot1[0] - dot2[0]) ** 2 + (dot1[1] - dot2[1]) ** 2
-
-        len_ways = len_ways.astype(float)
-        way = [0]
-        for i in range(len_ways.shape[0] - 1):
-            source = way[-1]
-            target, length = len_ways.loc[source].idxmin(), len_ways.loc[source].min()
-            len_ways.loc[source] = np.inf
-            len_ways.loc[:, source] = np.inf
-            if length > (epsilon_x + epsilon_y):
-                break
-            way.append(target)
+        out_df = out_df.sort_values('x').reset_index(drop=True).astype(float)
+        segments = order_curve_points(out_df[['x', 'y']].to_numpy(), epsilon_x, epsilon_y)
+
+        gap = pd.DataFrame({'x': [np.nan], 'y': [np.nan], 'z': [np.nan]})
+        parts = []
+        for segment in segments:
+            if parts:
+                parts.append(gap)
+            parts.append(out_df.loc[segment])
+        return pd.concat(parts)
+    return out_df.iloc[:0]
 
-        if check_dot_in_round(out_df.loc[way[0], ['x', 'y']].values,
-                              out_df.loc[way[-1], ['x', 'y']].values,
-                              epsilon_x,
-                              epsilon_y):
-            way.append(0)
 
-        return out_df.loc[way]
-    return out_df.iloc[:0]
+def zero_level_points(func, x_axis: np.ndarray, y_axis: np.ndarray, iterations: int = 2) -> np.ndarray:
+    """
+    Вспомогательная функция для rest_func_points
+    Находит точки кривой func(x, y) = 0 методом марширующих квадратов: функция вычисляется в узлах сетки,
+    на каждом ребре ячейки со сменой знака точка пересечения находится линейной интерполяцией и уточняется
+    несколькими шагами метода ложного положения. Пересечения, в которых функция не близка к нулю (разрывы
+    вида 1 / x), отбрасываются.
+
+    :param func: Функция двух аргументов, работающая с массивами numpy
+    :param x_axis: Значения по оси x
+    :param y_axis: Значения по оси y
+    :param iterations: Количество уточняющих шагов внутри ребра
+    :return: Массив точек кривой размера n × 2
+    """
+
+    values = eval_on_grid(func, x_axis, y_axis)
+    x_grid, y_grid = np.meshgrid(x_axis, y_axis, indexing='ij')
+
+    starts, ends, start_values, end_values = [], [], [], []
+    for step in ((slice(None, -1), slice(None)), (slice(None), slice(None, -1))):
+        shifted = tuple(slice(1, None) if part.stop == -1 else part for part in step)
+        v0, v1 = values[step], values[shifted]
+        crossing = (v0 < 0) & (v1 >= 0) | (v0 >= 0) & (v1 < 0)
+        starts.append(np.c_[x_grid[step][crossing], y_grid[step][crossing]])
+        ends.append(np.c_[x_grid[shifted][crossing], y_grid[shifted][crossing]])
+        start_values.append(v0[crossing])
+        end_values.append(v1[crossing])
+
+    start, end = np.concatenate(starts), np.concatenate(ends)
+    v0, v1 = np.concatenate(start_values), np.concatenate(end_values)
+    bound = np.minimum(np.abs(v0), np.abs(v1))
+
+    for _ in range(iterations + 1):
+        t = v0 / (v0 - v1)
+        points = start + (end - start) * t[:, None]
+        value = eval_on_points(func, points[:, 0], points[:, 1])
+        same_side = np.sign(value) == np.sign(v0)
+        start = np.where(same_side[:, None], points, start)
+        v0 = np.where(same_side, value, v0)
+        end = np.where(same_side[:, None], end, points)
+        v1 = np.where(same_side, v1, value)
+
+    keep = np.isfinite(value) & (np.abs(value) <= bound)
+    points = points[keep]
+    if len(points) == 0:
+        return points
+    scale = np.array([x_axis[-1] - x_axis[0], y_axis[-1] - y_axis[0]]) * 1e-9
+    _, unique = np.unique(np.round(points / np.where(scale > 0, scale, 1)), axis=0, return_index=True)
+    return points[np.sort(unique)]
+
+
+def order_curve_points(points: np.ndarray, epsilon_x: float, epsilon_y: float, max_step: float = 2) -> list:
+    """
+    Вспомогательная функция для rest_func_points
+    Упорядочивает точки кривой так, чтобы их можно было соединить линией. Точки раскладываются по ячейкам сетки,
+    после чего из каждой точки делается шаг в ближайшую непосещенную точку из соседних ячеек. Если соседей нет,
+    то текущая ветвь кривой заканчивается и начинается новая. Если конец ветви оказался рядом с ее началом,
+    то ветвь замыкается.
+
+    :param points: Массив точек размера n × 2
+    :param epsilon_x: Шаг сетки по оси x
+    :param epsilon_y: Шаг сетки по оси y
+    :param max_step: Максимальное расстояние между соседними точками ветви в шагах сетки
+    :return: Список ветвей, каждая ветвь - список индексов точек в порядке обхода
+    """
+
+    scaled = points / np.array([epsilon_x, epsilon_y])
+    cells = np.floor(scaled / max_step).astype(np.int64)
+
+    buckets = {}
+    for i, cell in enumerate(map(tuple, cells)):
+        buckets.setdefault(cell, []).append(i)
+
+    visited = np.zeros(len(points), dtype=bool)
+
+    def take(i):
+        visited[i] = True
+        buckets[tuple(cells[i])].remove(i)
+
+    def nearest(i):
+        cx, cy = cells[i]
+        candidates = [j for dx in (-1, 0, 1) for dy in (-1, 0, 1) for j in buckets.get((cx + dx, cy + dy), ())]
+        if not candidates:
+            return None
+        distances = np.hypot(*(scaled[candidates] - scaled[i]).T)
+        best = int(np.argmin(distances))
+        if distances[best] > max_step:
+            return None
+        return candidates[best]
+
+    def walk(i):
+        way = []
+        target = nearest(i)
+        while target is not None:
+            take(target)
+            way.append(target)
+            target = nearest(target)
+        return way
+
+    segments = []
+    for start in range(len(points)):
+        if visited[start]:
+            continue
+        take(start)
+        forward = walk(start)
+        backward = walk(start)
+        segment = backward[::-1] + [start] + forward
+        if len(segment) > 2 and check_dot_in_round(points[segment[0]],
+                                                   points[segment[-1]],
+                                                   epsilon_x * max_step,
+                                                   epsilon_y * max_step):
+            segment.append(segment[0])
+        segments.append(segment)
+    return segments
 
 
 def check_dot_in_round(center, check_point, radius_x, radius_y) -> bool:
@@ -7,13 +7,15 @@ from numpy import inf
 
 from .operations_name_gen import allowed_operations, forbidden_names_for_variables
 
+MAX_VARIABLES = 10
 
-def check_variables(variables: str, split_by: Optional[str] = None) -> str:
+
+def check_variables(variables: str, split_by: Optional[str] = None, n_vars: Optional[int] = 2) -> str:
     """
     Функция для проверки переменных на корректность имени.
      
-    На вход принимает строку с переменными, после проверки возвращает отдельно /
-    первую и вторую переменные.
+    На вход принимает строку с переменными, после проверки возвращает их /
+    через пробел.
 
     Parameters:
     ------------
@@ -21,6 +23,8 @@ def check_variables(variables: str, split_by: Optional[str] = None) -> str:
         Строка содержащая имена переменных.
     split_by: Optional[str] = None
         Разделитель переменных в строке. По умолчанию работает как обычный.
+    n_vars: Optional[int] = 2
+        Необходимое количество переменных. Если None, то допускается от двух до MAX_VARIABLES переменных.
 
     Returns:
     -------
@@ -28,25 +32,24 @@ def check_variables(variables: str, split_by: Optional[str] = None) -> str:
         Строка с переменными, которые разделены пробелом.
     """
 
-    if len(variables.split(split_by)) != 2:
+    names = variables.split(split_by)
+    if n_vars == 2 and len(names) != 2:
         raise ValueError('Введенное количество переменных не равно двум')
-    else:
-        x, y = variables.split(split_by)
-        correct_name_filter = re.compile(f'^[a-zA-Z]+[0-9]?$')
-
-        if correct_name_filter.match(x) and correct_name_filter.match(y):
-            for name in forbidden_names_for_variables:
-
-                if x.find(name) != -1:
-                    raise ValueError('Первая переменная имеет некорректное имя')
-
-                if y.find(name) != -1:
-                    raise ValueError('Вторая переменная имеет некорректное имя')
-        else:
+    elif n_vars is not None and len(names) != n_vars:
+        raise ValueError(f'Введенное количество переменных не равно {n_vars}')
+    elif n_vars is None and not 2 <= len(names) <= MAX_VARIABLES:
+        raise ValueError(f'Количество переменных должно быть от 2 до {MAX_VARIABLES}')
+
+    correct_name_filter = re.compile(f'^[a-zA-Z]+[0-9]?$')
+    for i, name in enumerate(names):
+        if not correct_name_filter.match(name):
             raise ValueError('Имя содержит что-то кроме букв латиницей и цифр или начинается с цифры')
-    if x == y:
+        for forbidden_name in forbidden_names_for_variables:
+            if name.find(forbidden_name) != -1:
+                raise ValueError(f'Переменная номер {i + 1} имеет некорректное имя')
+    if len(set(names)) != len(names):
         raise ValueError('Введены одинаковые имена')
-    return f'{x} {y}'
+    return ' '.join(names)
 
 
 def check_expression(expression: str, variables: str) -> str:
@@ -83,8 +86,8 @@ def check_expression(expression: str, variables: str) -> str:
         if name not in allowed_names:
             raise NameError(f"The use of '{name}' is not allowed")
 
-    x, y = symbols(f'{variables[0]} {variables[1]}')
-    d = {variables[0]: x, variables[1]: y, 'e': math.e, 'pi': math.pi}
+    d = dict(zip(variables, symbols(variables)))
+    d.update({'e': math.e, 'pi': math.pi})
     function = sympify(expression, d, convert_xor=True)
     return str(function)
 
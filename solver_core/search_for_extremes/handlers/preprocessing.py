@@ -31,7 +31,7 @@ def prepare_data(vars: str, func: str, interval_x: Optional[str] = None, interva
     sympy_vars = symbols(vars)
     vars = vars.split()
     func = sympify(func)
-    func = func.subs({vars[0]: sympy_vars[0], vars[1]: sympy_vars[1]})
+    func = func.subs(dict(zip(vars, sympy_vars)))
     interval_x = prepare_limits(interval_x)
     interval_y = prepare_limits(interval_y)
     param = {'vars': sympy_vars,
@@ -39,7 +39,7 @@ def prepare_data(vars: str, func: str, interval_x: Optional[str] = None, interva
              'interval_x': interval_x,
              'interval_y': interval_y}
     if g_func:
-        g_func = sympify(g_func).subs({vars[0]: sympy_vars[0], vars[1]: sympy_vars[1]})
+        g_func = sympify(g_func).subs(dict(zip(vars, sympy_vars)))
         param.update(g_func=g_func)
     return param
 
@@ -0,0 +1,178 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from sympy import symbols, sympify, srepr
+
+from .preprocessing import prepare_limits
+
+CACHE_VERSION = 1
+
+CREATE_SOLUTIONS = ("CREATE TABLE IF NOT EXISTS solutions (\n"
+                    "               key TEXT PRIMARY KEY, \n"
+                    "               answer TEXT NOT NULL, \n"
+                    "               figure TEXT NOT NULL, \n"
+                    "               size INTEGER NOT NULL, \n"
+                    "               last_used REAL NOT NULL)")
+SELECT_SOLUTION = "SELECT answer, figure FROM solutions WHERE key = ?"
+SELECT_SIZES = "SELECT key, size FROM solutions ORDER BY last_used DESC"
+INSERT_SOLUTION = "INSERT OR REPLACE INTO solutions(key, answer, figure, size, last_used) VALUES (?, ?, ?, ?, ?)"
+UPDATE_LAST_USED = "UPDATE solutions SET last_used = ? WHERE key = ?"
+DELETE_SOLUTION = "DELETE FROM solutions WHERE key = ?"
+
+
+def canonical_key(vars: str, func: str, g_func: Optional[str] = None, interval_x: Optional[str] = None,
+                  interval_y: Optional[str] = None, restr: bool = False, solver: str = 'LocalExtr') -> str:
+    """
+    Функция строит ключ кэша для задачи. Переменные переименовываются в x0, x1, ... по порядку, выражения
+    приводятся к sympy.srepr, поэтому одна и та же задача с разными именами переменных получает один ключ.
+
+    Parameters
+    ----------
+    vars: str
+        Строка с переменными, разделенными пробелом.
+    func: str
+        Строка с функцией.
+    g_func: Optional[str] = None
+        Ограничивающая функция в виде строки.
+    interval_x: Optional[str] = None
+        Ограничения для первой переменной.
+    interval_y: Optional[str] = None
+        Ограничения для второй переменной.
+    restr: bool = False
+        Есть ли ограничения на переменные. Если нет, то интервалы не входят в ключ.
+    solver: str = 'LocalExtr'
+        Название решателя, ответ которого сохраняется.
+
+    Returns
+    -------
+    str
+        Ключ задачи в кэше.
+    """
+
+    names = vars.split()
+    canonical_vars = symbols(' '.join(f'x{i}' for i in range(len(names))))
+    local_names = dict(zip(names, canonical_vars))
+
+    parts = [CACHE_VERSION, solver, srepr(sympify(func, local_names))]
+    parts.append(srepr(sympify(g_func, local_names)) if g_func else None)
+    if restr:
+        parts.append(prepare_limits(interval_x))
+        parts.append(prepare_limits(interval_y))
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+class SolutionCache:
+    """
+    Постоянный кэш решенных задач в базе данных SQLite. Хранит текст ответа и график в формате json.
+    При превышении количества записей или их общего размера удаляются записи, которые дольше всего не запрашивались.
+
+    Parameters
+    ----------
+    path: str
+        Путь к файлу базы данных.
+    max_entries: int
+        Максимальное количество записей.
+    max_bytes: int
+        Максимальный общий размер ответов и графиков в байтах.
+    """
+
+    def __init__(self, path: str = 'solutions.db', max_entries: int = 500, max_bytes: int = 64 * 2 ** 20):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Подключение к базе данных кэша. Таблица создается при первом подключении.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Объект соединения с базой данных.
+        """
+
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute(CREATE_SOLUTIONS)
+            self.connection.commit()
+        return self.connection
+
+    def get(self, key: str) -> Optional[tuple]:
+        """
+        Поиск решения в кэше.
+
+        Parameters
+        ----------
+        key: str
+            Ключ задачи из canonical_key.
+
+        Returns
+        -------
+        Optional[tuple]
+            Текст ответа и plotly Figure (None, если у решения нет графика) или None, если задачи нет в кэше.
+        """
+
+        try:
+            with self.lock:
+                connection = self.get_connection()
+                row = connection.execute(SELECT_SOLUTION, (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute(UPDATE_LAST_USED, (time.time(), key))
+                connection.commit()
+        except sqlite3.Error as error:
+            print("Ошибка при чтении кэша решений:", error)
+            return None
+        answer, figure = row
+        return answer, pio.from_json(figure) if figure else None
+
+    def put(self, key: str, answer: str, figure: Optional[go.Figure]):
+        """
+        Сохранение решения в кэш и удаление старых записей.
+
+        Parameters
+        ----------
+        key: str
+            Ключ задачи из canonical_key.
+        answer: str
+            Текст ответа.
+        figure: Optional[go.Figure]
+            График решения. None, если график не строится.
+        """
+
+        figure = figure.to_json() if figure is not None else ''
+        size = len(answer.encode()) + len(figure.encode())
+        if size > self.max_bytes:
+            return
+
+        try:
+            with self.lock:
+                connection = self.get_connection()
+                connection.execute(INSERT_SOLUTION, (key, answer, figure, size, time.time()))
+                self.evict(connection)
+                connection.commit()
+        except sqlite3.Error as error:
+            print("Ошибка при записи в кэш решений:", error)
+
+    def evict(self, connection: sqlite3.Connection):
+        """
+        Удаление записей, которые дольше всего не запрашивались, пока кэш не уложится в ограничения.
+
+        Parameters
+        ----------
+        connection: sqlite3.Connection
+            Объект соединения с базой данных.
+        """
+
+        total = 0
+        for i, (key, size) in enumerate(connection.execute(SELECT_SIZES).fetchall()):
+            total += size
+            if i >= self.max_entries or total > self.max_bytes:
+                connection.execute(DELETE_SOLUTION, (key,))
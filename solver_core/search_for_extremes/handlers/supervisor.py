@@ -0,0 +1,286 @@
+"""
+Запуск тяжелых вычислений (например, sympy.solve) в отдельном процессе с ограничениями по времени,
+процессорному времени и памяти. Если вычисление превысило ограничение, процесс завершается, а вызывающий код
+получает исключение SolverLimitExceeded и может перейти к запасному способу решения.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_WALL_TIME = 10
+DEFAULT_MEMORY_LIMIT = 1024
+POLL_INTERVAL = 0.05
+
+limit_counters = Counter()
+counters_lock = threading.Lock()
+
+
+class SolverLimitExceeded(Exception):
+    """
+    Вычисление превысило одно из ограничений.
+
+    Parameters
+    ----------
+    limit: str
+        Какое ограничение сработало: 'wall_time', 'cpu_time' или 'memory'.
+    """
+
+    def __init__(self, limit: str):
+        super().__init__(f'Превышено ограничение {limit}')
+        self.limit = limit
+
+
+def get_limit_counters() -> dict:
+    """
+    Функция возвращает количество срабатываний каждого ограничения в текущем процессе.
+
+    Returns
+    -------
+    dict
+        Словарь вида {'wall_time': 1, 'cpu_time': 0, 'memory': 2}.
+    """
+
+    with counters_lock:
+        return {limit: limit_counters[limit] for limit in ('wall_time', 'cpu_time', 'memory')}
+
+
+def get_rss(pid: int) -> Optional[int]:
+    """
+    Функция возвращает объем резидентной памяти процесса в байтах по данным /proc.
+
+    Parameters
+    ----------
+    pid: int
+        Идентификатор процесса.
+
+    Returns
+    -------
+    Optional[int]
+        Объем памяти в байтах или None, если /proc недоступен.
+    """
+
+    try:
+        with open(f'/proc/{pid}/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def run_child(connection, target: Callable, args: tuple, kwargs: dict, cpu_time: Optional[float]):
+    """
+    Функция, которая исполняется в дочернем процессе: выставляет ограничение процессорного времени, вызывает target
+    и отправляет результат или исключение родителю.
+    """
+
+    if resource is not None and cpu_time is not None:
+        seconds = max(1, int(cpu_time + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    try:
+        connection.send(('ok', target(*args, **kwargs)))
+    except MemoryError:
+        connection.send(('memory', None))
+    except Exception as error:
+        connection.send(('error', error))
+    finally:
+        connection.close()
+
+
+def run_supervised(target: Callable, args: tuple = (), kwargs: Optional[dict] = None,
+                   wall_time: float = DEFAULT_WALL_TIME, cpu_time: Optional[float] = None,
+                   memory_limit: Optional[float] = DEFAULT_MEMORY_LIMIT) -> Any:
+    """
+    Функция вызывает target(*args, **kwargs) в отдельном процессе и возвращает результат.
+
+    Parameters
+    ----------
+    target: Callable
+        Вызываемая функция. Функция, ее аргументы и результат должны поддерживать pickle.
+    args: tuple
+        Позиционные аргументы.
+    kwargs: Optional[dict]
+        Именованные аргументы.
+    wall_time: float
+        Ограничение по реальному времени в секундах.
+    cpu_time: Optional[float]
+        Ограничение по процессорному времени в секундах. По умолчанию равно wall_time.
+    memory_limit: Optional[float]
+        Ограничение по резидентной памяти дочернего процесса в мегабайтах. None - без ограничения.
+
+    Returns
+    -------
+    Any
+        Результат target.
+
+    Raises
+    ------
+    SolverLimitExceeded
+        Если сработало одно из ограничений.
+    """
+
+    if cpu_time is None:
+        cpu_time = wall_time
+    process, receiver = start_child(target, args, kwargs, cpu_time)
+
+    limit = None
+    deadline = time.monotonic() + wall_time
+    try:
+        while not receiver.poll(POLL_INTERVAL):
+            if not process.is_alive() and not receiver.poll():
+                break
+            if time.monotonic() > deadline:
+                limit = 'wall_time'
+                break
+            rss = get_rss(process.pid) if memory_limit is not None else None
+            if rss is not None and rss > memory_limit * 2 ** 20:
+                limit = 'memory'
+                break
+
+        if limit is None:
+            status, payload = receive(receiver)
+            if status == 'ok':
+                return payload
+            if status == 'error':
+                raise payload
+            limit = status
+    finally:
+        stop_child(process, receiver)
+
+    raise limit_exceeded(limit)
+
+
+def run_supervised_many(calls: Sequence[tuple], wall_time: float = DEFAULT_WALL_TIME,
+                        cpu_time: Optional[float] = None, memory_limit: Optional[float] = DEFAULT_MEMORY_LIMIT,
+                        max_workers: Optional[int] = None) -> list:
+    """
+    Функция выполняет несколько независимых вызовов, каждый в своем процессе, одновременно не больше max_workers
+    процессов. Все вызовы делят одно ограничение по реальному времени: по его истечении работающие процессы
+    завершаются, а не начатые вызовы не запускаются.
+
+    Parameters
+    ----------
+    calls: Sequence[tuple]
+        Вызовы вида (target, args, kwargs). Требования к ним такие же, как в run_supervised.
+    wall_time: float
+        Общее ограничение по реальному времени в секундах.
+    cpu_time: Optional[float]
+        Ограничение по процессорному времени в секундах для каждого процесса. По умолчанию равно wall_time.
+    memory_limit: Optional[float]
+        Ограничение по резидентной памяти каждого процесса в мегабайтах. None - без ограничения.
+    max_workers: Optional[int]
+        Максимальное количество одновременно работающих процессов. По умолчанию равно количеству процессоров,
+        при одном процессоре вызовы выполняются по очереди.
+
+    Returns
+    -------
+    list
+        Результаты в порядке calls. Если вызов завершился исключением или превысил ограничение, вместо результата
+        стоит это исключение (SolverLimitExceeded для ограничений).
+    """
+
+    if cpu_time is None:
+        cpu_time = wall_time
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    outcomes = [None] * len(calls)
+    pending = list(range(len(calls)))[::-1]
+    running = {}
+    deadline = time.monotonic() + wall_time
+    try:
+        while pending or running:
+            while pending and len(running) < max_workers:
+                i = pending.pop()
+                target, args, kwargs = calls[i]
+                running[i] = start_child(target, args, kwargs, min(cpu_time, deadline - time.monotonic()))
+            multiprocessing.connection.wait([receiver for _, receiver in running.values()], POLL_INTERVAL)
+
+            for i, (process, receiver) in list(running.items()):
+                if receiver.poll() or not process.is_alive():
+                    status, payload = receive(receiver)
+                elif time.monotonic() > deadline:
+                    status, payload = 'wall_time', None
+                elif memory_limit is not None and (get_rss(process.pid) or 0) > memory_limit * 2 ** 20:
+                    status, payload = 'memory', None
+                else:
+                    continue
+                if status == 'ok' or status == 'error':
+                    outcomes[i] = payload
+                else:
+                    outcomes[i] = limit_exceeded(status)
+                stop_child(process, receiver)
+                del running[i]
+
+            if pending and time.monotonic() > deadline:
+                for i in pending:
+                    outcomes[i] = limit_exceeded('wall_time')
+                pending = []
+    finally:
+        for process, receiver in running.values():
+            stop_child(process, receiver)
+    return outcomes
+
+
+def start_child(target: Callable, args: tuple, kwargs: Optional[dict], cpu_time: float) -> tuple:
+    """
+    Функция запускает run_child в новом процессе (через fork, если он доступен).
+
+    Returns
+    -------
+    tuple
+        Процесс и конец канала, из которого читается результат.
+    """
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=run_child, args=(sender, target, args, kwargs or {}, cpu_time), daemon=True)
+    process.start()
+    sender.close()
+    return process, receiver
+
+
+def receive(receiver) -> tuple:
+    """
+    Функция читает ответ дочернего процесса.
+
+    Returns
+    -------
+    tuple
+        Статус ('ok', 'error', 'memory' или 'cpu_time') и результат или исключение.
+    """
+
+    try:
+        return receiver.recv()
+    except EOFError:
+        # Процесс завершился без ответа: его остановил RLIMIT_CPU
+        return 'cpu_time', None
+
+
+def stop_child(process, receiver):
+    """
+    Функция завершает дочерний процесс, если он еще работает, и закрывает канал.
+    """
+
+    if process.is_alive():
+        process.kill()
+    process.join()
+    receiver.close()
+
+
+def limit_exceeded(limit: str) -> SolverLimitExceeded:
+    """
+    Функция учитывает срабатывание ограничения в счетчиках и создает исключение для него.
+    """
+
+    with counters_lock:
+        limit_counters[limit] += 1
+    return SolverLimitExceeded(limit)
@@ -1,9 +1,19 @@
+import os
+import time
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 import sympy as sp
 
 from .drawing_func import *
+from .compiled_functions import compile_function, compile_hessian
+from .numeric_solver import find_critical_points, stack_values
+from .handlers.supervisor import run_supervised, run_supervised_many, SolverLimitExceeded, DEFAULT_MEMORY_LIMIT
 
+# Границ не больше четырех. Бот сам запускает решатели в нескольких процессах, поэтому одна задача
+# не занимает больше процессов, чем у нее границ
+MAX_EDGE_WORKERS = min(4, os.cpu_count() or 1)
 
 class LocalExtr:
     """
@@ -19,13 +29,25 @@ class LocalExtr:
         Кортеж с пограничными точками для оси X.
     interval_y: tuple
         Кортеж с пограничными точками для оси Y.
+    method: 'auto' or 'numeric'
+        Способ поиска критических точек. 'auto' - sympy.solve, а если он не справился за time_budget секунд,
+        не смог решить систему или нашел бесконечно много точек, то численный поиск. 'numeric' - только численный.
+    time_budget: float
+        Ограничение по времени в секундах для каждого из способов поиска критических точек.
+    memory_limit: float
+        Ограничение по памяти в мегабайтах для процесса, в котором работает sympy.solve.
     """
-    def __init__(self, vars, func, restr=False, interval_x=None, interval_y=None):
+    def __init__(self, vars, func, restr=False, interval_x=None, interval_y=None, method='auto', time_budget=10,
+                 memory_limit=DEFAULT_MEMORY_LIMIT):
         self.vars = vars
         self.func = func
         self.restr = restr
         self.interval_x = interval_x
         self.interval_y = interval_y
+        self.method = method
+        self.time_budget = time_budget
+        self.memory_limit = memory_limit
+        self.timed_out = False
 
     def generate_colors(self):
         """
@@ -59,12 +81,11 @@ class LocalExtr:
 
         self.points = self.critical_points()
         if self.restr:
-            self.points = self.points.append(self.border_points(),
-                                             ignore_index=True)
+            self.points = pd.concat([self.points, self.border_points()], ignore_index=True)
             self.points = self.points.drop_duplicates(['x', 'y', 'z'])
         ans = ''
         if self.points.empty:
-            ans += 'Решений нет'
+            ans += 'Не удалось решить задачу за отведенное время' if self.timed_out else 'Решений нет'
             if not self.interval_x:
                 self.interval_x = (-1, 1)  # значения для интервалов, если они не заданы и нет точек
             if not self.interval_y:
@@ -74,6 +95,8 @@ class LocalExtr:
             to_output = self.points.groupby(by='type', axis=0)[['x', 'y', 'z']].apply(f)
             for i, v in enumerate(to_output):
                 ans += f'{to_output.index[i]}: {v}\n'
+            if self.timed_out:
+                ans += 'Точное решение не найдено за отведенное время, точки найдены численно\n'
             if not self.interval_y:
                 self.interval_y = (self.points['y'].min() - 5, self.points['y'].max() + 5)
             if not self.interval_x:
@@ -82,10 +105,10 @@ class LocalExtr:
         self.points = self.points.rename(columns={'type': 'types'})
         self.points['color'] = self.generate_colors()
 
-        data_for_draw = make_df_for_drawing(self.func, self.vars,
-                                            self.interval_x, self.interval_y)
-        plot = draw_3d(data_for_draw, critical_points=self.points)
-        save_fig_to_pic(plot, 'graph', ['html'])
+        data_for_draw = make_adaptive_df_for_drawing(self.func, self.vars,
+                                                     self.interval_x, self.interval_y)
+        self.plot = draw_3d(data_for_draw, critical_points=self.points)
+        save_fig_to_pic(self.plot, 'graph', ['html'])
         return ans
 
     def check_point(point, xlim, ylim):
@@ -153,71 +176,121 @@ class LocalExtr:
             Данные о критических точках.
         """
 
-        def set_dot_type(data, d, d2x):
-            """
-            Функция определяет тип точки.
-
-            При помощи вторых производных функция определяет
-            является ли точка минимальной/максимальной/седловой.
-            Используется для передачи в метод pandas.DataFrame.apply().
-
-            Parameters
-            ----------
-            data: pd.Series
-                Столбцы со значениями x, y, z.
-            d: sympy выражение
-                Детерминант матрицы вторых производных. В него подставлются значения в точках
-            d2x: sympy выражение
-                Вторая производная по икс. В него подставляется значения в точках
-
-            Returns
-            -------
-            pd.Series
-                Серия со значениями одним из четырех типов точки: 'saddle', 'global min', 'global max', 'unknown'
-            """
-            d = d.subs({x: data[0], y: data[1]})
-            d2x = d2x.subs({x: data[0], y: data[1]})
-
-            if d < 0:
-                return 'saddle'
-            elif d > 0 and d2x > 0:
-                return 'global min'
-            elif d > 0 and d2x < 0:
-                return 'global max'
-            else:
-                return 'unknown'
-
         x, y = self.vars[0], self.vars[1]
         z = self.func
-        critical_points_sympy = sp.solve([z.diff(x), z.diff(y)], [x, y], dict=True)
-        f = sp.lambdify([x, y], z)
-        critical_points = pd.DataFrame(columns=['x', 'y', 'z'])
-
-        for i in critical_points_sympy:
-            i = [float(i[x]), float(i[y])]
-            if LocalExtr.check_point(i, self.interval_x, self.interval_y):
-                point = {'x': i[0], 'y': i[1], 'z': f(i[0], i[1])}
-                critical_points = critical_points.append(point, ignore_index=True)
+        f = compile_function(z, (x, y))
+
+        points = self.symbolic_critical_points() if self.method == 'auto' else None
+        if points is None:
+            points = find_critical_points(z, [x, y], [self.interval_x, self.interval_y],
+                                          time_budget=self.time_budget)
+
+        points = np.array([i for i in points if LocalExtr.check_point(i, self.interval_x, self.interval_y)],
+                          dtype=np.float64).reshape(-1, 2)
+        if len(points):
+            critical_points = pd.DataFrame({'x': points[:, 0],
+                                            'y': points[:, 1],
+                                            'z': eval_on_points(f, points[:, 0], points[:, 1])})
+        else:
+            critical_points = pd.DataFrame(columns=['x', 'y', 'z'])
 
         if not critical_points.empty:
-            D = z.diff(x, 2) * z.diff(y, 2) - z.diff(x).diff(y) ** 2
-            D2x = z.diff(x, 2)
-            critical_points['type'] = critical_points.apply(set_dot_type,
-                                                            axis=1,
-                                                            args=(D, D2x))
+            critical_points['type'] = self.classify_points(critical_points['x'].to_numpy(dtype=np.float64),
+                                                           critical_points['y'].to_numpy(dtype=np.float64))
         else:
             critical_points['type'] = []
 
         return critical_points
 
-    def find_local_extr(self, free_var_ind, max_val, min_val):
+    def classify_points(self, xs: np.ndarray, ys: np.ndarray, tol: float = 1e-9) -> np.ndarray:
+        """
+        Метод определяет тип критических точек по угловым минорам матрицы вторых производных.
+
+        Матрица вторых производных берется из общего кэша скомпилированных функций и считается сразу для всех
+        точек. Если детерминант в точке численно равен нулю (или не посчитался), то он вычисляется точно
+        с помощью sympy.subs.
+
+        Parameters
+        ----------
+        xs: np.ndarray
+            Координаты точек по x.
+        ys: np.ndarray
+            Координаты точек по y.
+        tol: float
+            Детерминанты, по модулю не больше tol, пересчитываются точно.
+
+        Returns
+        -------
+        np.ndarray
+            Массив со значениями одним из четырех типов точки: 'saddle', 'global min', 'global max', 'unknown'
+        """
+
+        x, y = self.vars[0], self.vars[1]
+        z = self.func
+        d2x = z.diff(x, 2)
+        d = d2x * z.diff(y, 2) - z.diff(x).diff(y) ** 2
+
+        try:
+            with np.errstate(all='ignore'):
+                hessian = stack_values(compile_hessian(z, (x, y))(xs, ys), xs.shape)
+            d2x_values = hessian[..., 0, 0].copy()
+            d_values = hessian[..., 0, 0] * hessian[..., 1, 1] - hessian[..., 0, 1] * hessian[..., 1, 0]
+        except (TypeError, ValueError, NameError, ZeroDivisionError, OverflowError):
+            d2x_values, d_values = np.full(xs.shape, np.nan), np.full(xs.shape, np.nan)
+
+        for i in np.flatnonzero(~(np.abs(d_values) > tol)):
+            values = {x: xs[i], y: ys[i]}
+            exact_d, exact_d2x = d.subs(values), d2x.subs(values)
+            d_values[i] = float(exact_d) if exact_d.is_real else np.nan
+            d2x_values[i] = float(exact_d2x) if exact_d2x.is_real else np.nan
+
+        types = np.full(xs.shape, 'unknown', dtype=object)
+        types[d_values < 0] = 'saddle'
+        types[(d_values > 0) & (d2x_values > 0)] = 'global min'
+        types[(d_values > 0) & (d2x_values < 0)] = 'global max'
+        return types
+
+    def symbolic_critical_points(self) -> Optional[list]:
+        """
+        Метод находит критические точки с помощью sympy.solve. Решение запускается в отдельном процессе
+        с ограничениями по времени (self.time_budget секунд) и памяти (self.memory_limit мегабайт).
+
+        Returns
+        -------
+        Optional[list]
+            Список вещественных точек [x, y] или None, если sympy не успел, не смог решить систему
+            или нашел бесконечное множество точек.
+        """
+
+        x, y = self.vars[0], self.vars[1]
+        z = self.func
+        try:
+            solutions = run_supervised(sp.solve, ([z.diff(x), z.diff(y)], [x, y]), {'dict': True},
+                                       wall_time=self.time_budget, memory_limit=self.memory_limit)
+        except SolverLimitExceeded:
+            self.timed_out = True
+            return None
+        except NotImplementedError:
+            return None
+
+        points = []
+        for solution in solutions:
+            if x not in solution or y not in solution or solution[x].free_symbols or solution[y].free_symbols:
+                return None
+            point = [complex(solution[x]), complex(solution[y])]
+            if abs(point[0].imag) < 1e-12 and abs(point[1].imag) < 1e-12:
+                points.append([point[0].real, point[1].real])
+        return points
+
+    def edges_extr(self, max_val, min_val):
         """
-        Метод находит локальные экстремумы.
+        Метод находит локальные экстремумы на всех границах области. Каждая граница (прямая x = const или
+        y = const) решается функцией find_edge_extr в отдельном процессе, все процессы работают одновременно
+        и делят одно ограничение по времени time_budget. Результаты объединяются в порядке границ, поэтому
+        ответ не зависит от того, какой процесс закончил раньше.
 
         Parameters
         ----------
-        free_var_ind: 0 or 1
-            Номер переменной, которая является свободной (по ней нет ограничений)
         max_val: float or np.inf
             Максимальное значение. В случае если в ходе решения окажется, что у функции есть супремум,
             больший чем это значение, то максимальное значение
@@ -227,59 +300,38 @@ class LocalExtr:
 
         Returns
         -------
-        pd.DataFrame
-            с колонками как координаты точек x, y, z
+        list
+            Список точек (x, y, z)
             max_value - новое максимальное значение
             min_value - новое минимальное значение
         """
 
-        points = pd.DataFrame(columns=['x', 'y', 'z'])
-
-        if free_var_ind == 0:
-            lim = self.interval_y
-            free_var = self.vars[0]
-            limit_var = self.vars[1]
-        elif free_var_ind == 1:
-            lim = self.interval_x
-            free_var = self.vars[1]
-            limit_var = self.vars[0]
-
-        for i in lim:
-            if abs(i) == np.inf:
+        calls = []
+        deadline = time.monotonic() + self.time_budget
+        # Сначала границы x = const (свободная переменная y), затем y = const
+        for free_var_ind, lim in ((1, self.interval_x), (0, self.interval_y)):
+            if not lim:
                 continue
-            else:
-                fun = self.func.subs({limit_var: i})
-                if fun == sp.zoo:
-                    check = sp.limit(self.func, limit_var, i)
-                    if check > max_val:
-                        max_val = float(check)
-                    if check < min_val:
-                        min_val = float(check)
-                    continue
-                potential_points = sp.solve(fun.diff(free_var), free_var, dict=True)
-                for j in potential_points:
-                    coord = float(j[free_var])
-                    if free_var_ind == 0:
-                        point = (coord, i)
-                    else:
-                        point = (i, coord)
-
-                    if LocalExtr.check_point(point,
-                                             self.interval_x,
-                                             self.interval_y):
-                        try:
-                            z = float(fun.subs(j))
-                        except ZeroDivisionError:
-                            pass
-                        else:
-                            if z > max_val:
-                                max_val = z
-                            if z < min_val:
-                                min_val = z
-                            points = points.append({'x': point[0],
-                                                    'y': point[1],
-                                                    'z': z},
-                                                   ignore_index=True)
+            for value in lim:
+                if abs(value) != np.inf:
+                    calls.append((find_edge_extr,
+                                  (self.func, tuple(self.vars), free_var_ind, value,
+                                   self.interval_x, self.interval_y, deadline),
+                                  None))
+
+        points = []
+        outcomes = run_supervised_many(calls, wall_time=self.time_budget, memory_limit=self.memory_limit,
+                                       max_workers=MAX_EDGE_WORKERS)
+        for outcome in outcomes:
+            if isinstance(outcome, SolverLimitExceeded):
+                self.timed_out = True
+                continue
+            if isinstance(outcome, Exception):
+                raise outcome
+            edge_points, edge_max, edge_min = outcome
+            points.extend(edge_points)
+            max_val = max(max_val, edge_max)
+            min_val = min(min_val, edge_min)
         return points, max_val, min_val
 
     def border_points(self):
@@ -293,7 +345,7 @@ class LocalExtr:
             С колонками x, y, z, type. type содержит либо 'local max' либо 'local min'
         """
 
-        f = sp.lambdify(self.vars, self.func)
+        f = compile_function(self.func, tuple(self.vars))
 
         if self.points.empty:
             min_z = np.inf
@@ -302,7 +354,7 @@ class LocalExtr:
             min_z = self.points['z'].min()
             max_z = self.points['z'].max()
 
-        points = pd.DataFrame(columns=['x', 'y', 'z'])
+        rows = []
 
         if self.interval_x and self.interval_y:
             for x in self.interval_x:
@@ -331,19 +383,12 @@ class LocalExtr:
                                 max_z = z
                             if z < min_z:
                                 min_z = z
-                            point = {'x': x, 'y': y, 'z': f(x, y)}
-                            points = points.append(point, ignore_index=True)
-        if self.interval_x:
-            a = self.find_local_extr(1, max_z, min_z)
-            points = points.append(a[0], ignore_index=True)
-            max_z = a[1]
-            min_z = a[2]
-        if self.interval_y:
-            a = self.find_local_extr(0, max_z, min_z)
-            points = points.append(a[0], ignore_index=True)
-            max_z = a[1]
-            min_z = a[2]
-        points = points.drop_duplicates()
+                            rows.append((x, y, z))
+        a = self.edges_extr(max_z, min_z)
+        rows.extend(a[0])
+        max_z = a[1]
+        min_z = a[2]
+        points = pd.DataFrame(rows, columns=['x', 'y', 'z']).drop_duplicates()
         cond = ((points['z'] == points['z'].max()) & (points['z'] >= max_z)) \
                | ((points['z'] == points['z'].min()) & (points['z'] <= min_z))
         points = points[cond]
@@ -353,6 +398,74 @@ class LocalExtr:
         return points
 
 
+def find_edge_extr(func, vars: tuple, free_var_ind, value, interval_x, interval_y, deadline):
+    """
+    Функция находит локальные экстремумы на одной границе области. Выполняется в отдельном процессе, поэтому
+    находится на уровне модуля и принимает все данные аргументами.
+
+    Parameters
+    ----------
+    func : sympy выражение
+        Функция.
+    vars: tuple
+        Переменные функции из sympy.symbols.
+    free_var_ind: 0 or 1
+        Номер переменной, которая является свободной (по ней нет ограничений)
+    value: float
+        Значение второй переменной на границе.
+    interval_x: tuple
+        Кортеж с пограничными точками для оси X.
+    interval_y: tuple
+        Кортеж с пограничными точками для оси Y.
+    deadline: float
+        Общий для всех границ момент окончания по time.monotonic(). Если sympy.solve не может решить уравнение,
+        то численный поиск получает оставшееся до него время.
+
+    Returns
+    -------
+    list
+        Список точек (x, y, z)
+        max_value - наибольшее значение на границе (в том числе предел в особой точке)
+        min_value - наименьшее значение на границе
+    """
+
+    points = []
+    max_val = -np.inf
+    min_val = np.inf
+    free_var = vars[free_var_ind]
+    limit_var = vars[1 - free_var_ind]
+
+    fun = func.subs({limit_var: value})
+    if fun == sp.zoo:
+        try:
+            check = float(sp.limit(func, limit_var, value))
+        except TypeError:
+            return points, max_val, min_val
+        return points, max(max_val, check), min(min_val, check)
+
+    try:
+        coords = [solution[free_var] for solution in sp.solve(fun.diff(free_var), free_var, dict=True)
+                  if free_var in solution and solution[free_var].is_real]
+    except NotImplementedError:
+        # Трансцендентное уравнение: корни производной ищутся численно
+        free_lim = interval_x if free_var_ind == 0 else interval_y
+        coords = find_critical_points(fun, (free_var,), [free_lim],
+                                      time_budget=max(0.0, deadline - time.monotonic()))[:, 0].tolist()
+
+    for coord in coords:
+        point = (float(coord), value) if free_var_ind == 0 else (value, float(coord))
+        if LocalExtr.check_point(point, interval_x, interval_y):
+            try:
+                z = float(fun.subs({free_var: coord}))
+            except (ZeroDivisionError, TypeError):
+                pass
+            else:
+                max_val = max(max_val, z)
+                min_val = min(min_val, z)
+                points.append((point[0], point[1], z))
+    return points, max_val, min_val
+
+
 if __name__ == '__main__':
     from solver_core.search_for_extremes.handlers.preprocessing import prepare_data
     data = prepare_data('x y', 'x**2 - y**2', interval_x='-10 10', interval_y='-10 10')
@@ -0,0 +1,409 @@
+import time
+from itertools import combinations
+from typing import Optional, Sequence
+
+import pandas as pd
+import numpy as np
+import sympy as sp
+
+from .compiled_functions import compile_function
+from .numeric_solver import find_critical_points, stack_values
+from .handlers.supervisor import run_supervised, SolverLimitExceeded, DEFAULT_MEMORY_LIMIT
+
+MULTIPLIER_BOX = (-100, 100)
+NUMERIC_TOL = 1e-5  # find_critical_points возвращает координаты с точностью до 1e-6
+
+
+def solve_systems(systems: list, unknowns: list) -> list:
+    """
+    Функция решает несколько систем уравнений с помощью sympy.solve. Используется, чтобы решить системы
+    для всех наборов активных ограничений в одном процессе под run_supervised.
+
+    Parameters
+    ----------
+    systems: list
+        Список систем уравнений.
+    unknowns: list
+        Список неизвестных для каждой системы.
+
+    Returns
+    -------
+    list
+        Список решений sympy.solve(dict=True) для каждой системы или None, если sympy не умеет ее решать.
+    """
+
+    solutions = []
+    for system, variables in zip(systems, unknowns):
+        try:
+            solutions.append(sp.solve(system, variables, dict=True))
+        except NotImplementedError:
+            solutions.append(None)
+    return solutions
+
+
+class LocalExtrKKT:
+    """
+    Решатель задачи поиска условных экстремумов с несколькими ограничениями-равенствами и ограничениями-неравенствами
+    с помощью условий Каруша-Куна-Таккера.
+
+    Перебираются наборы активных неравенств. Для каждого набора составляется функция Лагранжа, система ее частных
+    производных решается с помощью sympy.solve, а если он не справился, то численно методом Ньютона
+    (активные ограничения считаются равенствами). Если sympy не смог решить только часть систем, то численно
+    решаются только они. Бесконечные множества решений выводятся в ответе отдельно, изолированные решения
+    остальных наборов при этом сохраняются. Точки, которые не удовлетворяют неактивным ограничениям,
+    отбрасываются. Тип точки определяется по знакам множителей при неравенствах и по угловым минорам
+    окаймленного гессиана нужного порядка.
+
+    Parameters
+    ----------
+    vars : list
+        Список переменных из sympy.symbols.
+    func : sympy выражение
+        Функция.
+    equalities: Sequence
+        Ограничения-равенства: выражения g(x) (ограничение g(x) = 0) или sympy.Eq.
+    inequalities: Sequence
+        Ограничения-неравенства: выражения h(x) (ограничение h(x) <= 0) или неравенства sympy (x + y >= 1).
+    bounds: Optional[Sequence]
+        Границы по каждой переменной для численного поиска, None если границ нет.
+    method: 'auto' or 'numeric'
+        Способ решения систем. 'auto' - sympy.solve, а если он не справился за time_budget секунд, то численный.
+    time_budget: float
+        Ограничение по времени в секундах для каждого из способов решения.
+    memory_limit: float
+        Ограничение по памяти в мегабайтах для процесса, в котором работает sympy.solve.
+    tol: float
+        Точность проверки ограничений и знаков множителей. Для численного решения она не меньше NUMERIC_TOL.
+    """
+
+    def __init__(self, vars, func, equalities: Sequence = (), inequalities: Sequence = (),
+                 bounds: Optional[Sequence] = None, method='auto', time_budget=10,
+                 memory_limit=DEFAULT_MEMORY_LIMIT, tol=1e-7):
+        self.vars = list(vars)
+        self.func = func
+        self.equalities = [self.to_expression(g) for g in equalities]
+        self.inequalities = [self.to_expression(h) for h in inequalities]
+        self.bounds = list(bounds) if bounds is not None else [None] * len(self.vars)
+        self.method = method
+        self.time_budget = time_budget
+        self.memory_limit = memory_limit
+        self.tol = tol
+        self.timed_out = False
+        self.numeric = False
+        self.families = []
+        self.lams = list(sp.symbols(f'lambda_1:{len(self.equalities) + 1}'))
+        self.mus = list(sp.symbols(f'mu_1:{len(self.inequalities) + 1}'))
+
+    @staticmethod
+    def to_expression(constraint):
+        """
+        Метод приводит ограничение к виду g(x) = 0 или h(x) <= 0.
+
+        Parameters
+        ----------
+        constraint: sympy выражение или sympy.Rel
+            Ограничение.
+
+        Returns
+        -------
+        sympy выражение
+            Левая часть ограничения.
+        """
+
+        if isinstance(constraint, (sp.Equality, sp.LessThan, sp.StrictLessThan)):
+            return constraint.lhs - constraint.rhs
+        if isinstance(constraint, (sp.GreaterThan, sp.StrictGreaterThan)):
+            return constraint.rhs - constraint.lhs
+        return constraint
+
+    def active_sets(self) -> list:
+        """
+        Метод перечисляет наборы активных неравенств, от меньших к большим. Наборы, в которых ограничений
+        больше, чем переменных, пропускаются.
+
+        Returns
+        -------
+        list
+            Список кортежей с номерами активных неравенств.
+        """
+
+        free = len(self.vars) - len(self.equalities)
+        return [active for size in range(min(free, len(self.inequalities)) + 1)
+                for active in combinations(range(len(self.inequalities)), size)]
+
+    def lagrangian(self, active: tuple):
+        """
+        Метод составляет функцию Лагранжа для набора активных неравенств.
+
+        Parameters
+        ----------
+        active: tuple
+            Номера активных неравенств.
+
+        Returns
+        -------
+        tuple
+            Функция Лагранжа и список неизвестных (переменные и множители).
+        """
+
+        mus = [self.mus[j] for j in active]
+        lagrange_func = self.func + sum(lam * g for lam, g in zip(self.lams, self.equalities)) \
+                        + sum(mu * self.inequalities[j] for mu, j in zip(mus, active))
+        return lagrange_func, self.vars + self.lams + mus
+
+    def solve(self) -> str:
+        """
+        Метод решает задачу условного экстремума.
+
+        Returns
+        -------
+        str
+            Строка с ответом.
+        """
+
+        self.points = self.kkt_points()
+        if self.points.empty and not self.families:
+            return 'Не удалось решить задачу за отведенное время' if self.timed_out else 'Решений нет'
+
+        names = [str(var) for var in self.vars] + ['f_value']
+        ans = ''
+        for point_type, group in self.points.groupby('type'):
+            ans += f'{point_type}: {list(group[names].itertuples(index=False, name=None))}\n'
+        for family in self.families:
+            equations = ', '.join(f'{var} = {value}' for var, value in family.items() if value != var)
+            ans += f'Бесконечное множество точек: {equations}\n'
+        if self.numeric:
+            ans += 'Точное решение не найдено за отведенное время, точки найдены численно\n'
+        return ans
+
+    def kkt_points(self) -> pd.DataFrame:
+        """
+        Метод находит точки, удовлетворяющие условиям ККТ, и определяет их тип.
+
+        Returns
+        -------
+        pd.DataFrame
+            Столбцы с координатами (названы по именам переменных), f_value - значение функции, type и active -
+            номера активных неравенств.
+        """
+
+        names = [str(var) for var in self.vars]
+        active_sets = self.active_sets()
+        solutions = self.symbolic_solutions(active_sets) if self.method == 'auto' else None
+        if solutions is None:
+            solutions = [None] * len(active_sets)
+        # Численно решаются только системы, которые не решил sympy
+        numeric = [points is None for points in solutions]
+        if any(numeric):
+            self.numeric = self.method == 'auto'
+            numeric_solutions = iter(self.numeric_solutions([active for active, is_numeric
+                                                             in zip(active_sets, numeric) if is_numeric]))
+            solutions = [next(numeric_solutions) if points is None else points for points in solutions]
+
+        rows = []
+        seen = set()
+        for active, points, is_numeric in zip(active_sets, solutions, numeric):
+            tol = max(self.tol, NUMERIC_TOL) if is_numeric else self.tol
+            points = self.feasible(points, tol)
+            if not len(points):
+                continue
+            types = self.classify_points(active, points, tol)
+            for point, point_type in zip(points, types):
+                key = tuple(np.round(point[:len(self.vars)], 8))
+                if key not in seen:
+                    seen.add(key)
+                    rows.append(key + (point_type, active))
+        if not rows:
+            return pd.DataFrame(columns=names + ['f_value', 'type', 'active'])
+
+        points = pd.DataFrame(rows, columns=names + ['type', 'active'])
+        f = compile_function(self.func, tuple(self.vars))
+        with np.errstate(all='ignore'):
+            points.insert(len(names), 'f_value', stack_values(f(*points[names].to_numpy(dtype=np.float64).T),
+                                                        (len(points),)))
+        return points
+
+    def symbolic_solutions(self, active_sets: list) -> Optional[list]:
+        """
+        Метод решает системы ККТ для всех наборов активных неравенств с помощью sympy.solve в отдельном процессе
+        с ограничениями по времени и памяти.
+
+        Parameters
+        ----------
+        active_sets: list
+            Наборы активных неравенств.
+
+        Returns
+        -------
+        Optional[list]
+            Для каждого набора массив k × (число неизвестных) с вещественными изолированными решениями или None
+            для набора, систему которого sympy не умеет решать. None вместо списка, если sympy не успел.
+            Бесконечные множества решений сохраняются в self.families.
+        """
+
+        systems, unknowns = [], []
+        for active in active_sets:
+            lagrange_func, variables = self.lagrangian(active)
+            systems.append([lagrange_func.diff(var) for var in variables])
+            unknowns.append(variables)
+        try:
+            all_solutions = run_supervised(solve_systems, (systems, unknowns),
+                                           wall_time=self.time_budget, memory_limit=self.memory_limit)
+        except SolverLimitExceeded:
+            self.timed_out = True
+            return None
+
+        result = []
+        for solutions, variables in zip(all_solutions, unknowns):
+            if solutions is None:
+                result.append(None)
+                continue
+            points = []
+            for solution in solutions:
+                if any(var not in solution or solution[var].free_symbols for var in variables):
+                    # Бесконечное множество решений: выводится как есть, без проверки допустимости
+                    family = {var: solution.get(var, var) for var in self.vars}
+                    if family not in self.families:
+                        self.families.append(family)
+                    continue
+                point = [complex(solution[var]) for var in variables]
+                if all(abs(value.imag) < 1e-12 for value in point):
+                    points.append([value.real for value in point])
+            result.append(np.array(points, dtype=np.float64).reshape(-1, len(variables)))
+        return result
+
+    def numeric_solutions(self, active_sets: list) -> list:
+        """
+        Метод численно находит стационарные точки функции Лагранжа для каждого набора активных неравенств
+        (метод Ньютона для системы ККТ, в которой активные неравенства считаются равенствами). Время делится
+        поровну между наборами.
+
+        Parameters
+        ----------
+        active_sets: list
+            Наборы активных неравенств.
+
+        Returns
+        -------
+        list
+            Для каждого набора массив k × (число неизвестных) с решениями.
+        """
+
+        deadline = time.perf_counter() + self.time_budget
+        result = []
+        for i, active in enumerate(active_sets):
+            lagrange_func, variables = self.lagrangian(active)
+            budget = max(0.0, deadline - time.perf_counter()) / (len(active_sets) - i)
+            bounds = self.bounds + [MULTIPLIER_BOX] * (len(variables) - len(self.vars))
+            result.append(find_critical_points(lagrange_func, variables, bounds, time_budget=budget))
+        return result
+
+    def feasible(self, points: np.ndarray, tol: float) -> np.ndarray:
+        """
+        Метод оставляет точки, которые удовлетворяют всем ограничениям и границам.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Массив k × (число неизвестных) с решениями системы.
+        tol: float
+            Точность проверки ограничений (относительно наибольшей по модулю координаты).
+
+        Returns
+        -------
+        np.ndarray
+            Допустимые точки.
+        """
+
+        if not len(points):
+            return points
+        x = points[:, :len(self.vars)]
+        mask = np.ones(len(points), dtype=bool)
+        for i, lim in enumerate(self.bounds):
+            if lim is not None:
+                mask &= (lim[0] - tol <= x[:, i]) & (x[:, i] <= lim[1] + tol)
+
+        constraints = [(g, True) for g in self.equalities] + [(h, False) for h in self.inequalities]
+        with np.errstate(all='ignore'):
+            for constraint, is_equality in constraints:
+                values = stack_values(compile_function(constraint, tuple(self.vars))(*x.T), (len(points),))
+                scale = tol * (1 + np.abs(x).max(axis=1))
+                mask &= np.abs(values) <= scale if is_equality else values <= scale
+        return points[mask]
+
+    def classify_points(self, active: tuple, points: np.ndarray, tol: float) -> np.ndarray:
+        """
+        Метод определяет тип точек ККТ.
+
+        Для минимума множители при активных неравенствах должны быть неотрицательными, для максимума -
+        неположительными. Достаточное условие проверяется по последним n - k угловым минорам окаймленного гессиана,
+        где k - количество активных ограничений: для минимума все они имеют знак (-1) ** k, для максимума минор
+        порядка k + r имеет знак (-1) ** r. Если один из миноров численно равен нулю (тест зависит от порядка
+        переменных), то проверяются собственные значения гессиана функции Лагранжа на касательном подпространстве.
+        Если k = n, то точка изолирована на ограничениях, и ее тип определяется только по знакам множителей.
+
+        Parameters
+        ----------
+        active: tuple
+            Номера активных неравенств.
+        points: np.ndarray
+            Массив k × (число неизвестных) с допустимыми решениями системы.
+        tol: float
+            Точность проверки знаков множителей и миноров.
+
+        Returns
+        -------
+        np.ndarray
+            Массив со значениями одним из четырех типов точки: 'global min', 'global max', 'saddle', 'unknown'
+            (те же названия, что и в LocalExtr)
+        """
+
+        n, m = len(self.vars), len(self.equalities)
+        mus = points[:, n + m:]
+        min_compatible = (mus >= -tol).all(axis=1)
+        max_compatible = (mus <= tol).all(axis=1)
+
+        lagrange_func, variables = self.lagrangian(active)
+        constraints = self.equalities + [self.inequalities[j] for j in active]
+        k = len(constraints)
+        types = np.full(len(points), 'unknown', dtype=object)
+        if k >= n:
+            if active:
+                types[(mus > tol).all(axis=1)] = 'global min'
+                types[(mus < -tol).all(axis=1)] = 'global max'
+            return types
+
+        hessian = sp.hessian(lagrange_func, self.vars)
+        if k:
+            jacobian = sp.Matrix(constraints).jacobian(self.vars)
+            bordered = sp.Matrix(sp.BlockMatrix([[sp.zeros(k, k), jacobian], [jacobian.T, hessian]]))
+        else:
+            bordered = hessian
+        with np.errstate(all='ignore'):
+            matrices = stack_values(compile_function(tuple(bordered), tuple(variables))(*points.T), (len(points),))
+        matrices = matrices.reshape(len(points), n + k, n + k)
+
+        orders = np.arange(k + 1, n + 1)
+        minors = np.stack([np.linalg.det(matrices[:, :k + r, :k + r]) for r in orders], axis=1)
+        signs = np.where(np.abs(minors) > tol, np.sign(minors), 0)
+        is_min = (signs == (-1) ** k).all(axis=1)
+        is_max = (signs == (-1) ** orders).all(axis=1)
+        is_saddle = (signs != 0).all(axis=1) & ~is_min & ~is_max
+
+        for i in np.flatnonzero((signs == 0).any(axis=1) & np.isfinite(matrices).all(axis=(1, 2))):
+            # Гессиан функции Лагранжа на касательном подпространстве: Z^T H Z, где столбцы Z - базис ядра J
+            jacobian_values, hessian_values = matrices[i, :k, k:], matrices[i, k:, k:]
+            _, singular, basis = np.linalg.svd(jacobian_values) if k else (None, np.empty(0), np.eye(n))
+            rank = int((singular > tol).sum())
+            tangent = basis[rank:].T
+            eigenvalues = np.linalg.eigvalsh(tangent.T @ hessian_values @ tangent)
+            positive, negative = eigenvalues > tol, eigenvalues < -tol
+            is_min[i] = positive.all()
+            is_max[i] = negative.all()
+            is_saddle[i] = positive.any() and negative.any()
+
+        types[is_saddle] = 'saddle'
+        types[is_min & min_compatible] = 'global min'
+        types[is_max & max_compatible] = 'global max'
+        types[(is_min & ~min_compatible) | (is_max & ~max_compatible)] = 'saddle'
+        return types
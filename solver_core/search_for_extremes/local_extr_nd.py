@@ -0,0 +1,173 @@
+from typing import Optional
+
+import pandas as pd
+import numpy as np
+import sympy as sp
+
+from .compiled_functions import compile_function, compile_hessian
+from .numeric_solver import find_critical_points, stack_values
+from .handlers.supervisor import run_supervised, SolverLimitExceeded, DEFAULT_MEMORY_LIMIT
+
+
+class LocalExtrND:
+    """
+    Решатель задачи поиска локальных экстремумов функции многих переменных без ограничений.
+
+    Критические точки ищутся с помощью sympy.solve, а если он не справился, то численно. Тип точек определяется
+    по собственным значениям матрицы вторых производных, которые считаются сразу для всех точек.
+
+    Parameters
+    ----------
+    vars : list
+        Список переменных из sympy.symbols.
+    func : sympy выражение
+        Функция.
+    method: 'auto' or 'numeric'
+        Способ поиска критических точек. 'auto' - sympy.solve, а если он не справился за time_budget секунд,
+        не смог решить систему или нашел бесконечно много точек, то численный поиск. 'numeric' - только численный.
+    time_budget: float
+        Ограничение по времени в секундах для каждого из способов поиска критических точек.
+    memory_limit: float
+        Ограничение по памяти в мегабайтах для процесса, в котором работает sympy.solve.
+    """
+
+    def __init__(self, vars, func, method='auto', time_budget=10, memory_limit=DEFAULT_MEMORY_LIMIT):
+        self.vars = list(vars)
+        self.func = func
+        self.method = method
+        self.time_budget = time_budget
+        self.memory_limit = memory_limit
+        self.timed_out = False
+        self.plot = None
+
+    def solve(self) -> str:
+        """
+        Метод решает задачу локального экстремума.
+
+        Returns
+        -------
+        str
+            Строка с ответом.
+        """
+
+        self.points = self.critical_points()
+        if self.points.empty:
+            return 'Не удалось решить задачу за отведенное время' if self.timed_out else 'Решений нет'
+
+        names = [str(var) for var in self.vars] + ['f_value']
+        ans = ''
+        for point_type, group in self.points.groupby('type'):
+            ans += f'{point_type}: {list(group[names].itertuples(index=False, name=None))}\n'
+        if self.timed_out:
+            ans += 'Точное решение не найдено за отведенное время, точки найдены численно\n'
+        return ans
+
+    def critical_points(self) -> pd.DataFrame:
+        """
+        Метод находит критические точки и определяет их тип.
+
+        Returns
+        -------
+        pd.DataFrame
+            Столбцы с координатами (названы по именам переменных), f_value - значение функции и type.
+        """
+
+        names = [str(var) for var in self.vars]
+        points = self.symbolic_critical_points() if self.method == 'auto' else None
+        if points is None:
+            points = find_critical_points(self.func, self.vars, [None] * len(self.vars),
+                                          time_budget=self.time_budget)
+        points = np.array(points, dtype=np.float64).reshape(-1, len(self.vars))
+        if not len(points):
+            return pd.DataFrame(columns=names + ['f_value', 'type'])
+
+        f = compile_function(self.func, tuple(self.vars))
+        with np.errstate(all='ignore'):
+            z = stack_values(f(*points.T), (len(points),))
+        critical_points = pd.DataFrame(points, columns=names)
+        critical_points['f_value'] = z
+        critical_points['type'] = self.classify_points(points)
+        return critical_points
+
+    def symbolic_critical_points(self) -> Optional[list]:
+        """
+        Метод находит критические точки с помощью sympy.solve в отдельном процессе с ограничениями по времени
+        и памяти.
+
+        Returns
+        -------
+        Optional[list]
+            Список вещественных точек или None, если sympy не успел, не смог решить систему
+            или нашел бесконечное множество точек.
+        """
+
+        gradient = [self.func.diff(var) for var in self.vars]
+        try:
+            solutions = run_supervised(sp.solve, (gradient, self.vars), {'dict': True},
+                                       wall_time=self.time_budget, memory_limit=self.memory_limit)
+        except SolverLimitExceeded:
+            self.timed_out = True
+            return None
+        except NotImplementedError:
+            return None
+
+        points = []
+        for solution in solutions:
+            if any(var not in solution or solution[var].free_symbols for var in self.vars):
+                return None
+            point = [complex(solution[var]) for var in self.vars]
+            if all(abs(coord.imag) < 1e-12 for coord in point):
+                points.append([coord.real for coord in point])
+        return points
+
+    def classify_points(self, points: np.ndarray, tol: float = 1e-9) -> np.ndarray:
+        """
+        Метод определяет тип критических точек по знакам собственных значений матрицы вторых производных.
+
+        Если одно из собственных значений численно равно нулю (или матрица не посчиталась), то определенность
+        матрицы в точке проверяется с помощью sympy.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Массив k × n с координатами точек.
+        tol: float
+            Собственные значения, по модулю не больше tol (относительно наибольшего), считаются нулевыми.
+
+        Returns
+        -------
+        np.ndarray
+            Массив со значениями одним из четырех типов точки: 'global min', 'global max', 'saddle', 'unknown'
+            (те же названия, что и в LocalExtr)
+        """
+
+        try:
+            with np.errstate(all='ignore'):
+                hessians = stack_values(compile_hessian(self.func, tuple(self.vars))(*points.T), (len(points),))
+            finite = np.isfinite(hessians).all(axis=(1, 2))
+            eigenvalues = np.full(points.shape, np.nan)
+            eigenvalues[finite] = np.linalg.eigvalsh(hessians[finite])
+        except (TypeError, ValueError, NameError, ZeroDivisionError, OverflowError):
+            eigenvalues = np.full(points.shape, np.nan)
+
+        scale = np.maximum(1, np.abs(eigenvalues).max(axis=1, initial=0))
+        positive = eigenvalues > tol * scale[:, None]
+        negative = eigenvalues < -tol * scale[:, None]
+
+        types = np.full(len(points), 'unknown', dtype=object)
+        types[positive.all(axis=1)] = 'global min'
+        types[negative.all(axis=1)] = 'global max'
+        types[positive.any(axis=1) & negative.any(axis=1)] = 'saddle'
+
+        hessian = None
+        for i in np.flatnonzero(~(positive | negative).all(axis=1)):
+            if hessian is None:
+                hessian = sp.hessian(self.func, self.vars)
+            h = hessian.subs(dict(zip(self.vars, points[i])))
+            if h.is_positive_definite:
+                types[i] = 'global min'
+            elif h.is_negative_definite:
+                types[i] = 'global max'
+            elif h.is_indefinite:
+                types[i] = 'saddle'
+        return types
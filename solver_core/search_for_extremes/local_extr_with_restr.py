@@ -1,9 +1,21 @@
+from typing import Callable, NamedTuple
+
 import sympy as sp
 import numpy as np
 import pandas as pd
-from IPython.display import display, Latex
 
 from .drawing_func import *
+from .compiled_functions import compile_function
+from .numeric_solver import find_critical_points
+from .handlers.supervisor import run_supervised, SolverLimitExceeded, DEFAULT_MEMORY_LIMIT
+
+
+class Step(NamedTuple):
+    """
+    Шаг решения: название и функция, которая строит LaTeX для вывода. LaTeX строится только при вызове render.
+    """
+    name: str
+    render: Callable[[], str]
 
 
 class LocalExtrWithRestrictions:
@@ -15,9 +27,14 @@ class LocalExtrWithRestrictions:
     :param g_func: sympy выражение
     :param interval_x: tuple с числами
     :param interval_y: tuple с числами
+    :param time_budget: ограничение по времени в секундах для sympy.solve и для численного поиска точек
+    :param memory_limit: ограничение по памяти в мегабайтах для процесса, в котором работает sympy.solve
+    :param headless: режим без IPython. Шаги решения только записываются в self.steps, LaTeX для них
+                     строится методом latex_steps по запросу
     """
 
-    def __init__(self, vars, func, g_func, interval_x=None, interval_y=None):
+    def __init__(self, vars, func, g_func, interval_x=None, interval_y=None, time_budget=10,
+                 memory_limit=DEFAULT_MEMORY_LIMIT, headless=False):
         x, y = sp.symbols('x y')
         self.func = func.subs({vars[0]: x, vars[1]: y})
         self.g_func = g_func.subs({vars[0]: x, vars[1]: y})
@@ -25,6 +42,29 @@ class LocalExtrWithRestrictions:
         self.interval_x = interval_x
         self.interval_y = interval_y
         self.lam = sp.symbols('lambda')
+        self.time_budget = time_budget
+        self.memory_limit = memory_limit
+        self.timed_out = False
+        self.headless = headless
+        self.steps = []
+
+    def show(self, name, render):
+        """
+        Записывает шаг решения. Если решатель работает не в режиме headless, то шаг сразу выводится через IPython
+        :param name: название шага
+        :param render: функция без аргументов, которая возвращает LaTeX шага
+        """
+        self.steps.append(Step(name, render))
+        if not self.headless:
+            from IPython.display import display, Latex
+            display(Latex(render()))
+
+    def latex_steps(self):
+        """
+        Строит LaTeX для всех записанных шагов решения
+        :return: список строк LaTeX
+        """
+        return [step.render() for step in self.steps]
 
     def f_lagrange(self, display_flag=False):
         """
@@ -37,8 +77,8 @@ class LocalExtrWithRestrictions:
         lagrange_func = lagrange_func + lam * self.g_func
 
         if display_flag:
-            display(Latex(r'$\text{Составим функцию Лагранжа}$'))
-            display(Latex(r'$\displaystyle L(x,y,\lambda) = ' + sp.latex(lagrange_func) + '$'))
+            self.show('lagrange_title', lambda: r'$\text{Составим функцию Лагранжа}$')
+            self.show('lagrange', lambda: r'$\displaystyle L(x,y,\lambda) = ' + sp.latex(lagrange_func) + '$')
 
         return lagrange_func
 
@@ -48,7 +88,7 @@ class LocalExtrWithRestrictions:
         :param display_flag: флаг вывода в дисплей системы уравнений. True - вывести, False - нет
         :return: Систему уравнений
         """
-        lagrange_func = self.f_lagrange(True)
+        lagrange_func = self.f_lagrange(display_flag)
         lam = self.lam
 
         equations = []
@@ -58,14 +98,12 @@ class LocalExtrWithRestrictions:
         equations.append(lagrange_func.diff(lam))
 
         if display_flag:
-            display(Latex(r'$\text{Решим систему из трех уравнений: }$'))
-            long_row = r"$\displaystyle \begin{cases} \displaystyle\frac{\partial L}{\partial x} = " +\
-                       sp.latex(equations[0]) + r' = 0\\' +\
-                       r"\displaystyle\frac{\partial L}{\partial y} = " + sp.latex(equations[1]) + r' = 0\\' +\
-                       r"\displaystyle\frac{\partial L}{\partial \lambda} = " +\
-                       r"\displaystyle " + sp.latex(equations[2]) + r" = 0 \end{cases} $"
-
-            display(Latex(long_row))
+            self.show('system_title', lambda: r'$\text{Решим систему из трех уравнений: }$')
+            self.show('system', lambda: r"$\displaystyle \begin{cases} \displaystyle\frac{\partial L}{\partial x} = " +
+                      sp.latex(equations[0]) + r' = 0\\' +
+                      r"\displaystyle\frac{\partial L}{\partial y} = " + sp.latex(equations[1]) + r' = 0\\' +
+                      r"\displaystyle\frac{\partial L}{\partial \lambda} = " +
+                      r"\displaystyle " + sp.latex(equations[2]) + r" = 0 \end{cases} $")
 
         return equations
 
@@ -78,30 +116,44 @@ class LocalExtrWithRestrictions:
         """
         lam = self.lam
         system = self.system(True)
-        solutions = sp.solve(system, self.variables + [lam], dict=True)
         x, y = self.variables
+        try:
+            solutions = run_supervised(sp.solve, (system, self.variables + [lam]), {'dict': True},
+                                       wall_time=self.time_budget, memory_limit=self.memory_limit)
+        except SolverLimitExceeded:
+            self.timed_out = True
+            solutions = self.numeric_solve_system()
+            if not solutions:
+                self.show('timeout', lambda: r'$\text{Не удалось решить систему за отведенное время}$')
 
         real_solutions = []
         indices = []
 
-        display(Latex(r'$ \text{Найденные точки:} $'))
-        i = False
+        self.show('points_title', lambda: r'$ \text{Найденные точки:} $')
         for i, sol in enumerate(solutions):
-            display_row = r'$\displaystyle \mathrm{M}' + f'_{i + 1}' + r'\left('
-            display_row += sp.latex(sol[x]) + r', '
-            display_row += sp.latex(sol[y]) + r', '
-            display_row += sp.latex(sol[lam]) + r'\right) $'
-            display(Latex(display_row))
+            self.show('point', lambda i=i, sol=sol: r'$\displaystyle \mathrm{M}' + f'_{i + 1}' + r'\left(' +
+                      sp.latex(sol[x]) + r', ' + sp.latex(sol[y]) + r', ' + sp.latex(sol[lam]) + r'\right) $')
 
             if bool(sol[x].is_real) and bool(sol[y].is_real) and bool(sol[lam].is_real):
                 if self.point_check(sol):
                     real_solutions.append(sol)
                     indices.append(i)
-        if not i:
-            display(Latex(r'$\text{Решений системы нет}$'))
+        if not solutions:
+            self.show('no_solutions', lambda: r'$\text{Решений системы нет}$')
 
         return real_solutions, indices
 
+    def numeric_solve_system(self):
+        """
+        Численно находит стационарные точки функции Лагранжа, если sympy не успел решить систему.
+        :return: список точек в том же виде, что и у sympy.solve(dict=True)
+        """
+        x, y = self.variables
+        points = find_critical_points(self.f_lagrange(), [x, y, self.lam],
+                                      [self.interval_x, self.interval_y, None],
+                                      time_budget=self.time_budget)
+        return [{x: sp.Float(point[0]), y: sp.Float(point[1]), self.lam: sp.Float(point[2])} for point in points]
+
     def point_check(self, point):
         """
         Получает точку с вещественными значением и проверяет подходят ли она в ограничения
@@ -143,19 +195,47 @@ class LocalExtrWithRestrictions:
 
         return hessian
 
+    def hessian_determinants(self, hessian, points, tol=1e-9):
+        """
+        Считает детерминант гессиана сразу во всех точках: детерминант лямбдифицируется один раз и вычисляется
+        по массивам координат. Если в точке он численно равен нулю, то он пересчитывается точно через sympy.subs
+        :param hessian: гессиан из self.gen_hessian
+        :param points: список точек из sympy solve, которые содержат ключи x, y, lambda
+        :param tol: детерминанты, по модулю не больше tol, пересчитываются точно
+        :return: np.ndarray со значениями детерминанта, np.nan там, где точное значение не вещественное
+        """
+        if not points:
+            return np.empty(0)
+        x, y = self.variables
+        det = hessian.det()
+        coords = [np.array([float(point[var]) for point in points]) for var in (x, y, self.lam)]
+        try:
+            with np.errstate(all='ignore'):
+                values = np.array(np.broadcast_to(compile_function(det, (x, y, self.lam))(*coords),
+                                                  coords[0].shape), dtype=np.float64)
+        except (TypeError, ValueError, NameError, ZeroDivisionError, OverflowError):
+            values = np.full(len(points), np.nan)
+
+        for i in np.flatnonzero(~(np.abs(values) > tol)):
+            exact = det.subs(points[i])
+            values[i] = float(exact) if exact.is_real else np.nan
+        return values
+
     @staticmethod
     def type_dot(h_det: float):
         """
         Проверяет тип точки и выдает ее название и цвет
-        :param h_det: значение детерминанта гессиана - вещественное число
+        :param h_det: значение детерминанта гессиана - вещественное число или np.nan, если его не удалось вычислить
         :return: словарь со значение типа и цвета
         """
         if h_det > 0:
             return {"type": 'max', "color": 'red'}
         elif h_det < 0:
             return {"type": 'min', "color": 'lightgreen'}
-        else:
+        elif h_det == 0:
             return {"type": 'saddle', "color": 'yellow'}
+        else:
+            return {"type": 'unknown', "color": 'brown'}
 
     def solve(self):
         """
@@ -168,37 +248,60 @@ class LocalExtrWithRestrictions:
         self.min_max(relevant_points)
 
         if len(relevant_points):
-            display(Latex(r'$ \displaystyle \text{Составим Гессиан: }\mathrm{H}' +
-                          r'  \displaystyle = ' + sp.latex(hessian) + '$'))
+            self.show('hessian', lambda: r'$ \displaystyle \text{Составим Гессиан: }\mathrm{H}' +
+                      r'  \displaystyle = ' + sp.latex(hessian) + '$')
         else:
-            display(Latex(r'$ \displaystyle \text{Вещественных точек нет.} $'))
+            self.show('no_real_points', lambda: r'$ \displaystyle \text{Вещественных точек нет.} $')
 
-        df = pd.DataFrame(columns=['x', 'y', '|H|', 'z', 'types', 'color'])
+        rows = []
 
+        determinants = self.hessian_determinants(hessian, relevant_points)
+        # Функция компилируется один раз: та же функция из кэша используется при построении графика
+        xs = np.array([float(dot[x]) for dot in relevant_points])
+        ys = np.array([float(dot[y]) for dot in relevant_points])
+        values = eval_on_points(compile_function(self.func, (x, y)), xs, ys)
         for i, dot in enumerate(relevant_points):
-            h = hessian.subs(dot)
-            display(Latex(r'$ \displaystyle \mathrm{H} \left(' +
-                          r'  \displaystyle \mathrm{M}' + f'_{i + 1}' + r'\right) = ' + sp.latex(h) + '$'))
-            h_det = h.det()
+            self.show('point_hessian', lambda i=i, dot=dot: r'$ \displaystyle \mathrm{H} \left(' +
+                      r'  \displaystyle \mathrm{M}' + f'_{i + 1}' + r'\right) = ' + sp.latex(hessian.subs(dot)) + '$')
+            h_det = determinants[i]
             dct = self.type_dot(h_det)
 
-            df.loc[i] = [round(float(dot[x]), 4),
-                         round(float(dot[y]), 4),
+            rows.append((round(xs[i], 4),
+                         round(ys[i], 4),
                          round(float(h_det), 4),
-                         round(float(self.func.subs(dot)), 4),
+                         round(float(values[i]), 4),
                          dct['type'],
-                         dct['color']]
+                         dct['color']))
 
+        df = pd.DataFrame(rows, columns=['x', 'y', '|H|', 'z', 'types', 'color'])
         df = df.sort_values(['types', 'z'], ascending=[1, 0])
 
         plot = self.gen_plot(df)
         if df.shape[0] > 0:
-            display(df)
+            if not self.headless:
+                from IPython.display import display
+                display(df)
             return df, plot
 
         else:
             return df, plot
 
+    def answer(self, points):
+        """
+        Составляет текст ответа по таблице точек из self.solve
+        :param points: pd.DataFrame с точками
+        :return: строка с ответом
+        """
+        if points.empty:
+            return 'Не удалось решить задачу за отведенное время' if self.timed_out else 'Решений нет'
+
+        ans = ''
+        for point_type, group in points.groupby('types'):
+            ans += f'{point_type}: {list(zip(group["x"], group["y"], group["z"]))}\n'
+        if self.timed_out:
+            ans += 'Точное решение не найдено за отведенное время, точки найдены численно\n'
+        return ans
+
     def min_max(self, points) -> None:
         """
         Если интервалы не задаются, то функция создает исходя из набора вещественных критических точек.
@@ -233,7 +336,7 @@ class LocalExtrWithRestrictions:
 
     def gen_plot(self, critical_points, path='graph'):
 
-        surface_points = make_df_for_drawing(self.func, self.variables, self.interval_x, self.interval_y)
+        surface_points = make_adaptive_df_for_drawing(self.func, self.variables, self.interval_x, self.interval_y)
         rest_points = rest_func_points(self.func, self.g_func, self.variables, self.interval_x, self.interval_y)
 
         plot = draw_3d(surface_points, rest_points, critical_points)
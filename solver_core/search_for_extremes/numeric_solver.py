@@ -0,0 +1,172 @@
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .compiled_functions import compile_gradient, compile_hessian
+
+DEFAULT_BOX = (-10, 10)
+
+
+def prepare_bounds(bounds: Sequence[Optional[Sequence[float]]], box: tuple = DEFAULT_BOX) -> np.ndarray:
+    """
+    Функция заменяет отсутствующие и бесконечные границы на конечные, чтобы по ним можно было построить сетку.
+
+    Parameters
+    ----------
+    bounds: Sequence[Optional[Sequence[float]]]
+        Границы по каждой переменной, None если границ нет.
+    box: tuple
+        Границы, которые используются вместо бесконечных.
+
+    Returns
+    -------
+    np.ndarray
+        Массив n × 2 с конечными границами.
+    """
+
+    width = box[1] - box[0]
+    finite_bounds = []
+    for lim in bounds:
+        low, high = lim if lim is not None else (-np.inf, np.inf)
+        if np.isfinite(low) and np.isfinite(high):
+            finite_bounds.append((low, high))
+        elif np.isfinite(low):
+            finite_bounds.append((low, low + width))
+        elif np.isfinite(high):
+            finite_bounds.append((high - width, high))
+        else:
+            finite_bounds.append(box)
+    return np.array(finite_bounds, dtype=np.float64)
+
+
+def stack_values(values, shape: tuple) -> np.ndarray:
+    """
+    Функция собирает результат лямбдифицированного списка или матрицы sympy в один массив. Постоянные элементы
+    (например, вторая производная x ** 2) возвращаются lambdify числами, поэтому они растягиваются до shape.
+
+    Parameters
+    ----------
+    values: list
+        Вложенный список значений, каждое из которых число или массив формы shape.
+    shape: tuple
+        Форма массива для одного элемента.
+
+    Returns
+    -------
+    np.ndarray
+        Массив формы shape + форма списка values.
+    """
+
+    if isinstance(values, (list, tuple)):
+        return np.stack([stack_values(value, shape) for value in values], axis=-1)
+    return np.broadcast_to(np.asarray(values, dtype=np.float64), shape)
+
+
+def find_critical_points(func, variables: Sequence, bounds: Sequence[Optional[Sequence[float]]],
+                         seeds: int = 400, max_iter: int = 100, tol: float = 1e-9,
+                         time_budget: float = 2.0, max_halvings: int = 8) -> np.ndarray:
+    """
+    Функция численно находит критические точки функции: точки, в которых градиент равен нулю.
+
+    В области строятся две равномерные сетки начальных точек: на всей области и на ее центральной десятой части
+    (в больших размерностях точки выбираются случайно). Из всех них одновременно запускается метод Ньютона
+    для системы grad f = 0 (градиент и гессиан берутся из общего кэша скомпилированных функций). Шаг метода
+    уменьшается, если он не уменьшает норму градиента. Сошедшиеся точки, попавшие в границы, объединяются,
+    если находятся ближе 1e-5 от размера области.
+
+    Parameters
+    ----------
+    func: sympy выражение
+        Функция.
+    variables: Sequence
+        Переменные функции из sympy.symbols.
+    bounds: Sequence[Optional[Sequence[float]]]
+        Границы по каждой переменной, None если границ нет. Без границ точки ищутся в DEFAULT_BOX.
+    seeds: int
+        Примерное количество начальных точек.
+    max_iter: int
+        Максимальное количество итераций метода Ньютона.
+    tol: float
+        Точность: точка считается сошедшейся, когда шаг метода становится меньше tol (относительно размера области).
+    time_budget: float
+        Ограничение по времени в секундах. По его истечении возвращаются точки, которые уже сошлись.
+    max_halvings: int
+        Максимальное количество уменьшений шага за итерацию.
+
+    Returns
+    -------
+    np.ndarray
+        Массив k × n с координатами найденных критических точек.
+    """
+
+    started = time.perf_counter()
+    n = len(variables)
+    gradient = compile_gradient(func, tuple(variables))
+    hessian = compile_hessian(func, tuple(variables))
+
+    box = prepare_bounds(bounds)
+    center = box.mean(axis=1)
+    per_axis = max(3, int(round((seeds / 2) ** (1 / n)))) | 1  # нечетное количество, чтобы центр попал в сетку
+    grids = []
+    for scale in (1, 0.1):
+        # Вторая, мелкая сетка в центре области находит точки функций, которые быстро меняются около нуля
+        low = center + (box[:, 0] - center) * scale
+        high = center + (box[:, 1] - center) * scale
+        if per_axis ** n <= seeds:
+            axes = [np.linspace(*lim, per_axis) for lim in zip(low, high)]
+            grids.append(np.stack([axis.ravel() for axis in np.meshgrid(*axes, indexing='ij')], axis=-1))
+        else:
+            # В больших размерностях сетка слишком велика, поэтому точки выбираются случайно
+            grids.append(np.random.default_rng(0).uniform(low, high, size=(seeds // 2, n)))
+    points = np.concatenate(grids + [center[None, :]])
+    # Небольшой сдвиг, чтобы начальные точки не попадали точно в особые точки вроде x = 0
+    points = points + (box[:, 1] - box[:, 0]) * 1e-7
+
+    max_step = np.linalg.norm(box[:, 1] - box[:, 0])
+    active = np.ones(len(points), dtype=bool)
+    converged = np.zeros(len(points), dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            if not active.any() or time.perf_counter() - started > time_budget:
+                break
+            current = points[active]
+            grad = stack_values(gradient(*current.T), (len(current),))
+            hess = stack_values(hessian(*current.T), (len(current),))
+
+            grad_norm = np.linalg.norm(grad, axis=1)
+            broken = ~np.isfinite(grad_norm) | ~np.isfinite(hess).all(axis=(1, 2))
+            step = np.zeros_like(current)
+            step[~broken] = (np.linalg.pinv(hess[~broken]) @ grad[~broken][..., None])[..., 0]
+            step_norm = np.linalg.norm(step, axis=1)
+            too_long = step_norm > max_step
+            step[too_long] *= (max_step / step_norm[too_long])[:, None]
+
+            # Демпфирование: шаг уменьшается вдвое, пока норма градиента в новой точке не станет меньше
+            shrink = ~broken
+            for _ in range(max_halvings):
+                new_grad = stack_values(gradient(*(current[shrink] - step[shrink]).T), (int(shrink.sum()),))
+                worse = ~(np.linalg.norm(new_grad, axis=1) < grad_norm[shrink])
+                shrink[shrink] = worse
+                if not shrink.any():
+                    break
+                step[shrink] /= 2
+            step_norm = np.linalg.norm(step, axis=1)
+
+            done = ~broken & (step_norm <= tol * max_step) & (grad_norm < np.sqrt(tol))
+            indices = np.flatnonzero(active)
+            points[indices] = current - step
+            converged[indices[done]] = True
+            active[indices[done | broken]] = False
+
+    found = points[converged]
+    found = found[((box[:, 0] <= found) & (found <= box[:, 1])).all(axis=1)]
+    if len(found) == 0:
+        return np.empty((0, n))
+
+    clusters = []
+    for point in np.unique(np.round(found, 6), axis=0):
+        if not clusters or np.min(np.linalg.norm(np.array(clusters) - point, axis=1)) > 1e-5 * max_step:
+            clusters.append(point)
+    return np.round(clusters, 8) + 0.0
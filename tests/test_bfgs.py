@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+import sympy as sp
+
+from solver_core.one_dim_opt.bfgs import BFGS
+from solver_core.one_dim_opt.benchmark import extended_rosenbrock, extended_rosenbrock_gradient, rosenbrock_start
+
+x, y = sp.symbols('x y')
+
+
+@pytest.mark.parametrize('method', ['bfgs', 'lbfgs'])
+def test_rosenbrock(method):
+    result = BFGS((1 - x) ** 2 + 100 * (y - x ** 2) ** 2, (-1.2, 1), method=method).solve()
+    assert result.converged
+    assert np.allclose(result.x, [1, 1], atol=1e-5)
+
+
+def test_lbfgs_for_many_variables():
+    solver = BFGS(extended_rosenbrock, rosenbrock_start(400), grad=extended_rosenbrock_gradient)
+    result = solver.solve()
+    assert solver.method == 'lbfgs'
+    assert result.converged
+    assert np.allclose(result.x, 1, atol=1e-4)
+
+
+def test_finite_difference_calls_are_counted():
+    def himmelblau(v):
+        return (v[0] ** 2 + v[1] - 11) ** 2 + (v[0] + v[1] ** 2 - 7) ** 2
+
+    solver = BFGS(himmelblau, (0, 0), tol=1e-5)
+    result = solver.solve()
+    assert result.converged
+    assert himmelblau(result.x) < 1e-9
+    # Каждое вычисление градиента - еще 2n вычислений функции
+    assert result.nfev == solver.ngev * (1 + 2 * 2)
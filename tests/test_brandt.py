@@ -0,0 +1,45 @@
+import time
+
+import numpy as np
+import sympy as sp
+
+from solver_core.one_dim_opt.brandt import Brandt, GOLDEN_STEP, PARABOLIC_STEP, TRACE_COLUMNS
+
+x = sp.symbols('x')
+
+
+def test_converges_with_parabolic_steps():
+    solver = Brandt(sp.exp(x) - 2 * x, (-1, 3), tol=1e-8)
+    result = solver.solve()
+    assert solver.status == 'tol' and result.converged
+    assert abs(result.x - np.log(2)) < 1e-7
+    assert solver.trace.shape == (result.nfev, len(TRACE_COLUMNS))
+    assert PARABOLIC_STEP in solver.trace[:, 4]
+    # Отрезок в трассе только сужается
+    widths = solver.trace[:, 3] - solver.trace[:, 2]
+    assert np.all(np.diff(widths) <= 0)
+
+
+def test_evaluation_budget():
+    solver = Brandt(sp.cos(x), (0, 6), tol=1e-12, max_fev=6)
+    result = solver.solve()
+    assert solver.status == 'max_fev' and not result.converged
+    assert result.nfev == 6 and len(solver.trace) == 6
+
+
+def test_time_budget():
+    def slow(t):
+        time.sleep(0.01)
+        return (t - 1) ** 2
+
+    solver = Brandt(slow, (0, 3), tol=1e-12, time_budget=0.05)
+    result = solver.solve()
+    assert solver.status == 'time_budget' and not result.converged
+    assert result.nfev < 20
+
+
+def test_non_smooth_function_uses_golden_steps():
+    solver = Brandt(sp.Abs(x - 1), (0, 3), tol=1e-8)
+    result = solver.solve()
+    assert result.converged and abs(result.x - 1) < 1e-7
+    assert GOLDEN_STEP in solver.trace[:, 4]
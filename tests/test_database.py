@@ -0,0 +1,42 @@
+import sqlite3
+import threading
+
+from vk_bot.database import ConnectionPool
+
+
+def test_failed_connect_releases_its_slot(tmp_path, monkeypatch):
+    pool = ConnectionPool(str(tmp_path / 'bot.db'), size=2)
+    assert pool.created == 1
+
+    def broken_connection():
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(pool, 'create_connection', broken_connection)
+    errors = []
+
+    def open_connections():
+        for _ in range(3):
+            try:
+                with pool.connection():
+                    pass
+            except sqlite3.OperationalError as error:
+                errors.append(error)
+
+    with pool.connection():
+        # Без освобождения места второй вызов ждал бы соединение вечно
+        thread = threading.Thread(target=open_connections, daemon=True)
+        thread.start()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+    assert len(errors) == 3
+    assert pool.created == 1
+
+
+def test_connections_are_reused(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'bot.db'), size=3)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    assert pool.created == 1
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from vk_bot import deduplication
+from vk_bot.database import BotDatabase
+from vk_bot.deduplication import EventDeduplicator
+
+
+def event(event_id):
+    return {'event_id': event_id, 'object': {'message': {'from_id': 7, 'id': 1}}}
+
+
+def test_event_id_falls_back_to_message_id():
+    assert EventDeduplicator.get_event_id({'object': {'message': {'from_id': 7, 'id': 15}}}) == '7:15'
+    assert EventDeduplicator.get_event_id(
+        {'object': {'message': {'from_id': 7, 'id': 0, 'conversation_message_id': 3}}}) == '7:3'
+
+
+def test_events_are_forgotten_after_ttl(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(deduplication, 'time', SimpleNamespace(monotonic=lambda: clock.now, time=lambda: clock.now))
+    deduplicator = EventDeduplicator(ttl=10)
+    assert not deduplicator.is_duplicate(event('a'))
+    clock.now = 5
+    assert deduplicator.is_duplicate(event('a'))
+    assert not deduplicator.is_duplicate(event('b'))
+    clock.now = 12
+    assert not deduplicator.is_duplicate(event('a'))
+    assert deduplicator.is_duplicate(event('b'))
+    assert list(deduplicator.events) == ['b', 'a']
+
+
+def test_duplicates_are_found_across_processes(tmp_path):
+    db = BotDatabase(str(tmp_path / 'bot.db'))
+    first, second = EventDeduplicator(db=db), EventDeduplicator(db=db)
+    assert not first.is_duplicate(event('a'))
+    # У второго объекта своя память, как у другого процесса сервера, событие находится в базе данных
+    assert second.is_duplicate(event('a'))
+    assert not second.is_duplicate(event('b'))
+    assert first.is_duplicate(event('b'))
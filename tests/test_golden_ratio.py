@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import sympy as sp
+
+from solver_core.one_dim_opt.golden_ratio import GoldenRatio, PHI
+
+x = sp.symbols('x')
+
+
+def test_single_interval():
+    result = GoldenRatio((x - 2) ** 2, (0, 5), tol=1e-8).solve()
+    assert result.converged
+    assert abs(result.x - 2) < 1e-8
+    # Отрезок сокращается в 1 / PHI раз за итерацию, функция вычисляется один раз за итерацию
+    assert result.nit == math.ceil(math.log(1e-8 / 5) / math.log(PHI))
+    assert result.nfev == result.nit + 2
+
+
+def test_batch_matches_single_intervals():
+    intervals = np.array([[0, 5], [-1, 1], [2, 3], [0, 0.5]])
+    batch = GoldenRatio((x - 2) ** 2, intervals, tol=1e-6).solve()
+    for i, interval in enumerate(intervals):
+        single = GoldenRatio((x - 2) ** 2, interval, tol=1e-6).solve()
+        assert batch.x[i] == single.x and batch.nit[i] == single.nit
+    assert np.allclose(batch.x, [2, 1, 2, 0.5], atol=1e-6)
+    assert batch.converged.all()
+
+
+def test_callback_stops_the_search():
+    calls = []
+
+    def callback(nit, point, value):
+        calls.append(nit)
+        return nit == 3
+
+    result = GoldenRatio(sp.cos(x), (0, 6), callback=callback).solve()
+    assert calls == [1, 2, 3]
+    assert result.nit == 3 and not result.converged
@@ -0,0 +1,31 @@
+import time
+
+import sympy as sp
+
+from solver_core.search_for_extremes import local_extr
+from solver_core.search_for_extremes.local_extr import find_edge_extr
+
+x, y = sp.symbols('x y')
+
+# sympy.solve не решает x + cos(x) = 0, поэтому корень на границе y = 0 ищется численно
+EDGE_FUNC = x ** 2 / 2 + sp.sin(x) + y
+
+
+def test_edge_root_is_found_numerically():
+    points, _, _ = find_edge_extr(EDGE_FUNC, (x, y), 0, 0, (-3, 3), (0, 1), time.monotonic() + 5)
+    assert len(points) == 1
+    assert abs(points[0][0] + 0.7390851) < 1e-6 and points[0][1] == 0
+
+
+def test_edge_numeric_search_gets_time_left_until_deadline(monkeypatch):
+    budgets = []
+
+    def find_critical_points(*args, time_budget, **kwargs):
+        budgets.append(time_budget)
+        return real_find_critical_points(*args, time_budget=time_budget, **kwargs)
+
+    real_find_critical_points = local_extr.find_critical_points
+    monkeypatch.setattr(local_extr, 'find_critical_points', find_critical_points)
+    find_edge_extr(EDGE_FUNC, (x, y), 0, 0, (-3, 3), (0, 1), time.monotonic() + 5)
+    find_edge_extr(EDGE_FUNC, (x, y), 0, 0, (-3, 3), (0, 1), time.monotonic() - 1)
+    assert 0 < budgets[0] < 5 and budgets[1] == 0
@@ -0,0 +1,37 @@
+import sympy as sp
+
+from solver_core.search_for_extremes.local_extr_kkt import LocalExtrKKT
+
+x, y, z = sp.symbols('x y z')
+
+
+def test_equality_constrained_minimum():
+    solver = LocalExtrKKT([x, y], x ** 2 + y ** 2, equalities=[x + y - 1])
+    solver.solve()
+    assert solver.points[['x', 'y', 'f_value', 'type']].values.tolist() == [[0.5, 0.5, 0.5, 'global min']]
+
+
+def test_inequality_multiplier_sign_decides_type():
+    # Минимум (x - 2)^2 при x <= 1 лежит на границе, множитель положительный
+    solver = LocalExtrKKT([x, y], (x - 2) ** 2 + y ** 2, inequalities=[x <= 1])
+    solver.solve()
+    assert solver.points[['x', 'y', 'type']].values.tolist() == [[1.0, 0.0, 'global min']]
+
+
+def test_parametric_active_set_keeps_exact_solutions():
+    solver = LocalExtrKKT([x, y, z], x * y * z, equalities=[x + y + z - 3], inequalities=[-x, -y, -z])
+    answer = solver.solve()
+    assert not solver.numeric
+    assert 'численно' not in answer
+    assert 'unknown' not in set(solver.points['type'])
+    assert [1.0, 1.0, 1.0, 'global max'] in solver.points[['x', 'y', 'z', 'type']].values.tolist()
+    assert len(solver.families) == 3
+    assert 'Бесконечное множество точек: x = 0, y = 3 - z' in answer
+
+
+def test_numeric_method_finds_points():
+    solver = LocalExtrKKT([x, y], x ** 2 + y ** 2, equalities=[x + y - 1], method='numeric')
+    solver.solve()
+    point = solver.points.iloc[0]
+    assert abs(point['x'] - 0.5) < 1e-5 and abs(point['y'] - 0.5) < 1e-5
+    assert point['type'] == 'global min'
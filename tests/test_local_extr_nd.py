@@ -0,0 +1,30 @@
+import sympy as sp
+
+from solver_core.search_for_extremes.local_extr_nd import LocalExtrND
+
+x, y, z = sp.symbols('x y z')
+
+
+def test_variable_named_z_is_not_overwritten_by_function_value():
+    solver = LocalExtrND([x, y, z], (x - 1) ** 2 + (y + 2) ** 2 + (z - 3) ** 2 + 5)
+    solver.solve()
+    point = solver.points.iloc[0]
+    assert (point['x'], point['y'], point['z'], point['f_value']) == (1.0, -2.0, 3.0, 5.0)
+
+
+def test_labels_match_two_variable_solver(tmp_path, monkeypatch):
+    from solver_core.search_for_extremes.local_extr import LocalExtr
+
+    monkeypatch.chdir(tmp_path)  # LocalExtr.solve сохраняет график в текущую папку
+    nd = LocalExtrND([x, y], x ** 2 + y ** 2)
+    nd.solve()
+    two_dim = LocalExtr([x, y], x ** 2 + y ** 2)
+    two_dim.solve()
+    assert list(nd.points['type']) == list(two_dim.points['types']) == ['global min']
+
+    saddle = LocalExtrND([x, y, z], x ** 2 - y ** 2 - z ** 2)
+    saddle.solve()
+    assert list(saddle.points['type']) == ['saddle']
+    maximum = LocalExtrND([x, y, z], -x ** 2 - y ** 2 - z ** 2)
+    maximum.solve()
+    assert list(maximum.points['type']) == ['global max']
@@ -0,0 +1,24 @@
+import numpy as np
+import sympy as sp
+
+from solver_core.search_for_extremes.local_extr_with_restr import LocalExtrWithRestrictions
+
+x, y = sp.symbols('x y')
+
+
+def test_classification_on_circle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    solver = LocalExtrWithRestrictions([x, y], x + y, x ** 2 + y ** 2 - 2, headless=True)
+    points, _ = solver.solve()
+    assert sorted(points[['x', 'y', 'types']].values.tolist()) == [[-1.0, -1.0, 'min'], [1.0, 1.0, 'max']]
+
+
+def test_non_real_determinant_is_unknown():
+    solver = LocalExtrWithRestrictions([x, y], x + y, x + y, headless=True)
+    lam = solver.lam
+    hessian = sp.Matrix([[sp.sqrt(x), 0], [0, 1]])
+    points = [{x: -1, y: 0, lam: 0}, {x: 4, y: 0, lam: 0}]
+    determinants = solver.hessian_determinants(hessian, points)
+    assert np.isnan(determinants[0]) and determinants[1] == 2
+    assert solver.type_dot(determinants[0])['type'] == 'unknown'
+    assert solver.type_dot(0.0)['type'] == 'saddle'
@@ -0,0 +1,32 @@
+import numpy as np
+import sympy as sp
+
+from solver_core.search_for_extremes.numeric_solver import find_critical_points, prepare_bounds, stack_values
+
+x, y = sp.symbols('x y')
+
+
+def test_prepare_bounds_replaces_infinite_limits():
+    bounds = prepare_bounds([(0, 1), None, (2, np.inf), (-np.inf, 3)])
+    assert bounds.tolist() == [[0, 1], [-10, 10], [2, 22], [-17, 3]]
+
+
+def test_stack_values_broadcasts_constants():
+    values = stack_values([[np.arange(3.0), 2], [0, np.ones(3)]], (3,))
+    assert values.shape == (3, 2, 2)
+    assert values[1].tolist() == [[1, 0], [2, 1]]
+
+
+def test_polynomial_critical_points():
+    points = find_critical_points(x ** 3 - 3 * x + y ** 3 - 3 * y, [x, y], [(-2, 2), (-2, 2)])
+    expected = [[-1, -1], [-1, 1], [1, -1], [1, 1]]
+    assert sorted(points.tolist()) == expected
+
+
+def test_periodic_function_inside_bounds():
+    points = find_critical_points(sp.sin(x) * sp.sin(y), [x, y], [(0.1, 6.2), (0.1, 6.2)])
+    half = np.pi / 2
+    expected = [(half, half), (half, 3 * half), (3 * half, half), (3 * half, 3 * half), (np.pi, np.pi)]
+    assert len(points) == len(expected)
+    for point in expected:
+        assert np.min(np.linalg.norm(points - point, axis=1)) < 1e-6
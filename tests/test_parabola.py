@@ -0,0 +1,30 @@
+import sympy as sp
+
+from solver_core.one_dim_opt.parabola import Parabola
+
+x = sp.symbols('x')
+
+
+def test_quadratic_converges_in_few_evaluations():
+    result = Parabola((x - 2) ** 2, [0, 5], tol=1e-8).solve()
+    assert result.converged
+    assert abs(result.x - 2) < 1e-8
+    assert result.nfev <= 6
+
+
+def test_smooth_function_beats_golden_section():
+    solver = Parabola(sp.cos(x), [0, 6], tol=1e-8)
+    result = solver.solve()
+    assert abs(result.x - float(sp.pi)) < 1e-7
+    assert result.nfev < 20
+    assert len(solver.iter_times) == result.nit
+
+
+def test_values_are_memoized_between_solves():
+    calls = []
+    solver = Parabola(lambda t: calls.append(t) or (t - 1) ** 2, [0, 3])
+    solver.solve()
+    evaluations = solver.nfev
+    solver.solve()
+    assert solver.nfev == evaluations == len(calls)
+    assert solver.ncalls > solver.nfev
@@ -0,0 +1,40 @@
+from vk_bot.database import BotDatabase
+from vk_bot.session import Session
+
+
+class CountingDatabase(BotDatabase):
+    def __init__(self, name_db):
+        super().__init__(name_db)
+        self.selects = 0
+        self.transactions = []
+
+    def select(self, query, input_value=None):
+        self.selects += 1
+        return super().select(query, input_value)
+
+    def transaction(self, queries):
+        self.transactions.append(queries)
+        super().transaction(queries)
+
+
+def test_one_load_and_one_flush_per_message(tmp_path):
+    db = CountingDatabase(str(tmp_path / 'bot.db'))
+    session = Session(db, 7)
+    assert not session.user_exists and session.get('status') is None
+    session.register_user('Ann', 'B')
+    session.register_extremes()
+    session.set('status', 'extremum')
+    session.set('func', 'x**2 + y**2')
+    session.set('func', 'x*y')
+    assert session.get('func') == 'x*y'
+    assert db.selects == 1 and db.transactions == []
+
+    session.flush()
+    assert len(db.transactions) == 1 and len(db.transactions[0]) == 4
+    session.flush()
+    assert len(db.transactions) == 1
+
+    session = Session(db, 7)
+    assert db.selects == 2
+    assert session.user_exists and session.extremes_exists
+    assert (session.get('status'), session.get('step'), session.get('func')) == ('extremum', 'start', 'x*y')
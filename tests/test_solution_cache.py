@@ -0,0 +1,40 @@
+import itertools
+
+import plotly.graph_objects as go
+
+from solver_core.search_for_extremes.handlers import solution_cache
+from solver_core.search_for_extremes.handlers.solution_cache import SolutionCache, canonical_key
+
+
+def test_key_ignores_variable_names_and_formatting():
+    assert canonical_key('x y', 'x**2 + y') == canonical_key('a b', 'b + a ** 2')
+    assert canonical_key('x y', 'x**2 + y') != canonical_key('y x', 'x**2 + y')
+    assert canonical_key('x y', 'x*y', 'x + y - 1') != canonical_key('x y', 'x*y')
+    assert canonical_key('x y', 'x*y', solver='LocalExtrWithRestrictions') != canonical_key('x y', 'x*y')
+
+
+def test_intervals_are_part_of_key_only_with_restrictions():
+    assert canonical_key('x y', 'x*y', interval_x='0 1', interval_y='0 1') == canonical_key('x y', 'x*y')
+    assert canonical_key('x y', 'x*y', interval_x='0 1', interval_y='0 1', restr=True) != \
+        canonical_key('x y', 'x*y', interval_x='0 2', interval_y='0 1', restr=True)
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(solution_cache.time, 'time', lambda: next(clock))
+    cache = SolutionCache(str(tmp_path / 'solutions.db'), max_entries=2)
+    figure = go.Figure(go.Scatter(x=[0, 1], y=[1, 0]))
+    cache.put('a', 'answer a', figure)
+    cache.put('b', 'answer b', None)
+    assert cache.get('a')[0] == 'answer a'
+    cache.put('c', 'answer c', None)
+    assert cache.get('b') is None
+    answer, plot = cache.get('a')
+    assert answer == 'answer a' and list(plot.data[0].x) == [0, 1]
+    assert cache.get('c') == ('answer c', None)
+
+
+def test_entries_over_size_limit_are_not_stored(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'solutions.db'), max_bytes=10)
+    cache.put('a', 'a long answer', None)
+    assert cache.get('a') is None
@@ -0,0 +1,50 @@
+import os
+import time
+
+import pytest
+
+from solver_core.search_for_extremes.handlers.supervisor import (SolverLimitExceeded, get_limit_counters,
+                                                                  run_supervised, run_supervised_many)
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def allocate(megabytes):
+    block = bytearray(megabytes * 2 ** 20)
+    time.sleep(5)
+    return len(block)
+
+
+def test_result_and_child_exception():
+    assert run_supervised(divmod, (7, 3)) == (2, 1)
+    with pytest.raises(ValueError, match='bad input'):
+        run_supervised(fail, ('bad input',))
+
+
+def test_wall_time_kills_child_and_is_counted():
+    before = get_limit_counters()['wall_time']
+    started = time.monotonic()
+    with pytest.raises(SolverLimitExceeded) as error:
+        run_supervised(time.sleep, (30,), wall_time=0.3)
+    assert error.value.limit == 'wall_time'
+    assert time.monotonic() - started < 5
+    assert get_limit_counters()['wall_time'] == before + 1
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason='память процесса читается из /proc')
+def test_memory_limit():
+    with pytest.raises(SolverLimitExceeded) as error:
+        run_supervised(allocate, (200,), memory_limit=100)
+    assert error.value.limit == 'memory'
+
+
+def test_many_calls_keep_order_and_share_deadline():
+    started = time.monotonic()
+    outcomes = run_supervised_many([(divmod, (7, 3), None), (time.sleep, (30,), None), (fail, ('bad',), None),
+                                    (pow, (2, 10), None)], wall_time=1, max_workers=2)
+    assert time.monotonic() - started < 5
+    assert outcomes[0] == (2, 1) and outcomes[3] == 1024
+    assert isinstance(outcomes[1], SolverLimitExceeded) and outcomes[1].limit == 'wall_time'
+    assert isinstance(outcomes[2], ValueError)
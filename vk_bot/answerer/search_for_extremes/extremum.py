@@ -1,11 +1,9 @@
-from vk_bot.database import BotDatabase
-from vk_bot.sql_queries import Select, Insert, Update
+from vk_bot.session import Session
 
 
 class Extremum:
-    def __init__(self, db: BotDatabase, user_id: int):
-        self.db = db
-        self.user_id = user_id
+    def __init__(self, session: Session):
+        self.session = session
 
     def get_step(self) -> str:
         """
@@ -17,65 +15,58 @@ class Extremum:
             Шаг, на котором находится пользователь, для решения задачи.
         """
 
-        if not self.db.select(Select.EXTREMES_STEP, (self.user_id,)):
+        if not self.session.extremes_exists:
             self.registration()
-        return self.db.select(Select.EXTREMES_STEP, (self.user_id,))[0]
+        return self.session.get('step')
 
     def get_type(self):
-        return self.db.select(Select.EXTREMES_TYPE, (self.user_id,))[0]
+        return self.session.get('type')
 
     def get_restr(self):
-        return self.db.select(Select.EXTREMES_RESTR, (self.user_id,))[0]
+        return self.session.get('restr')
 
     def get_vars(self):
-        return self.db.select(Select.EXTREMES_VARS, (self.user_id,))[0]
+        return self.session.get('vars')
 
     def get_params(self, task_type, interval):
         if task_type == 'common':
-            if interval == 'with_int':
-                return self.db.select(Select.EXTREMES_WITH_INT, (self.user_id,))
-            else:
-                print(self.db.select(Select.EXTREMES_WITHOUT_INT, (self.user_id,)))
-                return self.db.select(Select.EXTREMES_WITHOUT_INT, (self.user_id,))
+            fields = ['vars', 'func']
         else:
-            if interval == 'with_int':
-                return self.db.select(Select.EXTREMES_RESTR_WITH_INT, (self.user_id,))
-            else:
-                return self.db.select(Select.EXTREMES_RESTR_WITHOUT_INT, (self.user_id,))
+            fields = ['vars', 'func', 'g_func']
+        if interval == 'with_int':
+            fields += ['interval_x', 'interval_y']
+        return tuple(self.session.get(field) for field in fields)
 
     def update_step(self, step: str):
-        self.db.update(Update.EXTREMES_STEP, (step, self.user_id))
+        self.session.set('step', step)
 
     def update_type(self, task_type: str):
-        self.db.update(Update.EXTREMES_TYPE, (task_type, self.user_id))
+        self.session.set('type', task_type)
 
     def update_restr(self, restr: bool):
         if restr:
-            self.db.update(Update.EXTREMES_RESTR, (1, self.user_id))
+            self.session.set('restr', 1)
         else:
-            self.db.update(Update.EXTREMES_RESTR, (0, self.user_id))
+            self.session.set('restr', 0)
 
     def update_vars(self, vars):
-        self.db.update(Update.EXTREMES_VARS, (vars, self.user_id))
+        self.session.set('vars', vars)
 
     def update_func(self, func):
-        self.db.update(Update.EXTREMES_FUNC, (func, self.user_id))
+        self.session.set('func', func)
 
     def update_g_func(self, g_func):
-        self.db.update(Update.EXTREMES_G_FUNC, (g_func, self.user_id))
+        self.session.set('g_func', g_func)
 
     def update_interval_x(self, interval_x):
-        self.db.update(Update.EXTREMES_INTERVAL_X, (interval_x, self.user_id))
+        self.session.set('interval_x', interval_x)
 
     def update_interval_y(self, interval_y):
-        self.db.update(Update.EXTREMES_INTERVAL_Y, (interval_y, self.user_id))
+        self.session.set('interval_y', interval_y)
 
     def registration(self):
         """
         Регистрация пользователя в базе данных в таблице extremum.
         """
 
-        self.db.insert(Insert.EXTREMES, (self.user_id,))
-
-
-
+        self.session.register_extremes()
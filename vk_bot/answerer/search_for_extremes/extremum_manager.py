@@ -25,7 +25,7 @@ class ExtremumManager:
         self.vk_api_method = vk_api_method
         self.db = db
         self.user = user
-        self.extremum = Extremum(db, user.user_id)
+        self.extremum = Extremum(user.session)
         self.step = self.extremum.get_step()
         self.type = self.extremum.get_type()
         self.restr = self.extremum.get_restr()
@@ -59,7 +59,7 @@ class ExtremumManager:
             return self.handlers.input_vars()
 
         if self.step == 'input_vars':
-            return self.handlers.vars(text)
+            return self.handlers.vars(text, self.type)
 
         if self.step == 'input_func':
             return self.handlers.func(text, self.type)
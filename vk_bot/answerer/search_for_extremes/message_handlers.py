@@ -1,16 +1,23 @@
 from vk_api.vk_api import VkApiMethod
 
+from solver_core.search_for_extremes.drawing_func import save_fig_to_pic
 from solver_core.search_for_extremes.handlers.input_validation import check_variables, check_restr_func, \
     check_expression, check_limits
 from solver_core.search_for_extremes.handlers.preprocessing import prepare_data
+from solver_core.search_for_extremes.handlers.solution_cache import SolutionCache, canonical_key
 from solver_core.search_for_extremes.local_extr import LocalExtr
+from solver_core.search_for_extremes.local_extr_nd import LocalExtrND
+from solver_core.search_for_extremes.local_extr_with_restr import LocalExtrWithRestrictions
 from vk_bot.answerer.response_init import Response
 from vk_bot.answerer.search_for_extremes.extremum import Extremum
 from vk_bot.answerer.search_for_extremes.keyboards import Keyboards
 from vk_bot.answerer.search_for_extremes.scripted_phrases import Phrases
+from vk_bot.config import SOLUTION_CACHE_PATH
 from vk_bot.database import BotDatabase
 from vk_bot.user import User
 
+solution_cache = SolutionCache(SOLUTION_CACHE_PATH)
+
 
 class Handlers:
     """
@@ -62,15 +69,18 @@ class Handlers:
         self.response.set_text(Phrases.INPUT_VARS)
         return self.response
 
-    def vars(self, text) -> Response:
+    def vars(self, text, task_type) -> Response:
         """
         Обработка введенных именных переменных. Предложение ввести функцию.
+        В обычной задаче допускается больше двух переменных.
         Шаг: input_func
 
         Parameters
         ----------
         text : str
             Текст сообщения, отправленного пользователем.
+        task_type : str
+            Тип задачи.
 
         Returns
         -------
@@ -78,7 +88,7 @@ class Handlers:
             Сообщение для пользователя.
         """
         try:
-            vars = check_variables(text)
+            vars = check_variables(text, n_vars=None if task_type == 'common' else 2)
             self.extremum.update_vars(vars)
             self.response.set_text(Phrases.INPUT_FUNC)
             self.extremum.update_step('input_func')
@@ -91,7 +101,11 @@ class Handlers:
             vars = self.extremum.get_vars()
             func = check_expression(text, vars)
             self.extremum.update_func(func)
-            if task_type == 'common':
+            if task_type == 'common' and len(vars.split()) > 2:
+                # Для функции многих переменных ограничения не вводятся и график не строится
+                self.extremum.update_restr(False)
+                return self.precompute()
+            elif task_type == 'common':
                 self.response.set_text(Phrases.INPUT_RESTR)
                 self.response.set_keyboard(Keyboards().for_input_restr())
                 self.extremum.update_step('input_restr')
@@ -147,14 +161,24 @@ class Handlers:
         return self.response
 
     def local_extr(self, restr) -> Response:
+        if len(self.extremum.get_vars().split()) > 2:
+            return self.local_extr_nd()
         if restr:
             vars, func, interval_x, interval_y = self.extremum.get_params(self.extremum.get_type(), 'with_int')
-            param = prepare_data(vars=vars, func=func, interval_x=interval_x, interval_y=interval_y)
         else:
             vars, func = self.extremum.get_params(self.extremum.get_type(), 'without_int')
-            param = prepare_data(vars=vars, func=func)
-        solver = LocalExtr(**param, restr=restr)
-        result = solver.solve()
+            interval_x, interval_y = None, None
+        key = canonical_key(vars, func, interval_x=interval_x, interval_y=interval_y, restr=restr)
+        cached = solution_cache.get(key)
+        if cached:
+            result, plot = cached
+            save_fig_to_pic(plot, 'graph', ['html'])
+        else:
+            param = prepare_data(vars=vars, func=func, interval_x=interval_x, interval_y=interval_y)
+            solver = LocalExtr(**param, restr=restr)
+            result = solver.solve()
+            if not solver.timed_out:
+                solution_cache.put(key, result, solver.plot)
         link = Phrases.LINK
         self.response.set_text(result+link)
         self.response.set_keyboard(Keyboards().for_menu())
@@ -162,15 +186,42 @@ class Handlers:
         self.user.update_status('menu')
         return self.response
 
+    def local_extr_nd(self) -> Response:
+        vars, func = self.extremum.get_params('common', 'without_int')
+        key = canonical_key(vars, func, solver='LocalExtrND')
+        cached = solution_cache.get(key)
+        if cached:
+            result, _ = cached
+        else:
+            param = prepare_data(vars=vars, func=func)
+            solver = LocalExtrND(param['vars'], param['func'])
+            result = solver.solve()
+            if not solver.timed_out:
+                solution_cache.put(key, result, None)
+        self.response.set_text(result)
+        self.response.set_keyboard(Keyboards().for_menu())
+        self.extremum.update_step('start')
+        self.user.update_status('menu')
+        return self.response
+
     def local_extr_with_restr(self, restr) -> Response:
         if restr:
             vars, func, g_func, interval_x, interval_y = self.extremum.get_params(self.extremum.get_type(), 'with_int')
-            param = prepare_data(vars=vars, func=func, interval_x=interval_x, interval_y=interval_y)
         else:
             vars, func, g_func = self.extremum.get_params(self.extremum.get_type(), 'without_int')
-            param = prepare_data(vars=vars, func=func)
-        solver = LocalExtr(**param)
-        result = solver.solve()
+            interval_x, interval_y = None, None
+        key = canonical_key(vars, func, g_func, interval_x, interval_y, restr, solver='LocalExtrWithRestrictions')
+        cached = solution_cache.get(key)
+        if cached:
+            result, plot = cached
+            save_fig_to_pic(plot, 'graph', ['html'])
+        else:
+            param = prepare_data(vars=vars, func=func, interval_x=interval_x, interval_y=interval_y, g_func=g_func)
+            solver = LocalExtrWithRestrictions(**param, headless=True)
+            points, plot = solver.solve()
+            result = solver.answer(points)
+            if not solver.timed_out:
+                solution_cache.put(key, result, plot)
         link = Phrases.LINK
         self.response.set_text(result + link)
         self.response.set_keyboard(Keyboards().for_menu())
@@ -12,7 +12,9 @@ class Phrases(NamedTuple):
     INPUT_VARS = 'Теперь тебе нужно ввести входные данные отдельными сообщениями.\n\n' \
                  'Начни с имен переменных. Они не могут начинаться с цифры,' \
                  'а также содержать что-то кроме латинских букв и цифр.\n\n' \
-                 'Пример: x y'
+                 'Пример: x y\n\n' \
+                 'В обычной задаче можно ввести до 10 переменных, но для функции больше чем двух переменных ' \
+                 'ограничения не задаются и график не строится.'
     INPUT_FUNC = 'Отлично!\n\n' \
                  f'Теперь введи функцию. Доступные имена: {", ".join(allowed_operations)}\n\n' \
                  'Пример: x**2 + 0.5 * y**2'
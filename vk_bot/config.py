@@ -9,3 +9,7 @@ ACCESS_TOKEN = os.environ.get("ACCESS_TOKEN")
 GROUP_ID = os.environ.get("GROUP_ID")
 CONFIRMATION_TOKEN = os.environ.get("CONFIRMATION_TOKEN")
 API_VERSION = '5.131'
+SOLUTION_CACHE_PATH = os.environ.get("SOLUTION_CACHE_PATH", 'solutions.db')
+SOLVER_WORKERS = int(os.environ.get("SOLVER_WORKERS", os.cpu_count() or 1))
+DEDUP_TTL = float(os.environ.get("DEDUP_TTL", 600))
+DEDUP_PERSISTENT = os.environ.get("DEDUP_PERSISTENT", "1") == "1"
@@ -1,22 +1,40 @@
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
+from queue import Queue, Empty
 from sqlite3 import Connection
-from typing import Any, Optional
+from typing import Any, Iterator, List, Optional
 
-from vk_bot.sql_queries import Create
+from vk_bot.sql_queries import Create, Pragma
 
 
-class BotDatabase:
+class ConnectionPool:
     """
-    Взаимодействие с базой данных.
+    Пул долгоживущих соединений с базой данных. Соединения создаются по мере необходимости, но не больше size,
+    и возвращаются в пул после использования. Одно соединение в каждый момент используется только одним потоком.
+
+    Parameters
+    ----------
+    name_db : str
+        Путь к файлу базы данных.
+    size : int
+        Максимальное количество соединений.
     """
 
-    def __init__(self):
-        self.name_db = 'bot.db'
-
-    def gen_database(self) -> Connection:
+    def __init__(self, name_db: str, size: int = 5):
+        self.name_db = name_db
+        self.size = size
+        self.pid = os.getpid()
+        self.connections = Queue(maxsize=size)
+        self.created = 0
+        self.lock = threading.Lock()
+        with self.connection() as connection:
+            self.gen_database(connection)
+
+    def create_connection(self) -> Connection:
         """
-        Создание базы данных, подключение к ней и генерация таблиц.
+        Создание нового соединения с включенным WAL и кэшем подготовленных запросов.
 
         Returns
         -------
@@ -24,34 +42,93 @@ class BotDatabase:
             Объект соединения с базой данных.
         """
 
-        table_creation_queries = [Create.USERS, Create.EXTREMES]
+        connection = sqlite3.connect(self.name_db, check_same_thread=False, cached_statements=128)
         try:
-            connection = sqlite3.connect(self.name_db)
-            for query in table_creation_queries:
-                cursor = connection.cursor()
-                cursor.execute(query)
-                connection.commit()
-            return connection
-        except sqlite3.Error as error:
-            print("Ошибка при CREATE запросе:", error)
+            for query in (Pragma.JOURNAL_MODE, Pragma.SYNCHRONOUS):
+                connection.execute(query)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def gen_database(connection: Connection):
+        """
+        Генерация таблиц. Выполняется один раз при создании пула.
 
-    def get_connection(self) -> Connection:
+        Parameters
+        ----------
+        connection : Connection
+            Объект соединения с базой данных.
         """
-        Подключение к базе данных.
+
+        with connection:
+            for query in (Create.USERS, Create.EXTREMES, Create.EVENTS):
+                connection.execute(query)
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """
+        Получение соединения из пула на время блока with.
 
         Returns
         -------
-        Connection
-             Объект соединения с базой данных.
+        Iterator[Connection]
+            Объект соединения с базой данных.
+        """
+
+        try:
+            connection = self.connections.get_nowait()
+        except Empty:
+            with self.lock:
+                can_create = self.created < self.size
+                if can_create:
+                    self.created += 1
+            if can_create:
+                try:
+                    connection = self.create_connection()
+                except Exception:
+                    # Место в пуле освобождается, иначе после size ошибок все следующие вызовы ждали бы вечно
+                    with self.lock:
+                        self.created -= 1
+                    raise
+            else:
+                connection = self.connections.get()
+        try:
+            yield connection
+        finally:
+            self.connections.put(connection)
+
+
+class BotDatabase:
+    """
+    Взаимодействие с базой данных. Все объекты с одинаковым name_db в одном процессе используют общий пул соединений.
+    """
+
+    pools = {}
+    pools_lock = threading.Lock()
+
+    def __init__(self, name_db: str = 'bot.db'):
+        self.name_db = name_db
+        self.pool = self.get_pool()
+
+    def get_pool(self) -> ConnectionPool:
+        """
+        Получение пула соединений. Пул создается при первом обращении в процессе, вместе с ним создаются таблицы.
+
+        Returns
+        -------
+        ConnectionPool
+            Пул соединений с базой данных.
         """
-        listdir = os.listdir()
-        if self.name_db in listdir:
-            try:
-                return sqlite3.connect(self.name_db)
-            except sqlite3.Error as error:
-                print("Ошибка при подключении к sqlite:", error)
-        else:
-            return self.gen_database()
+
+        with BotDatabase.pools_lock:
+            pool = BotDatabase.pools.get(self.name_db)
+            if pool is None or pool.pid != os.getpid():
+                # Соединения SQLite нельзя использовать после fork, поэтому в новом процессе создается свой пул
+                pool = ConnectionPool(self.name_db)
+                BotDatabase.pools[self.name_db] = pool
+            return pool
 
     def select(self, query: str, input_value: Optional[tuple] = None) -> Any:
         """
@@ -71,20 +148,12 @@ class BotDatabase:
         """
 
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            if input_value:
-                cursor.execute(query, input_value)
-            else:
-                cursor.execute(query)
-            return cursor.fetchone()
+            with self.pool.connection() as connection:
+                return connection.execute(query, input_value or ()).fetchone()
         except sqlite3.Error as error:
             print("Ошибка при SELECT запросе:", error)
-        finally:
-            if connection:
-                connection.close()
 
-    def insert(self, query: str, input_value: tuple):
+    def insert(self, query: str, input_value: tuple) -> Optional[int]:
         """
         Исполнение INSERT-запроса к базе данных.
 
@@ -94,18 +163,18 @@ class BotDatabase:
             SELECT-запрос в виде строки.
         input_value : tuple
             Данные в виде кортежа, которые подставляются в запрос.
+
+        Returns
+        -------
+        Optional[int]
+            Количество добавленных строк или None, если запрос завершился ошибкой.
         """
 
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(query, input_value)
-            connection.commit()
+            with self.pool.connection() as connection, connection:
+                return connection.execute(query, input_value).rowcount
         except sqlite3.Error as error:
             print("Ошибка при INSERT запросе:", error)
-        finally:
-            if connection:
-                connection.close()
 
     def update(self, query: str, input_value: tuple):
         """
@@ -120,12 +189,42 @@ class BotDatabase:
         """
 
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(query, input_value)
-            connection.commit()
+            with self.pool.connection() as connection, connection:
+                connection.execute(query, input_value)
         except sqlite3.Error as error:
             print("Ошибка при UPDATE запросе", error)
-        finally:
-            if connection:
-                connection.close()
+
+    def delete(self, query: str, input_value: tuple):
+        """
+        Исполнение DELETE-запроса к базе данных.
+
+        Parameters
+        ----------
+        query : str
+            DELETE-запрос в виде строки.
+        input_value : tuple
+            Данные в виде кортежа, которые подставляются в запрос.
+        """
+
+        try:
+            with self.pool.connection() as connection, connection:
+                connection.execute(query, input_value)
+        except sqlite3.Error as error:
+            print("Ошибка при DELETE запросе", error)
+
+    def transaction(self, queries: List[tuple]):
+        """
+        Исполнение нескольких изменяющих запросов одной транзакцией.
+
+        Parameters
+        ----------
+        queries : List[tuple]
+            Список пар из запроса в виде строки и кортежа с данными, которые подставляются в запрос.
+        """
+
+        try:
+            with self.pool.connection() as connection, connection:
+                for query, input_value in queries:
+                    connection.execute(query, input_value)
+        except sqlite3.Error as error:
+            print("Ошибка при исполнении транзакции:", error)
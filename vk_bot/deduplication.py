@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from vk_bot.database import BotDatabase
+from vk_bot.sql_queries import Insert, Delete
+
+
+class EventDeduplicator:
+    """
+    Отсеивание повторных доставок одного и того же события от VK. VK повторяет запрос, если не получил ответ
+    вовремя, поэтому одно сообщение может прийти несколько раз.
+
+    Идентификаторы событий хранятся в памяти в течение ttl секунд. Если передан db, то они дополнительно
+    записываются в базу данных, чтобы повторы отсеивались и между разными процессами сервера.
+
+    Parameters
+    ----------
+    ttl : float
+        Время хранения идентификатора события в секундах.
+    db : Optional[BotDatabase]
+        Объект для работы с базой данных.
+    cleanup_interval : float
+        Как часто удалять устаревшие события из базы данных, в секундах.
+    """
+
+    def __init__(self, ttl: float = 600, db: Optional[BotDatabase] = None, cleanup_interval: float = 60):
+        self.ttl = ttl
+        self.db = db
+        self.cleanup_interval = cleanup_interval
+        self.last_cleanup = 0.0
+        self.events = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_event_id(data: dict) -> str:
+        """
+        Получение идентификатора события. Если VK не прислал event_id, то используется id сообщения.
+
+        Parameters
+        ----------
+        data : dict
+            Данные из запроса сервера.
+
+        Returns
+        -------
+        str
+            Идентификатор события.
+        """
+
+        if 'event_id' in data:
+            return data['event_id']
+        message = data['object']['message']
+        return f"{message['from_id']}:{message.get('id') or message.get('conversation_message_id')}"
+
+    def is_duplicate(self, data: dict) -> bool:
+        """
+        Проверка, приходило ли уже это событие. Событие запоминается при первой проверке.
+
+        Parameters
+        ----------
+        data : dict
+            Данные из запроса сервера.
+
+        Returns
+        -------
+        bool
+            True, если событие уже обрабатывалось, иначе False.
+        """
+
+        event_id = self.get_event_id(data)
+        now = time.monotonic()
+        with self.lock:
+            while self.events and next(iter(self.events.values())) < now - self.ttl:
+                self.events.popitem(last=False)
+            if event_id in self.events:
+                return True
+            self.events[event_id] = now
+
+        if self.db is None:
+            return False
+        return not self.save(event_id)
+
+    def save(self, event_id: str) -> bool:
+        """
+        Запись события в базу данных и периодическое удаление устаревших событий.
+
+        Parameters
+        ----------
+        event_id : str
+            Идентификатор события.
+
+        Returns
+        -------
+        bool
+            True, если событие записано впервые, иначе False.
+        """
+
+        now = time.time()
+        if now - self.last_cleanup > self.cleanup_interval:
+            self.last_cleanup = now
+            self.db.delete(Delete.EVENTS_EXPIRED, (now - self.ttl,))
+        return self.db.insert(Insert.EVENTS, (event_id, now)) != 0
@@ -0,0 +1,104 @@
+import multiprocessing
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+from vk_bot.main_handler import MainHandler
+
+
+def process_message(data: dict):
+    """
+    Обработка одного сообщения в процессе-обработчике. Ответ пользователю отправляется через VK.send_message.
+
+    Parameters
+    ----------
+    data : dict
+        Данные из запроса сервера.
+    """
+
+    MainHandler(data).process()
+
+
+def warm_up():
+    """
+    Пустая задача, чтобы процесс-обработчик запустился и импортировал модули решателя заранее.
+    """
+
+
+def report_error(future: Future):
+    """
+    Вывод ошибки, с которой завершилась задача.
+
+    Parameters
+    ----------
+    future : Future
+        Завершенная задача.
+    """
+
+    error = future.exception()
+    if error is not None:
+        print('Ошибка при обработке сообщения:')
+        traceback.print_exception(type(error), error, error.__traceback__)
+
+
+class JobQueue:
+    """
+    Очередь обработки сообщений в отдельных процессах, чтобы вебхук отвечал VK сразу.
+
+    У каждого процесса своя очередь, а сообщения одного пользователя всегда попадают в один процесс, поэтому
+    они обрабатываются строго по порядку. Если workers равно нулю, сообщения обрабатываются синхронно.
+
+    Parameters
+    ----------
+    workers : int
+        Количество процессов-обработчиков.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.context = multiprocessing.get_context('spawn')
+        self.executors: List[ProcessPoolExecutor] = [self.create_executor() for _ in range(workers)]
+
+    def create_executor(self) -> ProcessPoolExecutor:
+        """
+        Создание процесса-обработчика с собственной очередью задач.
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            Пул из одного процесса.
+        """
+
+        return ProcessPoolExecutor(max_workers=1, mp_context=self.context)
+
+    def start(self):
+        """
+        Запуск процессов-обработчиков до прихода первого сообщения.
+        """
+
+        for executor in self.executors:
+            executor.submit(warm_up)
+
+    def submit(self, data: dict):
+        """
+        Постановка сообщения в очередь.
+
+        Parameters
+        ----------
+        data : dict
+            Данные из запроса сервера.
+        """
+
+        if not self.workers:
+            process_message(data)
+            return
+
+        index = data['object']['message']['from_id'] % self.workers
+        try:
+            future = self.executors[index].submit(process_message, data)
+        except BrokenProcessPool:
+            # Процесс-обработчик упал (например, из-за нехватки памяти), запускаем новый
+            self.executors[index] = self.create_executor()
+            future = self.executors[index].submit(process_message, data)
+        future.add_done_callback(report_error)
@@ -1,5 +1,6 @@
 from vk_bot.answerer.task_manager import TaskManager
 from vk_bot.database import BotDatabase
+from vk_bot.session import Session
 from vk_bot.user import User
 from vk_bot.vk import VK
 
@@ -50,11 +51,13 @@ class MainHandler:
 
         print('Получено новое сообщение!')
         print(f'{self.user_id}: {self.text}')
-        vk = VK()
+        vk = VK.instance()
         db = BotDatabase()
-        user = User(vk.vk_api_method, db, self.user_id)
+        session = Session(db, self.user_id)
+        user = User(vk.vk_api_method, db, self.user_id, session)
         tm = TaskManager(vk.vk_api_method, db, user)
         reply = tm.manage(self.text)
+        session.flush()
         message = reply.get_message()
         vk.send_message(message)
         print('Сообщение успешно обработано!')
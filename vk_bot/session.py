@@ -0,0 +1,121 @@
+from typing import Any
+
+from vk_bot.database import BotDatabase
+from vk_bot.sql_queries import Select, Insert, Update
+
+
+class Session:
+    """
+    Состояние пользователя на время обработки одного сообщения. Строки пользователя из таблиц users и extremes
+    загружаются одним запросом, изменения копятся в памяти и записываются одной транзакцией в методе flush.
+
+    Parameters
+    ----------
+    db : BotDatabase
+        Объект для работы с базой данных.
+    user_id : int
+        id пользователя, от которого пришло сообщение.
+    """
+
+    USERS_FIELDS = ('status',)
+    EXTREMES_FIELDS = ('step', 'type', 'vars', 'func', 'interval_x', 'interval_y', 'g_func', 'restr')
+    UPDATES = {'status': Update.USERS_STATUS,
+               'step': Update.EXTREMES_STEP,
+               'type': Update.EXTREMES_TYPE,
+               'vars': Update.EXTREMES_VARS,
+               'func': Update.EXTREMES_FUNC,
+               'interval_x': Update.EXTREMES_INTERVAL_X,
+               'interval_y': Update.EXTREMES_INTERVAL_Y,
+               'g_func': Update.EXTREMES_G_FUNC,
+               'restr': Update.EXTREMES_RESTR}
+
+    def __init__(self, db: BotDatabase, user_id: int):
+        self.db = db
+        self.user_id = user_id
+        self.user_exists = False
+        self.extremes_exists = False
+        self.fields = dict.fromkeys(self.USERS_FIELDS + self.EXTREMES_FIELDS)
+        self.inserts = []
+        self.dirty = {}
+        self.load()
+
+    def load(self):
+        """
+        Загрузка состояния пользователя из базы данных.
+        """
+
+        row = self.db.select(Select.SESSION, (self.user_id,))
+        if not row:
+            return
+        users_id, extremes_id, *values = row
+        self.user_exists = users_id is not None
+        self.extremes_exists = extremes_id is not None
+        self.fields.update(zip(self.USERS_FIELDS + self.EXTREMES_FIELDS, values))
+
+    def get(self, field: str) -> Any:
+        """
+        Получение значения поля.
+
+        Parameters
+        ----------
+        field : str
+            Название столбца из таблиц users или extremes.
+
+        Returns
+        -------
+        Any
+            Значение поля с учетом еще не записанных изменений.
+        """
+
+        return self.fields[field]
+
+    def set(self, field: str, value: Any):
+        """
+        Изменение значения поля. В базу данных изменение попадет при вызове flush.
+
+        Parameters
+        ----------
+        field : str
+            Название столбца из таблиц users или extremes.
+        value : Any
+            Новое значение.
+        """
+
+        self.fields[field] = value
+        self.dirty[field] = value
+
+    def register_user(self, first_name: str, last_name: str):
+        """
+        Регистрация пользователя в таблице users.
+
+        Parameters
+        ----------
+        first_name : str
+            Имя пользователя.
+        last_name : str
+            Фамилия пользователя.
+        """
+
+        self.inserts.append((Insert.USERS, (self.user_id, first_name, last_name)))
+        self.user_exists = True
+        self.fields['status'] = 'start'
+
+    def register_extremes(self):
+        """
+        Регистрация пользователя в таблице extremes.
+        """
+
+        self.inserts.append((Insert.EXTREMES, (self.user_id,)))
+        self.extremes_exists = True
+        self.fields['step'] = 'start'
+
+    def flush(self):
+        """
+        Запись всех накопленных изменений в базу данных одной транзакцией.
+        """
+
+        queries = self.inserts + [(self.UPDATES[field], (value, self.user_id)) for field, value in self.dirty.items()]
+        if queries:
+            self.db.transaction(queries)
+        self.inserts = []
+        self.dirty = {}
@@ -5,13 +5,13 @@ class Create(NamedTuple):
     """
     Запросы на создание таблиц в базе данных.
     """
-    USERS = ("CREATE TABLE users (\n"
+    USERS = ("CREATE TABLE IF NOT EXISTS users (\n"
              "               user_id INTEGER PRIMARY KEY, \n"
              "               first_name TEXT NOT NULL, \n"
              "               last_name TEXT NOT NULL, \n"
              "               status TEXT DEFAULT 'start')")
 
-    EXTREMES = ("CREATE TABLE extremes (\n"
+    EXTREMES = ("CREATE TABLE IF NOT EXISTS extremes (\n"
                 "                  user_id INTEGER PRIMARY KEY, \n"
                 "                  step TEXT DEFAULT 'start',\n"
                 "                  type TEXT,\n"
@@ -23,6 +23,19 @@ class Create(NamedTuple):
                 "                  restr INTEGER, \n"
                 "                  FOREIGN KEY(user_id) REFERENCES users(user_id))")
 
+    EVENTS = ("CREATE TABLE IF NOT EXISTS events (\n"
+              "                event_id TEXT PRIMARY KEY, \n"
+              "                created REAL NOT NULL)")
+
+
+class Pragma(NamedTuple):
+    """
+    Настройки соединения с базой данных.
+    """
+
+    JOURNAL_MODE = "PRAGMA journal_mode = WAL"
+    SYNCHRONOUS = "PRAGMA synchronous = NORMAL"
+
 
 class Insert(NamedTuple):
     """
@@ -31,6 +44,7 @@ class Insert(NamedTuple):
 
     USERS = "INSERT INTO users(user_id, first_name, last_name) VALUES (?, ?, ?)"
     EXTREMES = "INSERT INTO extremes(user_id) VALUES (?)"
+    EVENTS = "INSERT OR IGNORE INTO events(event_id, created) VALUES (?, ?)"
 
 
 class Select(NamedTuple):
@@ -38,18 +52,11 @@ class Select(NamedTuple):
     Запросы на извлечение полей из таблицы базы данных.
     """
 
-    USERS_USER_ID = "SELECT user_id FROM users WHERE user_id = ?"
-    USERS_STATUS = "SELECT status FROM users WHERE user_id = ?"
-
-    EXTREMES_STEP = "SELECT step FROM extremes WHERE user_id = ?"
-    EXTREMES_RESTR = "SELECT restr FROM extremes WHERE user_id = ?"
-    EXTREMES_VARS = "SELECT vars FROM extremes WHERE user_id = ?"
-    EXTREMES_TYPE = "SELECT type FROM extremes WHERE user_id = ?"
-    EXTREMES_ALL = "SELECT vars, func, g_func, restr, interval_x, interval_y FROM extremes WHERE user_id = ?"
-    EXTREMES_WITH_INT = "SELECT vars, func, interval_x, interval_y FROM extremes WHERE user_id = ?"
-    EXTREMES_WITHOUT_INT = "SELECT vars, func FROM extremes WHERE user_id = ?"
-    EXTREMES_RESTR_WITH_INT = "SELECT vars, func, g_func, interval_x, interval_y FROM extremes WHERE user_id = ?"
-    EXTREMES_RESTR_WITHOUT_INT = "SELECT vars, func, g_func FROM extremes WHERE user_id = ? "
+    SESSION = ("SELECT users.user_id, extremes.user_id, users.status, \n"
+               "       extremes.step, extremes.type, extremes.vars, extremes.func, \n"
+               "       extremes.interval_x, extremes.interval_y, extremes.g_func, extremes.restr \n"
+               "FROM users LEFT JOIN extremes ON extremes.user_id = users.user_id \n"
+               "WHERE users.user_id = ?")
 
 
 class Update(NamedTuple):
@@ -68,3 +75,10 @@ class Update(NamedTuple):
     EXTREMES_INTERVAL_X = "UPDATE extremes SET interval_x = ? WHERE user_id = ?"
     EXTREMES_INTERVAL_Y = "UPDATE extremes SET interval_y = ? WHERE user_id = ?"
 
+
+class Delete(NamedTuple):
+    """
+    Запросы на удаление строк из таблиц базы данных.
+    """
+
+    EVENTS_EXPIRED = "DELETE FROM events WHERE created < ?"
@@ -1,7 +1,7 @@
 from vk_api.vk_api import VkApiMethod
 
-from vk_bot.sql_queries import Select, Insert, Update
 from .database import BotDatabase
+from .session import Session
 
 
 class User:
@@ -17,12 +17,15 @@ class User:
         Объект для работы с базой данных.
     user_id: int
         id пользователя, от которого пришло сообщение
+    session: Session
+        Состояние пользователя, загруженное из базы данных.
     """
 
-    def __init__(self, vk_api_method: VkApiMethod, db: BotDatabase, user_id: int):
+    def __init__(self, vk_api_method: VkApiMethod, db: BotDatabase, user_id: int, session: Session):
         self.vk_api_method = vk_api_method
         self.db = db
         self.user_id = user_id
+        self.session = session
 
     def authorization(self) -> str:
         """
@@ -35,16 +38,16 @@ class User:
             Статус пользователя в общении с ботом.
         """
 
-        if not self.db.select(Select.USERS_USER_ID, (self.user_id,)):
+        if not self.session.user_exists:
             self.registration()
-        return self.db.select(Select.USERS_STATUS, (self.user_id,))[0]
+        return self.session.get('status')
 
     def registration(self):
         """
         Регистрация пользователя в базе данных в таблице users.
         """
 
-        self.db.insert(Insert.USERS, (self.user_id, self.get_first_name(), self.get_last_name()))
+        self.session.register_user(self.get_first_name(), self.get_last_name())
 
     def update_status(self, status: str):
         """
@@ -56,7 +59,7 @@ class User:
             Статус пользователя в общении с ботом.
         """
 
-        self.db.update(Update.USERS_STATUS, (status, self.user_id))
+        self.session.set('status', status)
 
     def get_first_name(self) -> str:
         """
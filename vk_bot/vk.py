@@ -1,5 +1,11 @@
+import os
+import threading
+
+import requests
 import vk_api
+from requests.adapters import HTTPAdapter
 from vk_api.longpoll import VkLongPoll
+from vk_api.vk_api import DEFAULT_USERAGENT
 
 from .config import ACCESS_TOKEN, GROUP_ID, API_VERSION
 
@@ -7,14 +13,60 @@ from .config import ACCESS_TOKEN, GROUP_ID, API_VERSION
 class VK:
     """
     Соединение с VK, создание объекта для работы с longpoll-сервером и получение методов API.
+
+    Объект создается один раз на процесс методом VK.instance(). HTTP-соединения с API переиспользуются
+    (keep-alive), а longpoll-сервер запрашивается только при первом обращении к атрибуту longpoll.
     """
 
+    pool_size = 16
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
     def __init__(self):
+        http = requests.Session()
+        http.headers['User-agent'] = DEFAULT_USERAGENT
+        http.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+
+        self.pid = os.getpid()
         self.vk_session = vk_api.VkApi(token=ACCESS_TOKEN,
-                                       api_version=API_VERSION)
-        self.longpoll = VkLongPoll(self.vk_session,
-                                   group_id=GROUP_ID)
+                                       api_version=API_VERSION,
+                                       session=http)
         self.vk_api_method = self.vk_session.get_api()
+        self._longpoll = None
+
+    @classmethod
+    def instance(cls) -> 'VK':
+        """
+        Получение общего для процесса объекта VK. В новом процессе (после fork) создается свой объект,
+        чтобы не делить HTTP-соединения с родителем.
+
+        Returns
+        -------
+        VK
+            Объект для работы с API VK.
+        """
+
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance.pid != os.getpid():
+                cls._instance = cls()
+            return cls._instance
+
+    @property
+    def longpoll(self) -> VkLongPoll:
+        """
+        Объект для работы с longpoll-сервером. Создается при первом обращении.
+
+        Returns
+        -------
+        VkLongPoll
+            Объект для получения событий с longpoll-сервера.
+        """
+
+        if self._longpoll is None:
+            self._longpoll = VkLongPoll(self.vk_session,
+                                        group_id=GROUP_ID)
+        return self._longpoll
 
     def send_message(self, parameters: dict):
         """